@@ -4,158 +4,718 @@ Uses the Nexus Connector with Together AI for Llama models
 """
 
 import os
+import re
+import json
+import asyncio
+import logging
+import math
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
 from dotenv import load_dotenv
 from nexus import NexusConnector, AIProvider
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 load_dotenv()
 
+_log = logging.getLogger("racing.ai")
+
+# First flat JSON object that carries an "action" field
+_DECISION_JSON_RE = re.compile(r'\{[^{}]*"action"[^{}]*\}')
+# Candidate action names in an upper-cased reply (USE_POWERUP keeps its underscore)
+_ACTION_WORD_RE = re.compile(r"[A-Z_]+")
+# Words models reply with in place of the action they mean
+_ACTION_SYNONYMS = {"PASS": "OVERTAKE", "SAVE": "CONSERVE", "SHOOT": "FIRE"}
+
+# Any OpenAI-compatible endpoint works, e.g. a local vLLM or Ollama server
+TOGETHER_BASE_URL = os.getenv("RACING_AI_BASE_URL", "https://api.together.xyz/v1")
+
+# Cap on in-flight Together AI requests (shared by every driver, since they share one API key)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("RACING_AI_MAX_CONCURRENCY", "8"))
+_request_slots = weakref.WeakKeyDictionary()  # event loop -> Semaphore
+_http_clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+
+# Small model that handles routine per-tick decisions; high-stakes ticks go to
+# the driver's own model. Set RACING_AI_ROUTINE_MODEL= (empty) to disable routing.
+ROUTINE_MODEL = os.getenv("RACING_AI_ROUTINE_MODEL", "meta-llama/Llama-3.2-3B-Instruct-Turbo")
+
+# Ask for JSON decisions with reasoning instead of a single action letter
+VERBOSE_REASONING = os.getenv("VERBOSE_REASONING") == "1"
+
+
+def set_max_concurrency(limit: int):
+    """Change the cap on concurrent LLM requests (applies to new event loops)"""
+    global MAX_CONCURRENT_REQUESTS
+    MAX_CONCURRENT_REQUESTS = max(1, int(limit))
+    _request_slots.clear()
+
+
+def _request_slot() -> asyncio.Semaphore:
+    """Get the request semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    slot = _request_slots.get(loop)
+    if slot is None:
+        slot = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _request_slots[loop] = slot
+    return slot
+
+
+def _http_client() -> "httpx.AsyncClient":
+    """Get the pooled Together AI client for the running event loop.
+    
+    One keep-alive (HTTP/2 when h2 is installed) client per loop lets every
+    driver's in-flight decision share a connection instead of re-handshaking.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        options = dict(
+            base_url=TOGETHER_BASE_URL,
+            headers={"Authorization": f"Bearer {os.getenv('TOGETHER_API_KEY')}"},
+            timeout=30,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64)
+        )
+        try:
+            client = httpx.AsyncClient(http2=True, **options)
+        except ImportError:  # h2 not installed - HTTP/1.1 keep-alive still helps
+            client = httpx.AsyncClient(**options)
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's pooled client; call once the race is over"""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _stream_json_reply(payload: dict) -> str:
+    """Stream a chat completion, stopping once the first {...} object is balanced.
+    
+    Leaving the stream early closes the connection, which also tells the
+    server to stop generating tokens nobody will read.
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    parts = []
+    depth = 0
+    async with _http_client().stream("POST", "/chat/completions", json=payload) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            choices = loads(data).get("choices")
+            text = (choices[0].get("delta", {}).get("content") or "") if choices else ""
+            parts.append(text)
+            for char in text:
+                if char == '{':
+                    depth += 1
+                elif char == '}' and depth:
+                    depth -= 1
+                    if depth == 0:
+                        return "".join(parts)
+    return "".join(parts)
+
+
+async def warm_up_models(model_names) -> None:
+    """Send a one-token completion to each model concurrently.
+    
+    Serverless models can be cold; paying the load delay here keeps it off
+    the first in-race decision. Failures are ignored - it's only a warm-up.
+    """
+    if not (HTTPX_AVAILABLE and os.getenv("TOGETHER_API_KEY")):
+        return
+    
+    async def ping(model: str):
+        payload = {"model": model, "messages": [{"role": "user", "content": "ok"}], "max_tokens": 1}
+        async with _request_slot():
+            await _http_client().post("/chat/completions", json=payload)
+    
+    await asyncio.gather(*[ping(model) for model in dict.fromkeys(model_names)],
+                         return_exceptions=True)
+
+
+def _detect_unwrap(result) -> Callable[[Any], Optional[str]]:
+    """Pick the accessor that pulls the reply text out of a Nexus result of this shape"""
+    if hasattr(result, 'messages') and result.messages:
+        # The last assistant message
+        if hasattr(result.messages[-1], 'content'):
+            return lambda r: r.messages[-1].content
+        return lambda r: str(r.messages[-1])
+    if hasattr(result, 'output'):
+        return lambda r: r.output
+    if hasattr(result, 'content'):
+        return lambda r: r.content
+    return str
+
+
+def _parse_decision_json(response_text: str) -> Optional[dict]:
+    """Extract the decision object from a model response (None if there isn't one)"""
+    match = _DECISION_JSON_RE.search(response_text)
+    if match:
+        try:
+            return orjson.loads(match.group(0)) if ORJSON_AVAILABLE else json.loads(match.group(0))
+        except ValueError:
+            pass  # Fall back to the widest {...} span below
+    
+    start = response_text.find('{')
+    end = response_text.rfind('}') + 1
+    if start >= 0 and end > start:
+        return json.loads(response_text[start:end])
+    return None
+
+
+def _parse_action_letter(response_text: str, actions: dict) -> Optional[str]:
+    """Map a reply naming an action (or a synonym for one) or a bare action
+    letter to an action"""
+    text = response_text.strip().upper()
+    for word in _ACTION_WORD_RE.findall(text):
+        if word in actions.values():
+            return word
+        if word in _ACTION_SYNONYMS:
+            return _ACTION_SYNONYMS[word]
+    # A letter counts only on its own, not as the start of some other word
+    if len(text) == 1 or (text[:1].isalpha() and not text[1].isalpha()):
+        return actions.get(text[:1])
+    return None
+
+
+def _bucket(value, step: float):
+    """Round a numeric telemetry value to the nearest step (non-numbers pass through)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(value / step) * step
+    return value
+
+
+def _as_number(value, default: float = 0.0) -> float:
+    """Coerce a telemetry value to float (missing or non-numeric values become default)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return default
+
+
+# RaceStateFlat field -> (path of race_state sections, key, default). Defaults
+# double as the placeholders the prompt shows when telemetry is missing.
+_STATE_FIELDS = (
+    ("position", ("basic",), "position", "unknown"),
+    ("total_cars", ("basic",), "total_cars", 5),
+    ("current_lap", ("basic",), "current_lap", 1),
+    ("total_laps", ("basic",), "total_laps", 10),
+    ("gap_ahead", ("basic",), "gap_ahead", "unknown"),
+    ("gap_behind", ("basic",), "gap_behind", "unknown"),
+    ("track_segment", ("basic",), "track_segment", "mixed"),
+    ("weather", ("basic",), "weather", "clear"),
+    ("fuel_plan", ("fuel_strategy",), "strategy", "manage"),
+    ("can_finish", ("fuel_strategy",), "can_finish", True),
+    ("tire_wear", ("tire_prediction",), "degradation_level", "unknown"),
+    ("critical_lap", ("tire_prediction",), "critical_lap", "N/A"),
+    ("pit_recommended", ("pit_analysis",), "recommended", False),
+    ("pit_urgency", ("pit_analysis",), "urgency", "low"),
+    ("overtake_success", ("overtake_analysis",), "success_probability", 0),
+    ("overtake_risk", ("overtake_analysis",), "risk_level", 0),
+    ("weather_adaptation", ("weather_impact",), "adaptation_level", "medium"),
+    ("weather_speed", ("weather_impact",), "speed_factor", 1.0),
+    ("top_speed", ("performance_envelope", "speed_metrics"), "top_speed", "unknown"),
+    ("corner_speed", ("performance_envelope", "speed_metrics"), "corner_speed_90", "unknown"),
+    ("current_fuel", ("performance_envelope", "efficiency_metrics"), "current_fuel", "unknown"),
+    ("tire_condition", ("performance_envelope", "efficiency_metrics"), "tire_condition", "unknown"),
+    ("inventory", ("power_ups",), "inventory", []),
+    ("powerup_advice", ("power_ups", "strategy"), "recommendation", "none"),
+    ("powerup_item", ("power_ups", "strategy"), "item_name", "none"),
+    ("powerup_value", ("power_ups", "strategy"), "value", 0),
+    ("collision_level", ("collision_risk",), "risk_level", "none"),
+    ("collision_factor", ("collision_risk",), "risk_factor", 0),
+    ("nearby_cars", ("collision_risk",), "nearby_cars", 0),
+    ("ammo", ("weapons",), "ammo", 50),
+    ("can_fire", ("weapons",), "can_fire", False),
+    ("target_ahead", ("weapons",), "target_ahead", None),
+    ("target_distance", ("weapons",), "target_distance", 999),
+)
+
+
+@dataclass
+class RaceStateFlat:
+    """One driver's race state, flattened once per decision.
+    
+    The decision path (model routing, cache keys, prompt rendering) reads
+    these slots directly instead of walking the nested race_state dicts.
+    Fields hold whatever the telemetry provided, or the _STATE_FIELDS default;
+    numeric fields fall back to "unknown"/"N/A" so the prompt reads naturally.
+    """
+    __slots__ = tuple(name for name, _, _, _ in _STATE_FIELDS)
+    
+    position: Union[int, str]
+    total_cars: int
+    current_lap: int
+    total_laps: int
+    gap_ahead: Union[float, str]
+    gap_behind: Union[float, str]
+    track_segment: str
+    weather: str
+    fuel_plan: str
+    can_finish: bool
+    tire_wear: str
+    critical_lap: Union[float, str]
+    pit_recommended: bool
+    pit_urgency: str
+    overtake_success: float
+    overtake_risk: float
+    weather_adaptation: str
+    weather_speed: float
+    top_speed: Union[float, str]
+    corner_speed: Union[float, str]
+    current_fuel: Union[float, str]
+    tire_condition: Union[float, str]
+    inventory: list
+    powerup_advice: str
+    powerup_item: str
+    powerup_value: float
+    collision_level: str
+    collision_factor: float
+    nearby_cars: int
+    ammo: int
+    can_fire: bool
+    target_ahead: Optional[str]
+    target_distance: float
+    
+    @classmethod
+    def from_race_state(cls, race_state: dict) -> "RaceStateFlat":
+        """Flatten a nested race_state (as built by LLMDriver.make_decision)"""
+        values = []
+        for _, path, key, default in _STATE_FIELDS:
+            section = race_state
+            for part in path:
+                section = section.get(part, {})
+            values.append(section.get(key, default))
+        return cls(*values)
+
+
+class DecisionOutcome(NamedTuple):
+    """Bookkeeping a proposed decision applies once it is used.
+    
+    kind is "shortcut" (rule-based), "hit" (cache_key set for an exact-cache
+    hit, None for a semantic one) or "miss" (decision, if any, is stored under
+    cache_key and state_vector for scope = (personality, model)).
+    """
+    kind: str
+    cache_key: Optional[tuple] = None
+    state_vector: Optional[List[float]] = None
+    scope: Optional[tuple] = None
+    decision: Optional[dict] = None
+
+
 class RacingAI:
     """AI configuration for LLM-powered racing drivers"""
     
-    def __init__(self, model_name: str = "meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo"):
+    DECISION_CACHE_SIZE = 4096
+    IDLE_GAP = 200  # Metres to the nearest car beyond which nothing is happening
+    LOW_FUEL = 5  # Percent
+    SEMANTIC_CACHE_SIZE = 256  # Per personality
+    SEMANTIC_SIMILARITY = 0.995  # Cosine similarity needed to reuse a decision
+    
+    # The reply is ~4 short JSON fields; capping output tokens bounds generation time
+    DECISION_PARAMS = {
+        "max_tokens": 80,
+        "temperature": 0.3,
+        "response_format": {"type": "json_object"},
+        "stop": ["\n\n"]
+    }
+    
+    # Single-letter action codes. Each uppercase ASCII letter is one token in the
+    # Llama 3 / Qwen2 byte-level vocabularies (id = ord(letter) - 33), so the reply
+    # can be forced to exactly one of them with logit_bias and max_tokens=1
+    ACTION_LETTERS = {
+        "A": "ATTACK", "O": "OVERTAKE", "B": "BOOST",
+        "D": "DEFEND", "K": "BLOCK", "P": "PRESSURE", "H": "HOLD", "W": "WAIT",
+        "C": "CONSERVE", "U": "USE_POWERUP", "F": "FIRE"
+    }
+    LETTER_PARAMS = {
+        "max_tokens": 1,
+        "temperature": 0.7,
+        "logit_bias": {str(ord(letter) - 33): 100 for letter in ACTION_LETTERS}
+    }
+    
+    # Dynamic prompt tail, rendered from a RaceStateFlat (s) each tick. Only the
+    # sections that carry information this tick are sent (see _render_state)
+    RACE_SECTION = """RACE SITUATION:
+- Position: {s.position}/{s.total_cars}
+- Lap: {s.current_lap}/{s.total_laps}
+- Gap ahead: {s.gap_ahead}m | Gap behind: {s.gap_behind}m
+- Track: {s.track_segment} | Weather: {s.weather}"""
+    TELEMETRY_SECTION = """TELEMETRY ANALYSIS:
+Fuel Strategy: {s.fuel_plan} - Can finish: {s.can_finish}
+Tire Condition: {s.tire_wear} wear, critical lap {s.critical_lap}
+Overtake Opportunity: {s.overtake_success:.0%} success, {overtake_risk} risk"""
+    PIT_LINE = "Pit Recommendation: YES ({s.pit_urgency} urgency)"
+    WEATHER_LINE = "Weather Impact: {s.weather_adaptation} adaptation, {s.weather_speed:.0%} speed"
+    PERFORMANCE_SECTION = """PERFORMANCE ENVELOPE:
+Top Speed: {s.top_speed} km/h
+Corner Speed: {s.corner_speed} km/h (hard corners)
+Current Fuel: {s.current_fuel}%
+Tire Condition: {s.tire_condition}%"""
+    POWER_UP_SECTION = """MARIO KART POWER-UPS:
+Inventory: {s.inventory}
+Strategy Recommendation: {s.powerup_advice}
+Best Item: {s.powerup_item}
+Strategy Value: {s.powerup_value:.0%}"""
+    COLLISION_SECTION = """COLLISION RISK:
+Risk Level: {collision_level}
+Risk Factor: {s.collision_factor:.0%}
+Nearby Cars: {s.nearby_cars}"""
+    WEAPONS_SECTION = """WEAPONS SYSTEM:
+Machine Gun Ammo: {s.ammo}/50 rounds
+Can Fire: {can_fire}
+Target Ahead: {s.target_ahead}
+Target Distance: {s.target_distance}m"""
+    
+    def __init__(self, model_name: str = "meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo",
+                 personality: Optional[str] = None):
         """Initialize with specific Together AI model"""
         self.model_name = model_name
-        self.agent = NexusConnector(
+        self.routine_model = ROUTINE_MODEL or model_name
+        
+        # One connector per model we may route to, built once up front
+        self._agents = {
+            model: self._create_agent(model)
+            for model in dict.fromkeys([model_name, self.routine_model])
+        }
+        self.agent = self._agents[model_name]
+        
+        # Per-tick decisions go straight to the chat completions endpoint when
+        # httpx is available; Nexus still handles commentary
+        self.use_direct_http = HTTPX_AVAILABLE and bool(os.getenv("TOGETHER_API_KEY"))
+        self.verbose_reasoning = VERBOSE_REASONING
+        self._unwrap = None  # TaskResult -> reply text, set on the first Nexus reply
+        
+        # Static prompt prefix per personality (personality is fixed per driver)
+        self._prefix_cache = {}
+        if personality is not None:
+            self._static_prefix(personality)
+        
+        # Decisions for recently seen (quantized) race states
+        self._decision_cache = OrderedDict()
+        # Fallback for states one bucket away: (vector, norm, decision) per (personality, model)
+        self._semantic_cache = {}
+        self.cache_enabled = os.getenv("RACING_AI_CACHE_DISABLE") != "1"
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.shortcut_decisions = 0
+    
+    def reset_stats(self):
+        """Zero the decision counters (the decision caches are kept)"""
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.shortcut_decisions = 0
+    
+    def model_names(self) -> List[str]:
+        """Every model this driver may route a request to"""
+        return list(self._agents)
+    
+    async def warmup(self):
+        """Warm every model this driver uses before the race starts"""
+        await warm_up_models(self.model_names())
+    
+    @staticmethod
+    def _create_agent(model_name: str) -> NexusConnector:
+        """Create a Nexus connector for a Together AI model"""
+        return NexusConnector(
             provider=AIProvider.OPENAI,
             api_key=os.getenv("TOGETHER_API_KEY"),
             model=model_name,
-            base_url="https://api.together.xyz/v1",  # Together AI OpenAI-compatible endpoint
+            base_url=TOGETHER_BASE_URL,  # Together AI OpenAI-compatible endpoint
             workspace="./ai_racing_output",
             auto_execute=False,  # We just want responses, not file execution
             max_iterations=1,    # Single response per decision
             verbose=False        # Keep racing output clean
         )
     
-    async def make_racing_decision(self, race_state: dict, personality: str) -> dict:
-        """Make a racing decision based on comprehensive race state"""
-        
-        # Extract rich telemetry data
-        basic_state = race_state.get('basic', {})
-        pit_analysis = race_state.get('pit_analysis', {})
-        overtake_analysis = race_state.get('overtake_analysis', {})
-        tire_prediction = race_state.get('tire_prediction', {})
-        fuel_strategy = race_state.get('fuel_strategy', {})
-        weather_impact = race_state.get('weather_impact', {})
-        performance = race_state.get('performance_envelope', {})
-        power_ups = race_state.get('power_ups', {})
-        collision_risk = race_state.get('collision_risk', {})
-        weapons = race_state.get('weapons', {})
+    def route_model(self, state: RaceStateFlat) -> str:
+        """Pick the model for a decision: the driver's own model for high-stakes
+        ticks (urgent pit call, target in gun range, collision risk), otherwise
+        the small routine model"""
+        if (state.pit_urgency == 'high'
+                or (state.can_fire and state.target_ahead)
+                or state.collision_level == 'high'):
+            return self.model_name
+        return self.routine_model
+    
+    def _static_prefix(self, personality: str) -> str:
+        """Prompt text that never changes for a personality.
         
-        prompt = f"""You are an AI racing driver with this personality: {personality}
-
-RACE SITUATION:
-- Position: {basic_state.get('position', 'unknown')}/{basic_state.get('total_cars', 5)}
-- Lap: {basic_state.get('current_lap', 1)}/{basic_state.get('total_laps', 10)}
-- Gap ahead: {basic_state.get('gap_ahead', 'unknown')}m | Gap behind: {basic_state.get('gap_behind', 'unknown')}m
-- Track: {basic_state.get('track_segment', 'mixed')} | Weather: {basic_state.get('weather', 'clear')}
-
-TELEMETRY ANALYSIS:
-Fuel Strategy: {fuel_strategy.get('strategy', 'manage')} - Can finish: {fuel_strategy.get('can_finish', True)}
-Tire Condition: {tire_prediction.get('degradation_level', 'unknown')} wear, critical lap {tire_prediction.get('critical_lap', 'N/A')}
-Pit Recommendation: {"YES" if pit_analysis.get('recommended', False) else "NO"} ({pit_analysis.get('urgency', 'low')} urgency)
-Overtake Opportunity: {overtake_analysis.get('success_probability', 0)*100:.0f}% success, {"HIGH" if overtake_analysis.get('risk_level', 0) > 1 else "LOW"} risk
-Weather Impact: {weather_impact.get('adaptation_level', 'medium')} adaptation, {weather_impact.get('speed_factor', 1.0)*100:.0f}% speed
-
-PERFORMANCE ENVELOPE:
-Top Speed: {performance.get('speed_metrics', {}).get('top_speed', 'unknown')} km/h
-Corner Speed: {performance.get('speed_metrics', {}).get('corner_speed_90', 'unknown')} km/h (hard corners)
-Current Fuel: {performance.get('efficiency_metrics', {}).get('current_fuel', 'unknown')}%
-Tire Condition: {performance.get('efficiency_metrics', {}).get('tire_condition', 'unknown')}%
-
-MARIO KART POWER-UPS:
-Inventory: {power_ups.get('inventory', [])}
-Strategy Recommendation: {power_ups.get('strategy', {}).get('recommendation', 'none')} 
-Best Item: {power_ups.get('strategy', {}).get('item_name', 'none')}
-Strategy Value: {power_ups.get('strategy', {}).get('value', 0)*100:.0f}%
-
-COLLISION RISK:
-Risk Level: {collision_risk.get('risk_level', 'none').upper()}
-Risk Factor: {collision_risk.get('risk_factor', 0)*100:.0f}%
-Nearby Cars: {collision_risk.get('nearby_cars', 0)}
-WEAPONS SYSTEM:
-Machine Gun Ammo: {weapons.get('ammo', 50)}/50 rounds
-Can Fire: {"YES" if weapons.get('can_fire', False) else "NO"}
-Target Ahead: {weapons.get('target_ahead', 'None')}
-Target Distance: {weapons.get('target_distance', 999)}m
-⚠️ IMPORTANT: Use FIRE or SHOOT action when you have a target within 200m!
-
-EXAMPLE: If Target Ahead is "Llama Speed" at 150m and you Can Fire: YES, then use action: "FIRE"
-
-STRATEGIC OPTIONS:
-- ATTACK: Aggressive overtake (uses extra fuel/tires, high risk/reward)
-- DEFEND: Block passing attempts (moderate energy, positional)
-- CONSERVE: Save fuel/tires for late race (slow but sustainable)
-- PRESSURE: Apply psychological pressure (slight energy cost, strategic)
-- WAIT: Patient approach (minimal energy, opportunity-based)
-- USE_POWERUP: Use your best power-up item strategically
-- OVERTAKE: Pure overtaking move (high speed, high fuel cost)
-- PASS: Clean passing maneuver (aggressive speed boost)
-- BLOCK: Defensive blocking (slower speed)
-- BOOST: Maximum speed boost (highest fuel consumption)
-- HOLD: Maintain position (neutral pace)
-- SAVE: Maximum conservation (slowest, saves fuel)
-- FIRE/SHOOT: Fire machine gun at target ahead (slows them by 15%, uses ammo)
-
-POWER-UP EFFECTS:
-🟢 Defensive: Shield (blocks attacks), Ghost (invincible), Banana (trap)
-🔴 Offensive: Lightning (slow leaders), Red Shell (hit ahead), Blue Shell (hit leader)
-⚡ Boost: Turbo (+30% speed), Nitro (+50% speed)
-🔧 Utility: Fuel Boost, Tire Repair, Radar (intel)
-
-Consider your personality, telemetry data, power-ups, and collision risk.
-
-Respond with ONLY a JSON object:
-{{
+        Kept byte-identical and at the front of every prompt so the provider
+        can reuse its KV/prompt cache for it; only the telemetry tail varies.
+        """
+        prefix = self._prefix_cache.get(personality)
+        if prefix is None:
+            prefix = f"""You are an AI racing driver with this personality: {personality}
+
+ACTIONS: ATTACK, OVERTAKE, PASS, BOOST (faster, more fuel/tire use) | DEFEND, BLOCK, PRESSURE, HOLD, WAIT (positional) | CONSERVE, SAVE (slow, saves fuel) | USE_POWERUP (use best item) | FIRE/SHOOT (machine gun: slows target ahead 15%, uses ammo)
+Use FIRE when Can Fire is YES and the target ahead is within 200m.
+
+{self._reply_format()}
+
+"""
+            self._prefix_cache[personality] = prefix
+        return prefix
+    
+    def _reply_format(self) -> str:
+        """Reply instructions: one action letter, or JSON when reasoning is wanted"""
+        if not self.verbose_reasoning:
+            letters = " ".join(f"{letter}={action}" for letter, action in self.ACTION_LETTERS.items())
+            return f"Reply with ONE letter: {letters}"
+        return """Respond with ONLY a JSON object:
+{
     "action": "YOUR_CHOSEN_ACTION",
     "confidence": 0.0-1.0,
-    "reasoning": "Strategy rationale (max 15 words)",
+    "reasoning": "Strategy rationale",
     "use_powerup": true/false
-}}"""
+}"""
+    
+    def _rule_shortcut(self, state: RaceStateFlat) -> Optional[dict]:
+        """Decision for states with only one sensible answer (None means ask the model)"""
+        if _as_number(state.current_fuel, 100) < self.LOW_FUEL and state.pit_recommended:
+            return {"action": "CONSERVE", "confidence": 0.8, "reasoning": "Low fuel, nursing it home"}
+        if (_as_number(state.gap_ahead) > self.IDLE_GAP and _as_number(state.gap_behind) > self.IDLE_GAP
+                and state.collision_level == "none" and not state.target_ahead and not state.inventory):
+            return {"action": "HOLD", "confidence": 0.6, "reasoning": "Nobody close, holding pace"}
+        return None
+    
+    def _render_state(self, state: RaceStateFlat) -> str:
+        """Telemetry part of the prompt, skipping sections with nothing to say
+        (no pit call, clear weather, empty inventory, no collision risk, no
+        target for the gun)"""
+        telemetry = self.TELEMETRY_SECTION.format(
+            s=state, overtake_risk="HIGH" if state.overtake_risk > 1 else "LOW"
+        )
+        if state.pit_recommended:
+            telemetry += "\n" + self.PIT_LINE.format(s=state)
+        if state.weather != "clear":
+            telemetry += "\n" + self.WEATHER_LINE.format(s=state)
+        
+        sections = [self.RACE_SECTION.format(s=state), telemetry, self.PERFORMANCE_SECTION.format(s=state)]
+        if state.inventory:
+            sections.append(self.POWER_UP_SECTION.format(s=state))
+        if state.collision_level != "none":
+            sections.append(self.COLLISION_SECTION.format(s=state, collision_level=state.collision_level.upper()))
+        if _as_number(state.ammo) > 0 and state.target_ahead:
+            sections.append(self.WEAPONS_SECTION.format(s=state, can_fire="YES" if state.can_fire else "NO"))
+        return "\n\n".join(sections)
+    
+    def _cache_key(self, state: RaceStateFlat, personality: str, model: str) -> tuple:
+        """Quantize the race state so ticks differing only by noise share a key"""
+        return (
+            model,
+            personality,
+            state.position,
+            state.current_lap,
+            _bucket(state.gap_ahead, 5),
+            _bucket(state.gap_behind, 5),
+            _bucket(state.current_fuel, 5),
+            _bucket(state.tire_condition, 5),
+            _bucket(state.overtake_success, 0.1),
+            state.can_fire,
+            state.target_ahead,
+            tuple(state.inventory)
+        )
+    
+    def _state_vector(self, state: RaceStateFlat) -> List[float]:
+        """Fixed-length, roughly unit-scaled numeric fingerprint of the race state"""
+        total_cars = max(1.0, _as_number(state.total_cars, 5))
+        total_laps = max(1.0, _as_number(state.total_laps, 10))
+        return [
+            _as_number(state.position) / total_cars,
+            _as_number(state.current_lap) / total_laps,
+            min(_as_number(state.gap_ahead, 200), 200) / 200,
+            min(_as_number(state.gap_behind, 200), 200) / 200,
+            _as_number(state.current_fuel) / 100,
+            _as_number(state.tire_condition) / 100,
+            _as_number(state.ammo) / 50,
+            min(_as_number(state.target_distance, 999), 999) / 999,
+            1.0 if state.can_fire else 0.0,
+            _as_number(state.collision_factor),
+            _as_number(state.overtake_success),
+            float(len(state.inventory))
+        ]
+    
+    def _semantic_lookup(self, vector: List[float], scope: Tuple[str, str]):
+        """Find the cached decision for the most similar state seen in the same
+        (personality, model) scope, if similar enough"""
+        entries = self._semantic_cache.get(scope)
+        norm = math.sqrt(sum(v * v for v in vector))
+        if not entries or norm == 0:
+            return None
+        
+        best_similarity, best_decision = 0.0, None
+        for cached_vector, cached_norm, decision in entries:
+            similarity = sum(a * b for a, b in zip(vector, cached_vector)) / (norm * cached_norm)
+            if similarity > best_similarity:
+                best_similarity, best_decision = similarity, decision
+        
+        if best_similarity >= self.SEMANTIC_SIMILARITY:
+            return best_decision
+        return None
+    
+    def _store_decision(self, key: tuple, decision: dict, vector: List[float],
+                        scope: Tuple[str, str]):
+        """Remember a decision, evicting the least recently used entry when full"""
+        self._decision_cache[key] = dict(decision)
+        if len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+        
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm > 0:
+            entries = self._semantic_cache.setdefault(
+                scope, deque(maxlen=self.SEMANTIC_CACHE_SIZE)
+            )
+            entries.append((vector, norm, dict(decision)))
+    
+    async def _execute(self, prompt: str, model: Optional[str] = None):
+        """Send a prompt to the model, respecting the concurrency cap"""
+        agent = self._agents[model] if model else self.agent
+        async with _request_slot():
+            return await agent.execute_task(prompt)
+    
+    async def _complete(self, prompt: str, model: Optional[str] = None) -> str:
+        """POST a single-message chat completion and return the reply text"""
+        payload = {
+            "model": model or self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            **(self.DECISION_PARAMS if self.verbose_reasoning else self.LETTER_PARAMS)
+        }
+        if self.verbose_reasoning:
+            # JSON replies are streamed so we can hang up as soon as the object closes
+            payload["stream"] = True
+            async with _request_slot():
+                return await _stream_json_reply(payload)
+        
+        async with _request_slot():
+            response = await _http_client().post("/chat/completions", json=payload)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+    
+    async def tick_decisions(self, states: List[dict], personalities: List[str]) -> List[dict]:
+        """Make decisions for several race states concurrently"""
+        return await asyncio.gather(*[
+            self.make_racing_decision(s, p) for s, p in zip(states, personalities)
+        ])
+    
+    async def make_racing_decision(self, race_state, personality: str) -> dict:
+        """Make a racing decision based on comprehensive race state
+        (a nested race_state dict or an already flattened RaceStateFlat)"""
+        decision, outcome = await self.propose_racing_decision(race_state, personality)
+        self.commit_decision(outcome)
+        return decision
+    
+    def commit_decision(self, outcome: Optional[DecisionOutcome]):
+        """Apply a proposed decision's counter and cache updates"""
+        if outcome is None:
+            return
+        if outcome.kind == "shortcut":
+            self.shortcut_decisions += 1
+        elif outcome.kind == "hit":
+            self.cache_hits += 1
+            if outcome.cache_key in self._decision_cache:
+                self._decision_cache.move_to_end(outcome.cache_key)
+        else:
+            self.cache_misses += 1
+            if outcome.decision is not None:
+                self._store_decision(outcome.cache_key, outcome.decision,
+                                     outcome.state_vector, outcome.scope)
+    
+    async def propose_racing_decision(self, race_state, personality: str):
+        """Decide like make_racing_decision, but leave the caches and counters alone.
+
+        Returns (decision, outcome); pass the outcome to commit_decision() once
+        the decision is actually used, so discarded (speculative) decisions
+        leave no trace in the stats or caches.
+        """
+        if isinstance(race_state, RaceStateFlat):
+            state = race_state
+        else:
+            state = RaceStateFlat.from_race_state(race_state)
+
+        shortcut = self._rule_shortcut(state)
+        if shortcut is not None:
+            return shortcut, DecisionOutcome("shortcut")
+
+        model = self.route_model(state)
+
+        # Reuse the decision for an equivalent state if we've already asked
+        miss = None
+        if self.cache_enabled:
+            cache_key = self._cache_key(state, personality, model)
+            cached = self._decision_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached), DecisionOutcome("hit", cache_key)
+
+            state_vector = self._state_vector(state)
+            cached = self._semantic_lookup(state_vector, (personality, model))
+            if cached is not None:
+                return dict(cached), DecisionOutcome("hit")
+            miss = DecisionOutcome("miss", cache_key, state_vector, (personality, model))
+
+        prompt = self._static_prefix(personality) + self._render_state(state)
 
         try:
-            result = await self.agent.execute_task(prompt)
-            
-            # Handle None result
-            if result is None:
-                return {
-                    "action": "WAIT",
-                    "confidence": 0.3,
-                    "reasoning": "No AI response"
-                }
-            
-            # Parse the response to extract the JSON
-            import json
-            
-            # Extract the actual content from TaskResult
-            response_text = None
-            if hasattr(result, 'messages') and result.messages:
-                # Get the last assistant message
+            if self.use_direct_http:
+                response_text = await self._complete(prompt, model)
+            else:
+                result = await self._execute(prompt, model)
+
+                # Handle None result
+                if result is None:
+                    return {
+                        "action": "WAIT",
+                        "confidence": 0.3,
+                        "reasoning": "No AI response"
+                    }, miss
+
+                # Extract the actual content from TaskResult (its shape is
+                # detected once, then reused until it stops fitting)
+                unwrap = self._unwrap or _detect_unwrap(result)
                 try:
-                    last_msg = result.messages[-1]
-                    response_text = last_msg.content if hasattr(last_msg, 'content') else str(last_msg)
+                    response_text = unwrap(result)
                 except (IndexError, AttributeError):
                     response_text = None
-            elif hasattr(result, 'output'):
-                response_text = result.output
-            elif hasattr(result, 'content'):
-                response_text = result.content
-            else:
-                response_text = str(result)
-            
+                if response_text is None:
+                    unwrap = _detect_unwrap(result)
+                    response_text = unwrap(result)
+                self._unwrap = unwrap
+
             if response_text is None or response_text == "None":
                 return {
                     "action": "WAIT",
                     "confidence": 0.3,
                     "reasoning": "Empty AI response"
+                }, miss
+
+            if self.verbose_reasoning:
+                # Try to extract JSON from the response
+                parsed = _parse_decision_json(response_text)
+            else:
+                action = _parse_action_letter(response_text, self.ACTION_LETTERS)
+                parsed = None if action is None else {
+                    "action": action,
+                    "confidence": 0.7,
+                    "reasoning": f"Quick call: {action.lower()}",
+                    "use_powerup": action == "USE_POWERUP"
                 }
-            
-            # Try to extract JSON from the response
-            start = response_text.find('{')
-            end = response_text.rfind('}') + 1
-            if start >= 0 and end > start:
-                json_str = response_text[start:end]
-                parsed = json.loads(json_str)
-                
+            if parsed is not None:
                 # Ensure required fields exist
                 if "action" not in parsed or parsed["action"] is None:
                     parsed["action"] = "WAIT"
@@ -163,23 +723,25 @@ Respond with ONLY a JSON object:
                     parsed["confidence"] = 0.5
                 if "reasoning" not in parsed:
                     parsed["reasoning"] = "AI response"
-                    
-                return parsed
+
+                if miss is not None:
+                    miss = miss._replace(decision=dict(parsed))
+                return parsed, miss
             else:
                 # Fallback if no JSON found
                 return {
                     "action": "WAIT", 
                     "confidence": 0.5,
                     "reasoning": "Failed to parse AI response"
-                }
+                }, miss
         except Exception as e:
-            print(f"🚨 AI decision error: {e}")
+            _log.warning("AI decision error: %s", e)
             return {
                 "action": "WAIT",
                 "confidence": 0.3,
                 "reasoning": f"AI error: {str(e)[:20]}"
-            }
-    
+            }, miss
+
     async def generate_race_commentary(self, event: dict, personality: str) -> str:
         """Generate race commentary for events"""
         prompt = f"""You are a racing driver with personality: {personality}
@@ -190,11 +752,12 @@ Details: {event['details']}
 Respond with a SHORT racing driver quote (max 10 words) that fits your personality."""
 
         try:
-            result = await self.agent.execute_task(prompt)
+            result = await self._execute(prompt)
             response = result.output if hasattr(result, 'output') else str(result)
             # Clean up the response
             return response.strip()[:50]  # Max 50 chars
         except Exception as e:
+            _log.warning("AI commentary error: %s", e)
             return "Let's race!"
 
 # Pre-configured AI instances for different models
@@ -30,8 +30,9 @@ def test_weapon_flow():
     
     # 3. Check targeting
     print("\n3️⃣ Target Detection:")
+    targets = weapons_mgr.get_all_cars_ahead(positions, laps)
     for car in car_names:
-        target = weapons_mgr.get_car_ahead(car, positions, laps)
+        target = targets[car]
         if target:
             print(f"   {car} → Target: {target[0]} at {target[1]:.3f}")
         else:
@@ -47,7 +48,7 @@ def test_weapon_flow():
     
     # 5. Simulate what LLM should receive
     print("\n5️⃣ LLM Race State (for Car A):")
-    target = weapons_mgr.get_car_ahead("Car A", positions, laps)
+    target = targets["Car A"]
     ammo = weapons_mgr.get_ammo_status("Car A")
     can_fire = weapons_mgr.car_weapons["Car A"].can_fire(current_time)
     
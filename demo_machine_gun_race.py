@@ -4,10 +4,18 @@ Demo script showing machine gun system in action
 """
 
 import asyncio
+import logging
 from src.core.race_track import create_race_track
 from src.llm_drivers.llm_race_simulator import LLMRaceSimulator
 from src.llm_drivers.llm_racing_driver import create_llm_drivers
-from src.graphics.race_renderer import GraphicsSettings
+from src.graphics.race_renderer import DEFAULT_GRAPHICS_SETTINGS
+
+# uvloop's libuv-based event loop handles many concurrent LLM requests faster
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass  # Default asyncio event loop
 
 async def run_demo():
     """Run a quick demo race with machine guns"""
@@ -31,12 +39,7 @@ async def run_demo():
     llm_drivers = await create_llm_drivers(llm_config)
     
     # Graphics settings
-    graphics_settings = GraphicsSettings(
-        width=1200,
-        height=800,
-        fps=60,
-        show_telemetry=True
-    )
+    graphics_settings = DEFAULT_GRAPHICS_SETTINGS
     
     # Create simulator
     simulator = LLMRaceSimulator(
@@ -74,6 +77,7 @@ async def run_demo():
         print(f"{car_name}: {shots_fired} shots fired ({ammo} rounds remaining)")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     print("🔧 Setting up demo...")
     print("\n⚠️ Note: This demo requires Together AI API key in TOGETHER_API_KEY environment variable")
     print("Without it, the race will use fallback AI behavior\n")
@@ -6,6 +6,7 @@ LLM Race Demo - Watch Llama models race using Together AI!
 import sys
 import os
 import asyncio
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -18,7 +19,14 @@ load_dotenv()
 from src.core.race_track import RaceTrack
 from src.llm_drivers.llm_racing_driver import create_llm_drivers
 from src.llm_drivers.llm_race_simulator import LLMRaceSimulator
-from src.graphics.race_renderer import GraphicsSettings
+from src.graphics.race_renderer import DEFAULT_GRAPHICS_SETTINGS
+
+# uvloop's libuv-based event loop handles many concurrent LLM requests faster
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass  # Default asyncio event loop
 
 
 def check_setup():
@@ -115,13 +123,7 @@ async def main():
         print("✅ LLM drivers ready!")
         
         # Configure graphics
-        graphics_settings = GraphicsSettings(
-            width=1200,
-            height=800,
-            fps=60,  # Higher FPS for smoother animation
-            show_telemetry=True,
-            show_ai_thoughts=True
-        ) if use_graphics else None
+        graphics_settings = DEFAULT_GRAPHICS_SETTINGS if use_graphics else None
         
         # Create simulator
         simulator = LLMRaceSimulator(
@@ -187,6 +189,7 @@ async def main():
                 print(f"{driver_name}:")
                 print(f"  • Model: {stats['model'].split('/')[-1]}")
                 print(f"  • Total Decisions: {stats['decisions']}")
+                print(f"  • Rule Shortcuts (no LLM call): {stats.get('rule_shortcuts', 0)}")
                 print(f"  • Average Confidence: {stats['avg_confidence']:.2%}")
                 if "actions" in stats:
                     print(f"  • Actions: {stats['actions']}")
@@ -206,6 +209,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     # Run async main with full error catching
     try:
         asyncio.run(main())
@@ -18,9 +18,16 @@ load_dotenv()
 
 from src.core.racing_car import RacingCar, DriverStyle
 from src.core.race_track import RaceTrack
-from src.llm_drivers.llm_racing_driver import create_llm_drivers, LLMDriver
+from src.llm_drivers.llm_racing_driver import create_llm_drivers, LLMDriver, share_model_backends, close_http_client
 from src.graphics.graphical_race_simulator import GraphicalRaceSimulator
-from src.graphics.race_renderer import GraphicsSettings
+from src.graphics.race_renderer import DEFAULT_GRAPHICS_SETTINGS, PYGAME_AVAILABLE
+
+# uvloop's libuv-based event loop handles many concurrent LLM requests faster
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass  # Default asyncio event loop
 
 
 def create_mixed_lineup():
@@ -43,7 +50,7 @@ def create_mixed_lineup():
                 fuel_efficiency=9,
                 driver_style=DriverStyle.AGGRESSIVE
             )
-            speed_ai = RacingAI(LLAMA_MODELS["speed"]["model"])
+            speed_ai = RacingAI(LLAMA_MODELS["speed"]["model"], LLAMA_MODELS["speed"]["personality"])
             drivers.append(("llm", LLMDriver(
                 car=speed_car,
                 ai=speed_ai,
@@ -60,7 +67,7 @@ def create_mixed_lineup():
                 fuel_efficiency=16,
                 driver_style=DriverStyle.BALANCED
             )
-            strategic_ai = RacingAI(LLAMA_MODELS["strategic"]["model"])
+            strategic_ai = RacingAI(LLAMA_MODELS["strategic"]["model"], LLAMA_MODELS["strategic"]["personality"])
             drivers.append(("llm", LLMDriver(
                 car=strategic_car,
                 ai=strategic_ai,
@@ -112,6 +119,8 @@ def create_mixed_lineup():
 class HybridRaceSimulator(GraphicalRaceSimulator):
     """Simulator that can handle both LLM and rule-based drivers"""
     
+    DECISION_INTERVAL = 2.0  # Seconds of race time between LLM decision rounds
+    
     def __init__(self, track, mixed_drivers, laps=10, enable_graphics=True, graphics_settings=None):
         # Separate LLM and rule-based drivers
         self.llm_drivers = {}
@@ -134,11 +143,35 @@ class HybridRaceSimulator(GraphicalRaceSimulator):
             graphics_settings=graphics_settings
         )
         
+        # LLM drivers on the same model share one backend, so each tick's
+        # requests to that model arrive together and can be batched server-side
+        self.llm_backends = share_model_backends(list(self.llm_drivers.values()))
+        
+        # Speed multiplier from each LLM car's latest decision
+        self.llm_speed_modifiers = {name: 1.0 for name in self.llm_drivers}
+        
+        # LLM cars paired with their drivers, in grid order, so decision
+        # rounds walk only these instead of filtering every car by name
+        self.llm_entries = [(car, self.llm_drivers[car.name])
+                            for car in self.cars if car.name in self.llm_drivers]
+        
     def simulate_race(self):
         """Override to handle LLM decisions"""
         if not self.llm_drivers:
             # No LLM drivers, use standard simulation
-            return super().simulate_race()
+            return self._tag_llm_results(super().simulate_race())
+        return asyncio.run(self.simulate_race_async())
+    
+    async def simulate_race_async(self):
+        """Race loop where all LLM drivers decide concurrently each decision tick.
+        
+        Every DECISION_INTERVAL seconds of race time the LLM cars' decisions are
+        requested together with asyncio.gather, so a tick costs one round-trip
+        instead of one per LLM car. Rule-based cars keep stepping synchronously,
+        and every physics tick yields to the event loop.
+        """
+        if not self.llm_drivers:
+            return self._tag_llm_results(super().simulate_race())
             
         # Custom simulation mixing both AI types
         print("\n🏁 HYBRID RACE: LLMs vs Rule-Based AI! 🏁")
@@ -151,10 +184,101 @@ class HybridRaceSimulator(GraphicalRaceSimulator):
                 print(f"  🤖 {car.name} (LLM: {driver.model_config['model'].split('/')[-1]})")
             else:
                 print(f"  🎮 {car.name} (Rule-based {car.driver_style.value})")
+        
+        # Initialize race
+        for car in self.cars:
+            car.reset_for_race()
+            car.current_position = self.current_positions[car.name]
+            if self.telemetry:
+                self.telemetry.start_session(car.name, car.driver_style.value)
+            if self.enable_intelligence and car.name not in self.llm_drivers:
+                self.ai_systems[car.name].analyze_pre_race(self.cars, self.track.track_type, self.laps)
+        
+        track_length_m = self.track.total_length * 1000
+        next_decision_time = 0.0
+        while len(self.finished_cars) < len(self.cars):
+            if self.race_time >= next_decision_time:
+                await self._decide_llm_actions()
+                next_decision_time = self.race_time + self.DECISION_INTERVAL
+                
+            self.race_time += self.time_step
+            self._simulate_time_step()
+            
+            if self.renderer:
+                if not self.renderer.is_running():
+                    break
+                progress = {car.name: (car.distance_traveled % track_length_m) / track_length_m
+                            for car in self.cars}
+                current_lap = min(car.current_lap for car in self.cars) + 1
+                self.renderer.render_frame(self, progress, min(current_lap, self.laps), self.laps)
+                await asyncio.sleep(self.time_step)
+            else:
+                if self.tick % self.print_every == 0:
+                    self._print_race_update()
+                # Yield each tick so other tasks on the loop keep running
+                await asyncio.sleep(0)
                 
-        # For simplicity, use the parent's visual simulation
-        # In a full implementation, we'd integrate LLM decisions into the race loop
-        return super().simulate_race()
+        if self.renderer:
+            self.renderer.cleanup()
+        await close_http_client()
+            
+        # _generate_results orders by the 0-based current_position
+        for car in self.cars:
+            car.current_position = self.current_positions[car.name]
+        return self._tag_llm_results(self._generate_results(self.lap_times))
+    
+    def _tag_llm_results(self, results):
+        """Mark each finisher with whether an LLM drove it"""
+        # The text-mode fallback reports "positions" instead of a finishing order
+        for result in results.get("finishing_order", []):
+            result["is_llm"] = result["name"] in self.llm_drivers
+        return results
+    
+    async def _decide_llm_actions(self):
+        """Request every LLM car's next action in one concurrent batch"""
+        standings = sorted(self.cars, key=lambda c: -c.distance_traveled)
+        racing = [(car, driver) for car, driver in self.llm_entries
+                  if car.name not in self.finished_cars]
+        for car, _ in racing:
+            car.current_position = self.current_positions[car.name] + 1
+            
+        decisions = await asyncio.gather(
+            *[driver.make_decision(self._state_for(car, standings))
+              for car, driver in racing],
+            return_exceptions=True
+        )
+        
+        for (car, driver), decision in zip(racing, decisions):
+            if isinstance(decision, Exception):
+                print(f"⚠️ LLM decision error for {car.name}: {decision}")
+                continue  # Keep following the previous decision
+            # Resource costs of the action are charged once per decision
+            self.llm_speed_modifiers[car.name] = driver.apply_action_to_car(driver.last_action, 1.0)
+    
+    def _state_for(self, car, standings):
+        """Race state an LLM driver sees (gaps in metres)"""
+        index = standings.index(car)
+        gap_ahead = standings[index - 1].distance_traveled - car.distance_traveled if index > 0 else 999
+        gap_behind = (car.distance_traveled - standings[index + 1].distance_traveled
+                      if index < len(standings) - 1 else 999)
+        segment_index, _ = self._get_car_segment(car)
+        
+        return {
+            "total_cars": len(self.cars),
+            "current_lap": car.current_lap + 1,
+            "total_laps": self.laps,
+            "gap_ahead": round(gap_ahead, 1),
+            "gap_behind": round(gap_behind, 1),
+            "track_segment": "straight" if self.track.segments[segment_index].is_straight else "corner",
+            "weather": self.track.weather_conditions
+        }
+    
+    def _apply_driver_style_decision(self, car, optimal_speed, segment):
+        """LLM cars follow their latest decision; rule-based cars use the intelligence system"""
+        speed_modifier = self.llm_speed_modifiers.get(car.name)
+        if speed_modifier is None:
+            return super()._apply_driver_style_decision(car, optimal_speed, segment)
+        return min(optimal_speed * speed_modifier, car.get_effective_top_speed())
 
 
 async def main():
@@ -165,12 +289,10 @@ async def main():
     print()
     
     # Check pygame
-    try:
-        import pygame
-        use_graphics = True
+    use_graphics = PYGAME_AVAILABLE
+    if use_graphics:
         print("✅ Pygame detected - visual mode available")
-    except ImportError:
-        use_graphics = False
+    else:
         print("📝 Text mode only (install pygame for visuals)")
         
     # Create mixed lineup
@@ -190,13 +312,7 @@ async def main():
     print(f"  • Mode: {'Visual' if use_graphics else 'Text'}")
     
     # Graphics settings
-    graphics_settings = GraphicsSettings(
-        width=1200,
-        height=800,
-        fps=60,
-        show_telemetry=True,
-        show_ai_thoughts=True
-    ) if use_graphics else None
+    graphics_settings = DEFAULT_GRAPHICS_SETTINGS if use_graphics else None
     
     # Create hybrid simulator
     simulator = HybridRaceSimulator(
@@ -214,7 +330,7 @@ async def main():
         input("Press Enter to start the race...")
     
     # Run the race
-    results = simulator.simulate_race()
+    results = await simulator.simulate_race_async()
     
     # Display results
     print("\n🏆 RACE RESULTS 🏆")
@@ -223,31 +339,33 @@ async def main():
     llm_positions = []
     rule_positions = []
     
+    lines = []
     for i, result in enumerate(results["finishing_order"], 1):
         name = result["name"]
         time = result["total_time"]
         
-        # Determine if LLM or rule-based
-        is_llm = "AI" in name or "Llama" in name
+        is_llm = result["is_llm"]
         
         if i == 1:
-            print(f"🥇 {name} - {time:.2f}s")
+            lines.append(f"🥇 {name} - {time:.2f}s")
         elif i == 2:
-            print(f"🥈 {name} - {time:.2f}s")
+            lines.append(f"🥈 {name} - {time:.2f}s")
         elif i == 3:
-            print(f"🥉 {name} - {time:.2f}s")
+            lines.append(f"🥉 {name} - {time:.2f}s")
         else:
-            print(f"{i}. {name} - {time:.2f}s")
+            lines.append(f"{i}. {name} - {time:.2f}s")
             
-        print(f"   Type: {'🤖 LLM-Powered' if is_llm else '🎮 Rule-Based'}")
-        print(f"   Fuel: {result['final_fuel']:.1f}% | Tires: {100-result['tire_wear']:.1f}%")
-        print()
+        lines.append(f"   Type: {'🤖 LLM-Powered' if is_llm else '🎮 Rule-Based'}")
+        lines.append(f"   Fuel: {result['final_fuel']:.1f}% | Tires: {100-result['tire_wear']:.1f}%")
+        lines.append("")
         
         if is_llm:
             llm_positions.append(i)
         else:
             rule_positions.append(i)
     
+    sys.stdout.write("\n".join(lines) + "\n")
+    
     # Analysis
     print("\n📊 ANALYSIS:")
     print("=" * 60)
@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.core.racing_car import RacingCar, DriverStyle
 from src.core.race_track import RaceTrack, TrackType
 from src.graphics.graphical_race_simulator import GraphicalRaceSimulator
-from src.graphics.race_renderer import GraphicsSettings
+from src.graphics.race_renderer import DEFAULT_GRAPHICS_SETTINGS, PYGAME_AVAILABLE
 
 
 def create_personality_cars():
@@ -68,10 +68,9 @@ def main():
     print("=" * 60)
     
     # Check if Pygame is available
-    try:
-        import pygame
+    if PYGAME_AVAILABLE:
         print("✅ Pygame is installed! Starting graphical mode...")
-    except ImportError:
+    else:
         print("❌ Pygame not installed. Please install it first:")
         print("   pip install pygame")
         print("\nAlternatively, run the ASCII visual demo (option 4 in main menu)")
@@ -105,14 +104,7 @@ def main():
     print(f"\n✅ Selected: {track.name}")
     
     # Configure graphics settings
-    settings = GraphicsSettings(
-        width=1200,
-        height=800,
-        fps=60,
-        show_telemetry=True,
-        show_ai_thoughts=True,
-        camera_mode="follow"
-    )
+    settings = DEFAULT_GRAPHICS_SETTINGS
     
     # Get number of laps
     num_laps = input("\nNumber of laps (1-10, default=5): ").strip()
@@ -158,6 +150,7 @@ def main():
         print("=" * 60)
         
         print("\n🏆 FINAL STANDINGS:")
+        lines = []
         for result in results["finishing_order"]:
             position = result["position"]
             name = result["name"]
@@ -175,8 +168,10 @@ def main():
             else:
                 pos_emoji = f"{position}."
                 
-            print(f"{pos_emoji} {name:<20} - Time: {time:.2f}s")
-            print(f"   Style: {style}, Final Fuel: {fuel:.1f}%")
+            lines.append(f"{pos_emoji} {name:<20} - Time: {time:.2f}s")
+            lines.append(f"   Style: {style}, Final Fuel: {fuel:.1f}%")
+            
+        sys.stdout.write("\n".join(lines) + "\n")
             
         # Show personality impact
         print("\n🎭 PERSONALITY ANALYSIS:")
@@ -3,10 +3,24 @@
 Simple Visual Race Demo - Standalone ASCII visualization
 """
 
+import os
 import time
 import random
 
 
+# Target seconds per race update; RACE_FRAME_S=0 runs the demo flat out
+FRAME_SECONDS = float(os.environ.get("RACE_FRAME_S", "1.2"))
+
+# Per-tick speed multiplier range for each racing style
+SPEED_VARIANCE = {
+    "aggressive": (0.8, 1.4),     # Speed demon: fast but inconsistent
+    "technical": (0.95, 1.05),    # Tech precision: very consistent
+    "conservative": (0.9, 1.1),   # Fuel master: steady progress
+    "balanced": (0.85, 1.25),     # Adaptive racer: adapts to conditions
+    "chaotic": (0.5, 1.6),        # Chaos cruiser: wildly unpredictable
+}
+
+
 class SimpleRacer:
     """Simple racer for visual demo"""
     def __init__(self, name, symbol, style, speed_factor=1.0):
@@ -28,6 +42,15 @@ class SimpleRacer:
         return random.choice(self.personality_quotes.get(self.name, ["Let's race!"]))
 
 
+def _step(positions, speed_scales, speed_lows, speed_highs, race_length, uniform=random.uniform):
+    """Advance every racer one tick, clamped to the finish line"""
+    return [
+        min(position + scale * uniform(low, high), race_length)
+        for position, scale, low, high
+        in zip(positions, speed_scales, speed_lows, speed_highs)
+    ]
+
+
 def run_visual_race():
     """Run a visual race with ASCII track display"""
     print('🏎️  AI RACING SIMULATOR - VISUAL RACE!')
@@ -61,56 +84,55 @@ def run_visual_race():
     race_length = 100
     updates = 10
     
+    # Per-tick state lives in parallel lists indexed like `racers`; the
+    # racer objects only carry identity (name, symbol, quotes) for display
+    base_speed = 8
+    positions = [0.0] * len(racers)
+    speed_scales = [base_speed * racer.speed_factor for racer in racers]
+    speed_lows = [SPEED_VARIANCE[racer.style][0] for racer in racers]
+    speed_highs = [SPEED_VARIANCE[racer.style][1] for racer in racers]
+    order = list(range(len(racers)))
+    
+    # Track frame is the same every tick
+    track_width = 50
+    empty_track = ' ' * track_width
+    track_top = 'START' + '┌' + '─' * track_width + '┐' + 'FINISH'
+    track_bottom = '     └' + '─' * track_width + '┘'
+    
     for update in range(updates):
+        frame_start = time.monotonic()
         print(f'⏱️ RACE UPDATE {update + 1}/{updates}:')
         
         # Update racer positions based on their characteristics
-        for racer in racers:
-            base_speed = 8
-            
-            if racer.style == "aggressive":
-                # Speed demon: fast but inconsistent
-                speed = base_speed * racer.speed_factor * random.uniform(0.8, 1.4)
-            elif racer.style == "technical":
-                # Tech precision: very consistent
-                speed = base_speed * racer.speed_factor * random.uniform(0.95, 1.05)
-            elif racer.style == "conservative":
-                # Fuel master: steady progress
-                speed = base_speed * racer.speed_factor * random.uniform(0.9, 1.1)
-            elif racer.style == "balanced":
-                # Adaptive racer: adapts to conditions
-                speed = base_speed * racer.speed_factor * random.uniform(0.85, 1.25)
-            else:  # chaotic
-                # Chaos cruiser: wildly unpredictable
-                speed = base_speed * racer.speed_factor * random.uniform(0.5, 1.6)
-            
-            racer.position += speed
-            racer.position = min(racer.position, race_length)
+        positions = _step(positions, speed_scales, speed_lows, speed_highs, race_length)
         
         # Sort racers by position
-        racers.sort(key=lambda x: x.position, reverse=True)
+        order.sort(key=positions.__getitem__, reverse=True)
         
-        # Create visual track
-        track_width = 50
-        track = [' '] * track_width
-        
-        # Place racers on track
-        for racer in racers:
-            track_pos = min(int((racer.position / race_length) * track_width), track_width - 1)
-            if track[track_pos] == ' ':
-                track[track_pos] = racer.symbol
+        # Place racers on track, remembering only the occupied slots
+        cells = {}
+        for index in order:
+            track_pos = min(int((positions[index] / race_length) * track_width), track_width - 1)
+            if track_pos not in cells:
+                cells[track_pos] = racers[index].symbol
             else:
-                track[track_pos] = '🔥'  # Battle indicator
+                cells[track_pos] = '🔥'  # Battle indicator
+        
+        # Poke them into the empty track right to left so earlier slots keep their offsets
+        track = empty_track
+        for track_pos in sorted(cells, reverse=True):
+            track = track[:track_pos] + cells[track_pos] + track[track_pos + 1:]
         
         # Display track
-        print('START' + '┌' + '─' * track_width + '┐' + 'FINISH')
-        print('     │' + ''.join(track) + '│')
-        print('     └' + '─' * track_width + '┘')
+        print(track_top)
+        print('     │' + track + '│')
+        print(track_bottom)
         
         # Show current standings
         print('POSITIONS:')
-        for i, racer in enumerate(racers):
-            progress = min(int((racer.position / race_length) * 100), 100)
+        for i, index in enumerate(order):
+            racer = racers[index]
+            progress = min(int((positions[index] / race_length) * 100), 100)
             if progress >= 100:
                 status = "FINISHED! 🏁"
             else:
@@ -119,30 +141,35 @@ def run_visual_race():
         
         # Add some personality during the race
         if update == 3:
-            leader = racers[0]
+            leader = racers[order[0]]
             print(f'   💭 {leader.name}: "{leader.get_quote()}"')
         elif update == 6:
             if len(racers) > 1:
-                second = racers[1]
+                second = racers[order[1]]
                 print(f'   💭 {second.name}: "{second.get_quote()}"')
         
         print()
         
         # Check if race is finished
-        if any(racer.position >= race_length for racer in racers):
+        if positions[order[0]] >= race_length:
             break
         
-        time.sleep(1.2)  # Pause between updates
+        # Pause between updates, minus the time this update already took
+        remaining = FRAME_SECONDS - (time.monotonic() - frame_start)
+        if remaining > 0:
+            time.sleep(remaining)
     
     # Final results
     print('🏁 RACE FINISHED!')
     print('='*40)
     print('🏆 FINAL RESULTS:')
     
-    # Sort by final position
-    racers.sort(key=lambda x: x.position, reverse=True)
+    # The last in-loop sort already holds the final order
+    for racer, position in zip(racers, positions):
+        racer.position = position
     
-    for i, racer in enumerate(racers):
+    for i, index in enumerate(order):
+        racer = racers[index]
         if i == 0:
             print(f'  🥇 1st: {racer.symbol} {racer.name} - WINNER!')
         elif i == 1:
@@ -153,7 +180,7 @@ def run_visual_race():
             print(f'     {i+1}th: {racer.symbol} {racer.name}')
     
     # Winner celebration
-    winner = racers[0]
+    winner = racers[order[0]]
     print(f'\n🏆 CHAMPION: {winner.name}!')
     print(f'   Style: {winner.style.title()} Racing')
     print(f'   Victory Quote: "{winner.get_quote()}"')
@@ -14,6 +14,9 @@ from src.systems.telemetry import TelemetrySystem
 from src.intelligence.ai_personalities import AIPersonalitySystem
 from src.intelligence.enhanced_ai_racers import create_enhanced_ai_racers
 
+# Rating strings for 0-5 stars
+STAR_STRINGS = ['⭐' * count for count in range(6)]
+
 
 def main():
     """Demonstrate telemetry analysis capabilities"""
@@ -46,29 +49,33 @@ def main():
     print("\n📊 TELEMETRY ANALYSIS")
     print("=" * 40)
     
-    # Analyze each driver's performance
+    # Final metrics are computed once per car and reused by every section below
+    metrics_by_car = {car.name: telemetry.calculate_final_metrics(car.name) for car in cars}
+    
+    # Analyze each driver's performance; reports are written in one go
+    lines = []
     for car in cars:
-        print(f"\n🏎️  {car.name} Analysis:")
+        lines.append(f"\n🏎️  {car.name} Analysis:")
         
         # Get telemetry data
         car_telemetry = telemetry.get_car_telemetry(car.name)
         
         if car_telemetry:
             # Calculate summary statistics
-            metrics = telemetry.calculate_final_metrics(car.name)
+            metrics = metrics_by_car[car.name]
             
-            print(f"   📈 Performance Summary:")
-            print(f"      Top Speed: {metrics.get('top_speed', 0):.1f} km/h")
-            print(f"      Avg Speed: {metrics.get('avg_speed', 0):.1f} km/h")
-            print(f"      Consistency: {metrics.get('consistency_score', 0):.2f}")
-            print(f"      Fuel Efficiency: {metrics.get('fuel_efficiency', 0):.2f}")
-            print(f"      Cornering: {metrics.get('cornering_speed', 0):.1f} km/h")
+            lines.append(f"   📈 Performance Summary:")
+            lines.append(f"      Top Speed: {metrics.get('top_speed', 0):.1f} km/h")
+            lines.append(f"      Avg Speed: {metrics.get('avg_speed', 0):.1f} km/h")
+            lines.append(f"      Consistency: {metrics.get('consistency_score', 0):.2f}")
+            lines.append(f"      Fuel Efficiency: {metrics.get('fuel_efficiency', 0):.2f}")
+            lines.append(f"      Cornering: {metrics.get('cornering_speed', 0):.1f} km/h")
             
             # Performance ratings
-            print(f"   ⭐ Ratings:")
-            print(f"      Speed: {'⭐' * min(5, int(metrics.get('top_speed', 0) / 70))}")
-            print(f"      Handling: {'⭐' * min(5, int(metrics.get('stability_index', 0) * 5))}")
-            print(f"      Efficiency: {'⭐' * min(5, int(metrics.get('fuel_efficiency', 0)))}")
+            lines.append(f"   ⭐ Ratings:")
+            lines.append(f"      Speed: {STAR_STRINGS[min(5, max(0, int(metrics.get('top_speed', 0) / 70)))]}")
+            lines.append(f"      Handling: {STAR_STRINGS[min(5, max(0, int(metrics.get('stability_index', 0) * 5)))]}")
+            lines.append(f"      Efficiency: {STAR_STRINGS[min(5, max(0, int(metrics.get('fuel_efficiency', 0))))]}")
             
             # Driver style impact
             style_factor = {
@@ -79,35 +86,27 @@ def main():
                 DriverStyle.CHAOTIC: "Unpredictable, entertaining"
             }
             
-            print(f"   🎭 Style Impact: {style_factor.get(car.driver_style, 'Unknown')}")
+            lines.append(f"   🎭 Style Impact: {style_factor.get(car.driver_style, 'Unknown')}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Compare performances
     print(f"\n🔍 COMPARATIVE ANALYSIS")
     print("=" * 40)
     
     # Speed comparison
-    speed_data = []
-    for car in cars:
-        metrics = telemetry.calculate_final_metrics(car.name)
-        speed_data.append((car.name, metrics.get('top_speed', 0)))
-    
-    speed_data.sort(key=lambda x: x[1], reverse=True)
+    by_speed = sorted(cars, key=lambda car: metrics_by_car[car.name].get('top_speed', 0), reverse=True)
     
     print(f"\n🏎️  Top Speed Rankings:")
-    for i, (name, speed) in enumerate(speed_data):
-        print(f"   {i+1}. {name}: {speed:.1f} km/h")
+    for i, car in enumerate(by_speed):
+        print(f"   {i+1}. {car.name}: {metrics_by_car[car.name].get('top_speed', 0):.1f} km/h")
     
     # Consistency comparison
-    consistency_data = []
-    for car in cars:
-        metrics = telemetry.calculate_final_metrics(car.name)
-        consistency_data.append((car.name, metrics.get('consistency_score', 0)))
-    
-    consistency_data.sort(key=lambda x: x[1], reverse=True)
+    by_consistency = sorted(cars, key=lambda car: metrics_by_car[car.name].get('consistency_score', 0), reverse=True)
     
     print(f"\n📊 Consistency Rankings:")
-    for i, (name, consistency) in enumerate(consistency_data):
-        print(f"   {i+1}. {name}: {consistency:.3f}")
+    for i, car in enumerate(by_consistency):
+        print(f"   {i+1}. {car.name}: {metrics_by_car[car.name].get('consistency_score', 0):.3f}")
     
     # Export telemetry data
     print(f"\n💾 Exporting telemetry data...")
@@ -126,8 +125,8 @@ def main():
     }
     
     for category, metric in categories.items():
-        best_performer = max(cars, key=lambda car: telemetry.calculate_final_metrics(car.name).get(metric, 0))
-        value = telemetry.calculate_final_metrics(best_performer.name).get(metric, 0)
+        best_performer = max(cars, key=lambda car: metrics_by_car[car.name].get(metric, 0))
+        value = metrics_by_car[best_performer.name].get(metric, 0)
         print(f"   🏆 Best {category.title()}: {best_performer.name} ({value:.3f})")
     
     print(f"\n✅ Telemetry analysis complete!")
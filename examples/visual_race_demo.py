@@ -17,6 +17,16 @@ import time
 import random
 
 
+# Inclusive progress range per update for each driving style
+PROGRESS_RANGES = {
+    DriverStyle.AGGRESSIVE: (9, 14),     # Speed demon advances more aggressively
+    DriverStyle.CHAOTIC: (4, 16),        # Chaos cruiser varies wildly (high risk, high reward)
+    DriverStyle.TECHNICAL: (8, 10),      # Tech precision is very consistent
+    DriverStyle.CONSERVATIVE: (7, 9),    # Fuel master is steady and efficient
+    DriverStyle.BALANCED: (7, 12),       # Adaptive racer adapts to conditions
+}
+
+
 def run_visual_race():
     """Run a visual race with ASCII track display"""
     print('🏎️  AI RACING SIMULATOR - VISUAL RACE!')
@@ -30,6 +40,9 @@ def run_visual_race():
     # Car symbols and colors
     car_symbols = ['🏎️', '🏁', '⚡', '🎯', '🌪️']
     car_positions = [0, 0, 0, 0, 0]  # Track position for each car
+    progress_ranges = [PROGRESS_RANGES[car.driver_style] for car in cars]
+    progress_lows = [low for low, _ in progress_ranges]
+    progress_highs = [high for _, high in progress_ranges]
 
     print('🏁 STARTING LINEUP:')
     print('='*30)
@@ -41,56 +54,56 @@ def run_visual_race():
     print('🚦 LIGHTS OUT AND AWAY WE GO!')
     print('='*40)
     
+    # Track frame is the same every update
+    track_length = 60
+    empty_track = ' ' * track_length
+    track_top = '┌' + '─' * track_length + '┐'
+    track_bottom = '└' + '─' * track_length + '┘'
+    
+    # Progress is a whole number bounded by the fastest possible car, so the
+    # track slot and completion percentage for every reachable value are tabled
+    race_updates = 8
+    max_progress = race_updates * max(progress_highs)
+    track_slots = [min(int((pos / 80) * track_length), track_length - 1) for pos in range(max_progress + 1)]
+    progress_percents = [min(int((pos / 80) * 100), 100) for pos in range(max_progress + 1)]
+    
     # Simulate 8 race updates for a full race
-    for update in range(8):
+    for update in range(race_updates):
         print(f'⏱️ RACE PROGRESS - Update {update + 1}/8:')
         
         # Update positions based on car characteristics and personality
-        for i, car in enumerate(cars):
-            base_speed = 7  # Base progress per update
-            
-            # Speed demon advances more aggressively
-            if 'Speed Demon' in car.name:
-                car_positions[i] += random.randint(9, 14)
-            # Chaos cruiser varies wildly (high risk, high reward)
-            elif 'Chaos Cruiser' in car.name:
-                car_positions[i] += random.randint(4, 16)
-            # Tech precision is very consistent
-            elif 'Tech Precision' in car.name:
-                car_positions[i] += random.randint(8, 10)
-            # Fuel master is steady and efficient
-            elif 'Fuel Master' in car.name:
-                car_positions[i] += random.randint(7, 9)
-            # Adaptive racer adapts to conditions
-            else:  # Adaptive Racer
-                car_positions[i] += random.randint(7, 12)
+        car_positions = [
+            position + random.randint(low, high)
+            for position, low, high in zip(car_positions, progress_lows, progress_highs)
+        ]
         
         # Sort by position for standings
-        car_data = [(car_positions[i], cars[i], car_symbols[i], enhanced_racers[i]) for i in range(5)]
-        car_data.sort(key=lambda x: x[0], reverse=True)
+        order = sorted(range(len(cars)), key=car_positions.__getitem__, reverse=True)
+        car_data = [(car_positions[i], cars[i], car_symbols[i], enhanced_racers[i]) for i in order]
         
-        # Create visual track
-        track_length = 60
-        track = [' '] * track_length
-        
-        # Place cars on track
+        # Place cars on track, remembering only the occupied slots
+        cells = {}
         for pos, car, symbol, racer in car_data:
-            track_pos = min(int((pos / 80) * track_length), track_length - 1)
-            if track[track_pos] == ' ':
-                track[track_pos] = symbol
+            track_pos = track_slots[pos]
+            if track_pos not in cells:
+                cells[track_pos] = symbol
             else:
-                track[track_pos] = '🔥'  # Close battle indicator
+                cells[track_pos] = '🔥'  # Close battle indicator
+        
+        # Poke them into the empty track right to left so earlier slots keep their offsets
+        track = empty_track
+        for track_pos in sorted(cells, reverse=True):
+            track = track[:track_pos] + cells[track_pos] + track[track_pos + 1:]
         
         # Display track
-        print('┌' + '─' * track_length + '┐')
-        print('│' + ''.join(track) + '│')
-        print('└' + '─' * track_length + '┘')
+        print(track_top)
+        print('│' + track + '│')
+        print(track_bottom)
         
         # Show current standings with personality reactions
         print('CURRENT STANDINGS:')
         for i, (pos, car, symbol, racer) in enumerate(car_data):
-            progress_percent = min(int((pos / 80) * 100), 100)
-            print(f'  {i+1}. {symbol} {car.name} - {progress_percent}% complete')
+            print(f'  {i+1}. {symbol} {car.name} - {progress_percents[pos]}% complete')
         
         # Show some AI personality reactions during the race
         if update == 2:
@@ -131,7 +144,6 @@ def run_visual_race():
     print(f'   Signature Move: {winner_racer.profile.signature_moves[0]}')
     
     # Post-race quote
-    personality_system = AIPersonalitySystem()
     victory_quote = personality_system.generate_post_race_quote(winner_racer.profile, 1, {})
     print(f'   Victory Quote: "{victory_quote}"')
     
@@ -5,6 +5,7 @@ Main demo runner - Easy way to run the AI Racing Simulator
 
 import sys
 import os
+import runpy
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -26,14 +27,19 @@ def main():
     
     choice = input("Enter your choice (1-7): ").strip()
     
+    # Demos run in this interpreter instead of a fresh `python` subprocess
     if choice == "1":
-        os.system("python examples/quick_race.py")
+        from examples.quick_race import main as quick_race_main
+        quick_race_main()
     elif choice == "2":
-        os.system("python examples/custom_championship.py")
+        from examples.custom_championship import main as championship_main
+        championship_main()
     elif choice == "3":
-        os.system("python examples/telemetry_analysis.py")
+        from examples.telemetry_analysis import main as telemetry_main
+        telemetry_main()
     elif choice == "4":
-        os.system("python examples/simple_visual_race.py")
+        from examples.simple_visual_race import main as visual_race_main
+        visual_race_main()
     elif choice == "5":
         from visualization.showcase_finale import main as showcase_main
         showcase_main()
@@ -62,7 +68,7 @@ def run_all_tests():
     for test_file in test_files:
         print(f"\n🔍 Running {test_file}...")
         try:
-            os.system(f"python {test_file}")
+            runpy.run_path(test_file, run_name="__main__")
             print(f"✅ {test_file} completed")
         except Exception as e:
             print(f"❌ {test_file} failed: {e}")
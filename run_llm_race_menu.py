@@ -10,122 +10,128 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.core.race_track import RaceTrack, TrackType, TrackSegment
 from src.llm_drivers.llm_racing_driver import create_llm_drivers
 from src.llm_drivers.llm_race_simulator import LLMRaceSimulator
-from src.graphics.race_renderer import GraphicsSettings
+from src.graphics.race_renderer import DEFAULT_GRAPHICS_SETTINGS
+
+
+# Track layouts are plain data, built once at import and shared by every race
+MONACO_SEGMENTS = (
+    TrackSegment(length=800, is_straight=True),     # Start/finish straight
+    TrackSegment(length=300, is_straight=False, corner_angle=90, corner_radius=50),   # Tight hairpin
+    TrackSegment(length=400, is_straight=True),
+    TrackSegment(length=200, is_straight=False, corner_angle=45, corner_radius=80),   # Medium corner
+    TrackSegment(length=600, is_straight=True),     # Tunnel section
+    TrackSegment(length=400, is_straight=False, corner_angle=135, corner_radius=40),  # Chicane
+    TrackSegment(length=350, is_straight=True),
+    TrackSegment(length=250, is_straight=False, corner_angle=90, corner_radius=60),   # Swimming pool
+    TrackSegment(length=500, is_straight=True),
+    TrackSegment(length=300, is_straight=False, corner_angle=180, corner_radius=30),  # Rascasse hairpin
+)
 
 
 def create_monaco_track():
     """Create a Monaco-style street circuit"""
-    segments = [
-        TrackSegment(length=800, is_straight=True),     # Start/finish straight
-        TrackSegment(length=300, is_straight=False, corner_angle=90, corner_radius=50),   # Tight hairpin
-        TrackSegment(length=400, is_straight=True),
-        TrackSegment(length=200, is_straight=False, corner_angle=45, corner_radius=80),   # Medium corner
-        TrackSegment(length=600, is_straight=True),     # Tunnel section
-        TrackSegment(length=400, is_straight=False, corner_angle=135, corner_radius=40),  # Chicane
-        TrackSegment(length=350, is_straight=True),
-        TrackSegment(length=250, is_straight=False, corner_angle=90, corner_radius=60),   # Swimming pool
-        TrackSegment(length=500, is_straight=True),
-        TrackSegment(length=300, is_straight=False, corner_angle=180, corner_radius=30),  # Rascasse hairpin
-    ]
-    
     # Using TECHNICAL_TRACK type ensures proper screen fitting
     return RaceTrack(
         name="Monaco Street Circuit",
         track_type=TrackType.TECHNICAL_TRACK,
         total_length=4.1,
-        segments=segments,
+        segments=list(MONACO_SEGMENTS),
         weather_conditions="clear"
     )
 
 
+SILVERSTONE_SEGMENTS = (
+    TrackSegment(length=1200, is_straight=True),    # Hamilton straight
+    TrackSegment(length=400, is_straight=False, corner_angle=60, corner_radius=150),  # Copse
+    TrackSegment(length=800, is_straight=True),     # Wellington straight
+    TrackSegment(length=350, is_straight=False, corner_angle=90, corner_radius=100),  # Brooklands
+    TrackSegment(length=600, is_straight=True),
+    TrackSegment(length=450, is_straight=False, corner_angle=120, corner_radius=80),  # Luffield
+    TrackSegment(length=700, is_straight=True),
+    TrackSegment(length=300, is_straight=False, corner_angle=45, corner_radius=200),  # Woodcote
+)
+
+
 def create_silverstone_track():
     """Create a Silverstone-style high-speed circuit"""
-    segments = [
-        TrackSegment(length=1200, is_straight=True),    # Hamilton straight
-        TrackSegment(length=400, is_straight=False, corner_angle=60, corner_radius=150),  # Copse
-        TrackSegment(length=800, is_straight=True),     # Wellington straight
-        TrackSegment(length=350, is_straight=False, corner_angle=90, corner_radius=100),  # Brooklands
-        TrackSegment(length=600, is_straight=True),
-        TrackSegment(length=450, is_straight=False, corner_angle=120, corner_radius=80),  # Luffield
-        TrackSegment(length=700, is_straight=True),
-        TrackSegment(length=300, is_straight=False, corner_angle=45, corner_radius=200),  # Woodcote
-    ]
-    
     return RaceTrack(
         name="Silverstone Grand Prix",
         track_type=TrackType.SPEED_TRACK,
         total_length=5.9,
-        segments=segments,
+        segments=list(SILVERSTONE_SEGMENTS),
         weather_conditions="clear"
     )
 
 
+NURBURGRING_SEGMENTS = (
+    TrackSegment(length=2000, is_straight=True),    # Döttinger Höhe
+    TrackSegment(length=500, is_straight=False, corner_angle=90, corner_radius=100),
+    TrackSegment(length=800, is_straight=True),
+    TrackSegment(length=600, is_straight=False, corner_angle=180, corner_radius=50),  # Carousel
+    TrackSegment(length=1500, is_straight=True),
+    TrackSegment(length=400, is_straight=False, corner_angle=45, corner_radius=150),
+    TrackSegment(length=1000, is_straight=True),
+    TrackSegment(length=700, is_straight=False, corner_angle=135, corner_radius=70),
+    TrackSegment(length=1200, is_straight=True),
+    TrackSegment(length=800, is_straight=False, corner_angle=90, corner_radius=90),
+)
+
+
 def create_nurburgring_track():
     """Create a Nürburgring-style endurance circuit"""
-    segments = [
-        TrackSegment(length=2000, is_straight=True),    # Döttinger Höhe
-        TrackSegment(length=500, is_straight=False, corner_angle=90, corner_radius=100),
-        TrackSegment(length=800, is_straight=True),
-        TrackSegment(length=600, is_straight=False, corner_angle=180, corner_radius=50),  # Carousel
-        TrackSegment(length=1500, is_straight=True),
-        TrackSegment(length=400, is_straight=False, corner_angle=45, corner_radius=150),
-        TrackSegment(length=1000, is_straight=True),
-        TrackSegment(length=700, is_straight=False, corner_angle=135, corner_radius=70),
-        TrackSegment(length=1200, is_straight=True),
-        TrackSegment(length=800, is_straight=False, corner_angle=90, corner_radius=90),
-    ]
-    
     return RaceTrack(
         name="Nürburgring Nordschleife",
         track_type=TrackType.ENDURANCE_TRACK,
         total_length=20.8,
-        segments=segments,
+        segments=list(NURBURGRING_SEGMENTS),
         weather_conditions="clear"
     )
 
 
+SUZUKA_SEGMENTS = (
+    TrackSegment(length=1000, is_straight=True),    # Start/finish
+    TrackSegment(length=400, is_straight=False, corner_angle=90, corner_radius=120),  # Turn 1-2
+    TrackSegment(length=500, is_straight=True),
+    TrackSegment(length=600, is_straight=False, corner_angle=180, corner_radius=60),  # S-curves
+    TrackSegment(length=700, is_straight=True),
+    TrackSegment(length=350, is_straight=False, corner_angle=45, corner_radius=100),  # Dunlop
+    TrackSegment(length=800, is_straight=True),     # Back straight
+    TrackSegment(length=500, is_straight=False, corner_angle=135, corner_radius=40),  # Spoon
+    TrackSegment(length=600, is_straight=True),
+    TrackSegment(length=450, is_straight=False, corner_angle=90, corner_radius=80),   # 130R
+)
+
+
 def create_suzuka_track():
     """Create a Suzuka-style figure-8 circuit"""
-    segments = [
-        TrackSegment(length=1000, is_straight=True),    # Start/finish
-        TrackSegment(length=400, is_straight=False, corner_angle=90, corner_radius=120),  # Turn 1-2
-        TrackSegment(length=500, is_straight=True),
-        TrackSegment(length=600, is_straight=False, corner_angle=180, corner_radius=60),  # S-curves
-        TrackSegment(length=700, is_straight=True),
-        TrackSegment(length=350, is_straight=False, corner_angle=45, corner_radius=100),  # Dunlop
-        TrackSegment(length=800, is_straight=True),     # Back straight
-        TrackSegment(length=500, is_straight=False, corner_angle=135, corner_radius=40),  # Spoon
-        TrackSegment(length=600, is_straight=True),
-        TrackSegment(length=450, is_straight=False, corner_angle=90, corner_radius=80),   # 130R
-    ]
-    
     return RaceTrack(
         name="Suzuka International",
         track_type=TrackType.MIXED_TRACK,
         total_length=5.8,
-        segments=segments,
+        segments=list(SUZUKA_SEGMENTS),
         weather_conditions="clear"
     )
 
 
+RAINBOW_ROAD_SEGMENTS = (
+    TrackSegment(length=1500, is_straight=True),    # Launch straight
+    TrackSegment(length=600, is_straight=False, corner_angle=270, corner_radius=100), # Loop
+    TrackSegment(length=800, is_straight=True),
+    TrackSegment(length=400, is_straight=False, corner_angle=90, corner_radius=150),  # Banking
+    TrackSegment(length=1000, is_straight=True),    # Jump section
+    TrackSegment(length=700, is_straight=False, corner_angle=180, corner_radius=50),  # Hairpin
+    TrackSegment(length=900, is_straight=True),
+    TrackSegment(length=500, is_straight=False, corner_angle=360, corner_radius=80),  # Corkscrew
+)
+
+
 def create_rainbow_road_track():
     """Create a Mario Kart Rainbow Road style track"""
-    segments = [
-        TrackSegment(length=1500, is_straight=True),    # Launch straight
-        TrackSegment(length=600, is_straight=False, corner_angle=270, corner_radius=100), # Loop
-        TrackSegment(length=800, is_straight=True),
-        TrackSegment(length=400, is_straight=False, corner_angle=90, corner_radius=150),  # Banking
-        TrackSegment(length=1000, is_straight=True),    # Jump section
-        TrackSegment(length=700, is_straight=False, corner_angle=180, corner_radius=50),  # Hairpin
-        TrackSegment(length=900, is_straight=True),
-        TrackSegment(length=500, is_straight=False, corner_angle=360, corner_radius=80),  # Corkscrew
-    ]
-    
     return RaceTrack(
         name="Rainbow Road",
         track_type=TrackType.MIXED_TRACK,
         total_length=7.4,
-        segments=segments,
+        segments=list(RAINBOW_ROAD_SEGMENTS),
         weather_conditions="clear"
     )
 
@@ -256,76 +262,73 @@ def main():
     print("Configure your race and watch LLMs compete!")
     print("=" * 50)
     
-    # Get race configuration
-    track = select_track()
-    laps = select_laps()
-    weather = select_weather()
-    num_drivers = select_drivers()
-    
-    # Update track weather
-    track.weather_conditions = weather
-    
-    # Create LLM drivers
+    # Create LLM drivers once; the simulator resets their cars and
+    # decision stats at the start of every race
     print("\n🤖 Creating LLM drivers...")
     all_drivers = create_llm_drivers()
-    drivers = all_drivers[:num_drivers]
-    
-    # Display race summary
-    print("\n📋 RACE CONFIGURATION:")
-    print("=" * 50)
-    print(f"Track: {track.name} ({track.total_length:.1f} km)")
-    print(f"Laps: {laps}")
-    print(f"Weather: {weather}")
-    print(f"Drivers: {num_drivers}")
-    print("\nDrivers lineup:")
-    for i, driver in enumerate(drivers, 1):
-        print(f"  {i}. {driver.name} - {driver.car.name}")
-    print("=" * 50)
-    
-    # Start race confirmation
-    input("\nPress ENTER to start the race! 🏁")
-    
-    # Graphics settings
-    graphics_settings = GraphicsSettings(
-        width=1200,
-        height=800,
-        fps=60,
-        show_telemetry=True,
-        show_ai_thoughts=True
-    )
-    
-    # Create and run simulator
-    print("\n🏁 STARTING RACE...")
-    simulator = LLMRaceSimulator(
-        track=track,
-        llm_drivers=drivers,
-        laps=laps,
-        enable_graphics=True,
-        graphics_settings=graphics_settings
-    )
-    
-    # Set the weather in the simulator
-    simulator.weather = weather
-    
-    # Run the race
-    results = simulator.simulate_race()
     
-    # Display results
-    if results and "finishing_order" in results:
-        print("\n🏆 RACE RESULTS:")
+    while True:
+        # Get race configuration
+        track = select_track()
+        laps = select_laps()
+        weather = select_weather()
+        num_drivers = select_drivers()
+        
+        # Update track weather
+        track.weather_conditions = weather
+        
+        drivers = all_drivers[:num_drivers]
+        
+        # Display race summary
+        print("\n📋 RACE CONFIGURATION:")
         print("=" * 50)
-        for driver in results["finishing_order"]:
-            position = driver["position"]
-            trophy = "🥇" if position == 1 else "🥈" if position == 2 else "🥉" if position == 3 else "🏁"
-            print(f"{trophy} P{position}: {driver['name']} ({driver['model']}) - {driver['total_time']:.2f}s")
+        print(f"Track: {track.name} ({track.total_length:.1f} km)")
+        print(f"Laps: {laps}")
+        print(f"Weather: {weather}")
+        print(f"Drivers: {num_drivers}")
+        print("\nDrivers lineup:")
+        for i, driver in enumerate(drivers, 1):
+            print(f"  {i}. {driver.name} - {driver.car.name}")
         print("=" * 50)
         
+        # Start race confirmation
+        input("\nPress ENTER to start the race! 🏁")
+        
+        # Graphics settings
+        graphics_settings = DEFAULT_GRAPHICS_SETTINGS
+        
+        # Create and run simulator
+        print("\n🏁 STARTING RACE...")
+        simulator = LLMRaceSimulator(
+            track=track,
+            llm_drivers=drivers,
+            laps=laps,
+            enable_graphics=True,
+            graphics_settings=graphics_settings
+        )
+        
+        # Set the weather in the simulator
+        simulator.weather = weather
+        
+        # Run the race
+        results = simulator.simulate_race()
+        
+        # Display results
+        if results and "finishing_order" in results:
+            print("\n🏆 RACE RESULTS:")
+            print("=" * 50)
+            for driver in results["finishing_order"]:
+                position = driver["position"]
+                trophy = "🥇" if position == 1 else "🥈" if position == 2 else "🥉" if position == 3 else "🏁"
+                print(f"{trophy} P{position}: {driver['name']} ({driver['model']}) - {driver['total_time']:.2f}s")
+            print("=" * 50)
+        else:
+            print("\n❌ Race was interrupted or failed to complete.")
+            break
+        
         # Ask if they want to race again
-        again = input("\nRace again? (y/n): ").strip().lower()
-        if again == 'y':
-            main()
-    else:
-        print("\n❌ Race was interrupted or failed to complete.")
+        if input("\nRace again? (y/n): ").strip().lower() != 'y':
+            break
 
 
 if __name__ == "__main__":
@@ -12,8 +12,8 @@ class IntelligentRaceSimulator(RaceSimulator):
     
     def __init__(self, track: RaceTrack, cars: List[RacingCar], laps: int = 10, 
                  enable_telemetry: bool = True, enable_intelligence: bool = True,
-                 prize_system: Optional[DataPrizeSystem] = None):
-        super().__init__(track, cars, laps, enable_telemetry)
+                 prize_system: Optional[DataPrizeSystem] = None, rng: Optional[random.Random] = None):
+        super().__init__(track, cars, laps, enable_telemetry, rng)
         
         self.enable_intelligence = enable_intelligence
         self.prize_system = prize_system
@@ -23,6 +23,12 @@ class IntelligentRaceSimulator(RaceSimulator):
         if enable_intelligence:
             for car in cars:
                 self.ai_systems[car.name] = RacingIntelligence(car, prize_system)
+        
+        # Strategy drifts slowly, so it is revisited once per second of race time
+        self.strategy_every = round(1.0 / self.time_step)
+        
+        # Race phase only depends on the lap a car is on
+        self.phase_by_lap = tuple(self._race_phase((lap + 1) / laps) for lap in range(laps))
                 
     def simulate_race(self) -> Dict:
         """Run race simulation with intelligent AI decisions"""
@@ -82,24 +88,28 @@ class IntelligentRaceSimulator(RaceSimulator):
                 tactical_speed = self._match_speed_ahead(car, target) * 1.01
             elif psych_tactic == "bait_mistakes":
                 # Vary speed to create fake opportunities
-                tactical_speed *= (0.98 + random.random() * 0.06)
+                tactical_speed *= (0.98 + self.rng.random() * 0.06)
                 
         return tactical_speed
     
-    def _analyze_race_situation(self, car: RacingCar) -> RaceSituation:
-        """Analyze current race situation for a car"""
-        # Determine race phase
-        progress = (car.current_lap + 1) / self.laps
+    @staticmethod
+    def _race_phase(progress: float) -> RacePhase:
+        """Race phase for the fraction of the race a car's current lap completes"""
         if progress < 0.1:
-            phase = RacePhase.START
+            return RacePhase.START
         elif progress < 0.3:
-            phase = RacePhase.EARLY
+            return RacePhase.EARLY
         elif progress < 0.7:
-            phase = RacePhase.MIDDLE
+            return RacePhase.MIDDLE
         elif progress < 0.9:
-            phase = RacePhase.LATE
+            return RacePhase.LATE
         else:
-            phase = RacePhase.FINAL
+            return RacePhase.FINAL
+    
+    def _analyze_race_situation(self, car: RacingCar) -> RaceSituation:
+        """Analyze current race situation for a car"""
+        # Determine race phase
+        phase = self.phase_by_lap[car.current_lap]
             
         # Calculate gaps
         position = self.current_positions[car.name] + 1
@@ -112,7 +122,7 @@ class IntelligentRaceSimulator(RaceSimulator):
         # Track position
         segment_idx, segment_pos = self._get_car_segment(car)
         segment = self.track.segments[segment_idx]
-        track_position = (car.distance_traveled % (self.track.total_length * 1000)) / (self.track.total_length * 1000)
+        track_position = (car.distance_traveled % self.track_length_m) / self.track_length_m
         
         return RaceSituation(
             phase=phase,
@@ -134,11 +144,10 @@ class IntelligentRaceSimulator(RaceSimulator):
             return 999.0
             
         # Find car ahead
-        for other_car in self.cars:
-            if self.current_positions[other_car.name] == position - 1:
-                distance_gap = other_car.distance_traveled - car.distance_traveled
-                if distance_gap > 0 and car.current_speed > 0:
-                    return distance_gap / (car.current_speed / 3.6)  # Convert to seconds
+        for other in self.cars_at_position[position - 1]:
+            distance_gap = self.car_distances[other] - car.distance_traveled
+            if distance_gap > 0 and car.current_speed > 0:
+                return distance_gap / (car.current_speed / 3.6)  # Convert to seconds
                     
         return 999.0
     
@@ -149,38 +158,43 @@ class IntelligentRaceSimulator(RaceSimulator):
             return 999.0
             
         # Find car behind
-        for other_car in self.cars:
-            if self.current_positions[other_car.name] == position + 1:
-                distance_gap = car.distance_traveled - other_car.distance_traveled
-                if distance_gap > 0 and other_car.current_speed > 0:
-                    return distance_gap / (other_car.current_speed / 3.6)
+        for other in self.cars_at_position[position + 1]:
+            distance_gap = car.distance_traveled - self.car_distances[other]
+            other_speed = self.car_speeds[other]
+            if distance_gap > 0 and other_speed > 0:
+                return distance_gap / (other_speed / 3.6)
                     
         return 999.0
     
     def _find_nearby_competitors(self, car: RacingCar, threshold_seconds: float) -> List[str]:
-        """Find competitors within threshold seconds"""
-        nearby = []
+        """Find competitors within threshold seconds, closest first"""
+        index = self.car_index[car.name]
+        distances = self.car_distances
+        speeds = self.car_speeds
+        car_distance = distances[index]
+        car_speed = speeds[index]
         
-        for other_car in self.cars:
-            if other_car.name == car.name:
+        nearby = []
+        for other in range(len(distances)):
+            if other == index:
                 continue
                 
-            distance_gap = abs(other_car.distance_traveled - car.distance_traveled)
-            avg_speed = (car.current_speed + other_car.current_speed) / 2
+            distance_gap = abs(distances[other] - car_distance)
+            avg_speed = (car_speed + speeds[other]) / 2
             
-            if avg_speed > 0:
-                time_gap = distance_gap / (avg_speed / 3.6)
-                if time_gap <= threshold_seconds:
-                    nearby.append(other_car.name)
-                    
-        return sorted(nearby, key=lambda n: abs(next(c.distance_traveled for c in self.cars if c.name == n) - car.distance_traveled))
+            if avg_speed > 0 and distance_gap / (avg_speed / 3.6) <= threshold_seconds:
+                nearby.append((distance_gap, other))
+        
+        # Ties keep grid order, as the index breaks them
+        nearby.sort()
+        return [self.car_names[other] for _, other in nearby]
     
     def _match_speed_ahead(self, car: RacingCar, target_name: str) -> float:
         """Match speed of car ahead for pressure tactics"""
-        for other_car in self.cars:
-            if other_car.name == target_name:
-                return other_car.current_speed
-        return car.current_speed
+        index = self.car_index.get(target_name)
+        if index is None:
+            return car.current_speed
+        return self.car_speeds[index]
     
     def _attempt_overtake(self, car: RacingCar, situation: RaceSituation, advice):
         """Handle overtaking attempt"""
@@ -210,7 +224,7 @@ class IntelligentRaceSimulator(RaceSimulator):
                     success_prob *= 0.7
                     
         # Attempt overtake
-        if random.random() < success_prob:
+        if self.rng.random() < success_prob:
             # Successful overtake
             self._execute_overtake(car, target_name)
             ai.learn_from_outcome(True, True, target_name)
@@ -238,20 +252,22 @@ class IntelligentRaceSimulator(RaceSimulator):
     def _execute_overtake(self, overtaker: RacingCar, target_name: str):
         """Execute a successful overtake"""
         # Find target car
-        target_car = next(c for c in self.cars if c.name == target_name)
+        target_car = self.cars_by_name[target_name]
         
         # Swap positions if overtaker is behind
         if overtaker.distance_traveled < target_car.distance_traveled:
             # Boost overtaker slightly ahead
             boost_distance = 5  # meters
             overtaker.distance_traveled = target_car.distance_traveled + boost_distance
+            # Later gap checks this step should see the move
+            self.car_distances[self.car_index[overtaker.name]] = overtaker.distance_traveled
             
     def _update_positions(self):
         """Update positions and track AI strategy adjustments"""
         super()._update_positions()
         
         # Update AI strategies based on current positions
-        if self.enable_intelligence:
+        if self.enable_intelligence and self.tick % self.strategy_every == 0:
             for car in self.cars:
                 if car.name in self.ai_systems and car.name not in self.finished_cars:
                     ai = self.ai_systems[car.name]
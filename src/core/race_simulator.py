@@ -1,7 +1,8 @@
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import random
 import math
+from bisect import bisect_right, insort
 from .racing_car import RacingCar, DriverStyle
 from .race_track import RaceTrack, TrackSegment
 from ..systems.telemetry import TelemetrySystem, TelemetrySnapshot
@@ -17,20 +18,48 @@ class RaceEvent:
 
 
 class RaceSimulator:
-    def __init__(self, track: RaceTrack, cars: List[RacingCar], laps: int = 10, enable_telemetry: bool = True):
+    def __init__(self, track: RaceTrack, cars: List[RacingCar], laps: int = 10, enable_telemetry: bool = True,
+                 rng: Optional[random.Random] = None):
         self.track = track
         self.cars = cars
+        self.cars_by_name = {car.name: car for car in cars}
+        self.car_index = {car.name: i for i, car in enumerate(cars)}
+        self.car_names = [car.name for car in cars]
+        # Start-of-step car state in parallel lists indexed like self.cars, so
+        # code comparing cars reads columns instead of rescanning car objects.
+        # The RacingCar objects stay authoritative; these are refreshed every step.
+        self.car_distances = [car.distance_traveled for car in cars]
+        self.car_speeds = [car.current_speed for car in cars]
         self.laps = laps
         self.current_positions = {car.name: i for i, car in enumerate(cars)}
+        # Inverse of current_positions: indices into self.cars held at each position.
+        # Finished cars keep their position, so a slot can briefly hold more than one.
+        self.cars_at_position = [[i] for i in range(len(cars))]
+        # Car indices in distance order as of the last position update
+        self.position_order = list(range(len(cars)))
         self.lap_times = {car.name: [] for car in cars}
+        self.lap_start_times = {car.name: 0.0 for car in cars}  # race time each car began its current lap
         self.events = []
+        self.low_fuel_cars = set()  # cars already reported as running on fumes
         self.time_step = 0.1  # seconds
+        # Every race roll comes from this generator; pass a seeded one for a repeatable race
+        self.rng = rng if rng is not None else random.Random()
         self.race_time = 0.0
+        self.tick = 0  # steps simulated so far
+        self.print_every = round(10.0 / self.time_step)  # standings every 10 seconds
         self.finished_cars = []
+        self.track_length_m = track.total_length * 1000
+        # Distance (m) at which each lap ends, indexed by the car's completed lap count
+        # (at least one lap, so a laps=0 race still ends once each car completes a lap)
+        self.lap_ends = tuple(self.track_length_m * lap + self.track_length_m for lap in range(max(laps, 1)))
+        # Each car's speed policy, specialized for the style it was built for:
+        # car name -> (driver_style, decide); rebuilt if a car's style changes
+        self.style_decisions = {car.name: (car.driver_style, self._build_style_decision(car)) for car in cars}
         
         # Initialize telemetry system
         self.enable_telemetry = enable_telemetry
         self.telemetry = TelemetrySystem() if enable_telemetry else None
+        self.telemetry_every = max(1, round(self.telemetry.sampling_rate / self.time_step)) if self.telemetry else 0
         self.car_fuel_at_start = {car.name: car.fuel_level for car in cars}
         
     def simulate_race(self) -> Dict:
@@ -53,13 +82,23 @@ class RaceSimulator:
             self._simulate_time_step()
             
             # Print updates every 10 seconds
-            if int(self.race_time) % 10 == 0 and int(self.race_time * 10) % 100 == 0:
+            if self.tick % self.print_every == 0:
                 self._print_race_update()
         
         return self._compile_race_results()
     
     def _simulate_time_step(self):
         """Simulate one time step of the race"""
+        self.tick += 1
+        self._refresh_car_state()
+        record_telemetry = self.telemetry is not None and self.tick % self.telemetry_every == 0
+        
+        # Weather is fixed for the step, so look it up once for every car
+        weather_speed = self.track.get_weather_modifiers()["speed"]
+        straight_speed = 400.0 * weather_speed  # Same target on every straight
+        speed_scales = self.track.segment_speed_scales
+        sqrt = math.sqrt
+        
         # Update each car
         for car in self.cars:
             if car.name in self.finished_cars:
@@ -68,31 +107,34 @@ class RaceSimulator:
             # Get current segment
             segment_index, segment_position = self._get_car_segment(car)
             segment = self.track.segments[segment_index]
+            is_straight = self.track.segment_is_straight[segment_index]
             
-            # Calculate target speed for segment
-            weather_mod = self.track.get_weather_modifiers()
-            optimal_speed = segment.get_optimal_speed(car.get_effective_handling())
-            optimal_speed *= weather_mod["speed"]
+            # Calculate target speed for segment (TrackSegment.get_optimal_speed
+            # from the track's precomputed per-segment scales)
+            if is_straight:
+                optimal_speed = straight_speed
+            else:
+                optimal_speed = min(sqrt(car.get_effective_handling()) * speed_scales[segment_index], 300)
+                optimal_speed *= weather_speed
             
             # Apply driver style decisions
             target_speed = self._apply_driver_style_decision(car, optimal_speed, segment)
             
-            # Update car physics
+            # Update car physics, position, fuel and tires in one step
             previous_speed = car.current_speed
-            car.accelerate(target_speed, self.time_step)
-            
-            # Calculate distance traveled
-            avg_speed = (previous_speed + car.current_speed) / 2
-            distance = (avg_speed / 3.6) * self.time_step  # Convert km/h to m/s
-            
-            # Update car position
-            car.distance_traveled += distance
+            fuel_level = car.fuel_level
+            tire_wear = car.tire_wear
+            if is_straight:
+                aggressive_factor, cornering_stress = 1.0, 1.0
+            else:
+                aggressive_factor, cornering_stress = 1.3, 2.0
+            car.step(target_speed, self.time_step, aggressive_factor, cornering_stress)
             
             # Record telemetry snapshot
-            if self.telemetry and int(self.race_time * 10) % int(self.telemetry.sampling_rate * 10) == 0:
+            if record_telemetry:
                 corner_entry = None
                 corner_exit = None
-                if not segment.is_straight:
+                if not is_straight:
                     # Track corner entry and exit speeds
                     corner_entry = car.current_speed if segment_position < segment.length * 0.5 else None
                     corner_exit = car.current_speed if segment_position > segment.length * 0.5 else None
@@ -102,8 +144,8 @@ class RaceSimulator:
                     position=self.current_positions[car.name] + 1,
                     speed=car.current_speed,
                     acceleration=(car.current_speed - previous_speed) / self.time_step,
-                    fuel_level=car.fuel_level,
-                    tire_wear=car.tire_wear,
+                    fuel_level=fuel_level,
+                    tire_wear=tire_wear,
                     distance_traveled=car.distance_traveled,
                     lap_number=car.current_lap,
                     segment_index=segment_index,
@@ -113,20 +155,14 @@ class RaceSimulator:
                 )
                 self.telemetry.record_snapshot(car.name, snapshot)
             
-            # Update fuel and tires
-            aggressive_factor = 1.0 if segment.is_straight else 1.3
-            car.consume_fuel(distance / 1000, aggressive_factor)
-            
-            cornering_stress = 1.0 if segment.is_straight else 2.0
-            car.wear_tires(distance / 1000, cornering_stress)
-            
             # Check for events
             self._check_for_events(car, segment)
             
             # Update lap count
-            if car.distance_traveled >= self.track.total_length * 1000 * car.current_lap + self.track.total_length * 1000:
+            if car.distance_traveled >= self.lap_ends[car.current_lap]:
                 car.current_lap += 1
-                lap_time = self.race_time - sum(self.lap_times[car.name])
+                lap_time = self.race_time - self.lap_start_times[car.name]
+                self.lap_start_times[car.name] = self.race_time
                 self.lap_times[car.name].append(lap_time)
                 
                 self.events.append(RaceEvent(
@@ -152,64 +188,80 @@ class RaceSimulator:
         # Update positions based on distance
         self._update_positions()
     
+    def _refresh_car_state(self):
+        """Copy every car's distance and speed into the per-step columns"""
+        self.car_distances = [car.distance_traveled for car in self.cars]
+        self.car_speeds = [car.current_speed for car in self.cars]
+    
     def _get_car_segment(self, car: RacingCar) -> Tuple[int, float]:
         """Determine which track segment the car is currently on"""
-        distance_in_lap = car.distance_traveled % (self.track.total_length * 1000)
+        distance_in_lap = car.distance_traveled % self.track_length_m
         
-        cumulative_distance = 0
-        for i, segment in enumerate(self.track.segments):
-            if cumulative_distance + segment.length > distance_in_lap:
-                position_in_segment = distance_in_lap - cumulative_distance
-                return i, position_in_segment
-            cumulative_distance += segment.length
+        segment_ends = self.track.segment_ends
+        i = bisect_right(segment_ends, distance_in_lap)
+        if i < len(segment_ends):
+            return i, distance_in_lap - (segment_ends[i - 1] if i else 0)
         
         # Should not reach here, but return last segment if it does
-        return len(self.track.segments) - 1, 0
+        return len(segment_ends) - 1, 0
     
-    def _apply_driver_style_decision(self, car: RacingCar, optimal_speed: float, segment: TrackSegment) -> float:
-        """Apply driver personality to speed decisions"""
-        style_mod = car.get_style_modifiers()
-        risk_factor = style_mod["risk_factor"]
+    def _build_style_decision(self, car: RacingCar) -> Callable[[float, bool], float]:
+        """Specialize the driver-style speed policy for one car.
         
+        Returns a function of (optimal speed, segment is straight) with the
+        style's branch and factors already bound.
+        """
         if car.driver_style == DriverStyle.AGGRESSIVE:
             # Push beyond optimal, especially on straights
-            if segment.is_straight:
-                return min(optimal_speed * 1.1, car.get_effective_top_speed())
-            else:
-                return optimal_speed * (0.95 + risk_factor * 0.05)
+            corner_factor = 0.95 + car.get_style_factors().risk_factor * 0.05
+            def decide(optimal_speed, is_straight):
+                if is_straight:
+                    return min(optimal_speed * 1.1, car.get_effective_top_speed())
+                return optimal_speed * corner_factor
                 
         elif car.driver_style == DriverStyle.CONSERVATIVE:
             # Stay safely below optimal
-            return optimal_speed * 0.92
+            def decide(optimal_speed, is_straight):
+                return optimal_speed * 0.92
             
         elif car.driver_style == DriverStyle.TECHNICAL:
             # Perfect optimal speed in corners, push on straights
-            if segment.is_straight:
-                return min(optimal_speed * 1.05, car.get_effective_top_speed())
-            else:
+            def decide(optimal_speed, is_straight):
+                if is_straight:
+                    return min(optimal_speed * 1.05, car.get_effective_top_speed())
                 return optimal_speed
                 
         elif car.driver_style == DriverStyle.CHAOTIC:
             # Random variations
-            variation = random.uniform(0.85, 1.15)
-            return optimal_speed * variation
+            def decide(optimal_speed, is_straight):
+                return optimal_speed * self.rng.uniform(0.85, 1.15)
             
         else:  # BALANCED
             # Slight push beyond optimal
-            return optimal_speed * 1.02
+            def decide(optimal_speed, is_straight):
+                return optimal_speed * 1.02
+        
+        return decide
+    
+    def _apply_driver_style_decision(self, car: RacingCar, optimal_speed: float, segment: TrackSegment) -> float:
+        """Apply driver personality to speed decisions"""
+        style, decide = self.style_decisions.get(car.name, (None, None))
+        if style is not car.driver_style:
+            decide = self._build_style_decision(car)
+            self.style_decisions[car.name] = (car.driver_style, decide)
+        return decide(optimal_speed, segment.is_straight)
     
     def _check_for_events(self, car: RacingCar, segment: TrackSegment):
         """Check for race events (crashes, mechanical issues, etc.)"""
-        style_mod = car.get_style_modifiers()
-        risk_factor = style_mod["risk_factor"]
-        
-        # Check for crashes (more likely in corners with high risk)
-        if not segment.is_straight:
+        # Check for crashes (more likely in corners with high risk); drivers at or
+        # below neutral risk have no crash chance, so they skip the roll entirely
+        risk_factor = car.get_style_factors().risk_factor
+        if risk_factor > 1.0 and not segment.is_straight:
             crash_chance = (risk_factor - 1.0) * 0.001 * (100 - car.tire_wear) / 100
             if car.current_speed > segment.get_optimal_speed(car.get_effective_handling()) * 1.2:
                 crash_chance *= 3
                 
-            if random.random() < crash_chance:
+            if self.rng.random() < crash_chance:
                 car.current_speed = 0
                 self.events.append(RaceEvent(
                     self.race_time,
@@ -220,41 +272,54 @@ class RaceSimulator:
                 if self.telemetry:
                     self.telemetry.record_incident(car.name, "CRASH")
         
-        # Check for fuel issues
+        # Check for fuel issues, reporting each time a car drops onto fumes
         if car.fuel_level < 5:
-            self.events.append(RaceEvent(
-                self.race_time,
-                "LOW_FUEL",
-                car.name,
-                f"Running on fumes! Speed limited."
-            ))
+            if car.name not in self.low_fuel_cars:
+                self.low_fuel_cars.add(car.name)
+                self.events.append(RaceEvent(
+                    self.race_time,
+                    "LOW_FUEL",
+                    car.name,
+                    f"Running on fumes! Speed limited."
+                ))
             car.current_speed = min(car.current_speed, 150)
+        else:
+            self.low_fuel_cars.discard(car.name)
     
     def _update_positions(self):
         """Update race positions based on distance traveled"""
         # Sort cars by distance traveled (accounting for laps)
-        car_distances = [(car.name, car.distance_traveled) for car in self.cars]
-        car_distances.sort(key=lambda x: x[1], reverse=True)
+        cars = self.cars
+        distances = [car.distance_traveled for car in cars]
+        order = sorted(range(len(cars)), key=distances.__getitem__, reverse=True)
+        
+        # Unfinished cars already hold their slot in the previous order, so an
+        # unchanged order means no positions change and nobody was overtaken
+        if order == self.position_order:
+            return
+        self.position_order = order
         
-        for position, (car_name, _) in enumerate(car_distances):
+        for new_position, index in enumerate(order):
+            car_name = cars[index].name
             old_position = self.current_positions[car_name]
-            new_position = position
             
             if old_position != new_position and car_name not in self.finished_cars:
                 self.current_positions[car_name] = new_position
+                left_behind = self.cars_at_position[old_position]
+                left_behind.remove(index)
+                insort(self.cars_at_position[new_position], index)
                 
-                # Find who was overtaken
-                for other_name, other_pos in self.current_positions.items():
-                    if other_pos == old_position and other_name != car_name:
-                        self.events.append(RaceEvent(
-                            self.race_time,
-                            "OVERTAKE",
-                            car_name,
-                            f"Overtook {other_name} for position {new_position + 1}"
-                        ))
-                        if self.telemetry:
-                            self.telemetry.record_overtake(car_name, other_name)
-                        break
+                # Whoever still holds the old position was overtaken
+                if left_behind:
+                    other_name = cars[left_behind[0]].name
+                    self.events.append(RaceEvent(
+                        self.race_time,
+                        "OVERTAKE",
+                        car_name,
+                        f"Overtook {other_name} for position {new_position + 1}"
+                    ))
+                    if self.telemetry:
+                        self.telemetry.record_overtake(car_name, other_name)
     
     def _print_race_update(self):
         """Print current race standings"""
@@ -279,7 +344,7 @@ class RaceSimulator:
         # Finalize telemetry for all cars
         if self.telemetry:
             for i, car_name in enumerate(self.finished_cars):
-                car = next(c for c in self.cars if c.name == car_name)
+                car = self.cars_by_name[car_name]
                 fuel_used = self.car_fuel_at_start[car_name] - car.fuel_level
                 self.telemetry.finalize_session(car_name, car.total_race_time, i + 1, fuel_used)
         
@@ -297,7 +362,7 @@ class RaceSimulator:
         
         # Final positions
         for i, car_name in enumerate(self.finished_cars):
-            car = next(c for c in self.cars if c.name == car_name)
+            car = self.cars_by_name[car_name]
             results["positions"][i + 1] = {
                 "name": car_name,
                 "driver_style": car.driver_style.value,
@@ -311,9 +376,11 @@ class RaceSimulator:
         fastest_time = float('inf')
         fastest_driver = None
         for car_name, times in self.lap_times.items():
-            if times and min(times) < fastest_time:
-                fastest_time = min(times)
-                fastest_driver = car_name
+            if times:
+                best_time = min(times)
+                if best_time < fastest_time:
+                    fastest_time = best_time
+                    fastest_driver = car_name
         
         results["fastest_lap"] = {
             "driver": fastest_driver,
@@ -1,6 +1,9 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, Optional, Tuple
 import math
 
 
@@ -11,6 +14,37 @@ class TrackType(Enum):
     ENDURANCE_TRACK = "endurance_track"
 
 
+# Performance modifiers per weather condition, shared read-only by every track
+WEATHER_MODIFIERS = {
+    "clear": MappingProxyType({"speed": 1.0, "handling": 1.0}),
+    "rain": MappingProxyType({"speed": 0.85, "handling": 0.7}),
+    "fog": MappingProxyType({"speed": 0.9, "handling": 0.85}),
+    "hot": MappingProxyType({"speed": 0.95, "handling": 0.95}),
+}
+
+
+def _with_slots(*extra: str):
+    """Rebuild a dataclass with __slots__ for its fields plus any extra names.
+    
+    Equivalent to dataclass(slots=True) on Python 3.10+, which this package
+    does not require. Field defaults live on in the generated __init__, so
+    the class attributes that would clash with the slots are dropped.
+    """
+    def wrap(cls):
+        names = tuple(field.name for field in fields(cls)) + extra
+        namespace = dict(cls.__dict__)
+        for name in names:
+            namespace.pop(name, None)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace["__slots__"] = names
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+    return wrap
+
+
+# Segments are built by the dozen for every track and only hold their fields
+# and the derived speed scale, so they carry no per-instance __dict__
+@_with_slots("speed_scale")
 @dataclass
 class TrackSegment:
     """Represents a segment of the track (straight, corner, etc.)"""
@@ -20,20 +54,132 @@ class TrackSegment:
     corner_radius: float = 0.0  # meters (0 for straights)
     elevation_change: float = 0.0  # meters
     
-    def get_optimal_speed(self, car_handling: float) -> float:
-        """Calculate optimal speed through this segment"""
+    def __post_init__(self):
+        # Everything in the cornering speed except the car's handling is fixed
+        # for the segment: optimal speed = sqrt(handling) * speed_scale
         if self.is_straight:
-            return 400.0  # Max speed on straights
+            self.speed_scale = 0.0
         else:
             # Cornering speed based on physics: v = sqrt(μ * g * r)
             # μ (friction coefficient) is approximated by car handling
             g = 9.81  # gravity
-            base_speed = math.sqrt(car_handling * g * self.corner_radius) * 3.6  # m/s to km/h
+            base_scale = math.sqrt(g * self.corner_radius) * 3.6  # m/s to km/h
             
             # Adjust for corner angle (sharper corners = slower)
             angle_factor = 1 - (abs(self.corner_angle) / 180) * 0.3
-            
-            return min(base_speed * angle_factor, 300)  # Cap at 300 km/h
+            self.speed_scale = base_scale * angle_factor
+    
+    def get_optimal_speed(self, car_handling: float) -> float:
+        """Calculate optimal speed through this segment"""
+        if self.is_straight:
+            return 400.0  # Max speed on straights
+        return min(math.sqrt(car_handling) * self.speed_scale, 300)  # Cap at 300 km/h
+
+
+def _segment_time(length: float, current_speed: float, target_speed: float,
+                  accel_rate: float) -> Tuple[float, float]:
+    """Time to cover a segment of some length (m) and the exit speed.
+    
+    accel_rate is the car's speed change in km/h per second (100 divided by
+    its 0-100 time). It is fixed for a lap, so callers compute it once and
+    pass it in for every segment.
+    """
+    # Simple physics model for segment traversal
+    avg_speed = (current_speed + target_speed) / 2
+    
+    # Time to reach target speed (or as close as possible within segment)
+    speed_delta = target_speed - current_speed
+    accel_time = (speed_delta if speed_delta >= 0 else -speed_delta) / accel_rate
+    accel_distance = avg_speed * accel_time / 3.6  # Convert to m/s
+    
+    if accel_distance >= length:
+        # Can't reach target speed in this segment
+        final_speed = current_speed + (length / accel_distance) * speed_delta
+        time = length / (avg_speed / 3.6)
+    else:
+        # Reach target speed then maintain
+        final_speed = target_speed
+        remaining_distance = length - accel_distance
+        maintain_time = remaining_distance / (target_speed / 3.6)
+        time = accel_time + maintain_time
+    
+    return time, final_speed
+
+
+# Preset layouts are built once and shared; segments are never mutated,
+# so each track only needs its own list
+@lru_cache(maxsize=None)
+def _speed_track_segments() -> Tuple[TrackSegment, ...]:
+    return (
+        TrackSegment(1200, True),  # Main straight
+        TrackSegment(150, False, corner_angle=45, corner_radius=80),
+        TrackSegment(800, True),
+        TrackSegment(200, False, corner_angle=90, corner_radius=60),
+        TrackSegment(600, True),
+        TrackSegment(100, False, corner_angle=30, corner_radius=100),
+        TrackSegment(1000, True),
+        TrackSegment(250, False, corner_angle=120, corner_radius=40),
+        TrackSegment(400, True),
+        TrackSegment(150, False, corner_angle=60, corner_radius=70),
+    )
+
+
+@lru_cache(maxsize=None)
+def _technical_track_segments() -> Tuple[TrackSegment, ...]:
+    return (
+        TrackSegment(300, True),  # Short main straight
+        TrackSegment(80, False, corner_angle=90, corner_radius=25),
+        TrackSegment(150, True),
+        TrackSegment(120, False, corner_angle=180, corner_radius=20),  # Hairpin
+        TrackSegment(200, True),
+        TrackSegment(100, False, corner_angle=75, corner_radius=35),
+        TrackSegment(180, True),
+        TrackSegment(150, False, corner_angle=135, corner_radius=30),
+        TrackSegment(250, True),
+        TrackSegment(90, False, corner_angle=60, corner_radius=40),
+        TrackSegment(160, True),
+        TrackSegment(110, False, corner_angle=90, corner_radius=30),
+        TrackSegment(140, True),
+        TrackSegment(130, False, corner_angle=120, corner_radius=25),
+    )
+
+
+@lru_cache(maxsize=None)
+def _mixed_track_segments() -> Tuple[TrackSegment, ...]:
+    return (
+        TrackSegment(800, True),  # Good straight
+        TrackSegment(180, False, corner_angle=90, corner_radius=50),
+        TrackSegment(400, True),
+        TrackSegment(200, False, corner_angle=135, corner_radius=35),
+        TrackSegment(600, True),
+        TrackSegment(150, False, corner_angle=60, corner_radius=60),
+        TrackSegment(350, True),
+        TrackSegment(250, False, corner_angle=180, corner_radius=25),  # Hairpin
+        TrackSegment(500, True),
+        TrackSegment(170, False, corner_angle=75, corner_radius=55),
+        TrackSegment(700, True),
+        TrackSegment(140, False, corner_angle=45, corner_radius=70),
+    )
+
+
+@lru_cache(maxsize=None)
+def _endurance_track_segments() -> Tuple[TrackSegment, ...]:
+    return (
+        TrackSegment(2000, True),  # Very long straight
+        TrackSegment(200, False, corner_angle=70, corner_radius=60),
+        TrackSegment(1500, True),
+        TrackSegment(300, False, corner_angle=90, corner_radius=40),
+        TrackSegment(800, True),
+        TrackSegment(180, False, corner_angle=120, corner_radius=35),
+        TrackSegment(1200, True),
+        TrackSegment(250, False, corner_angle=45, corner_radius=80),
+        TrackSegment(900, True),
+        TrackSegment(220, False, corner_angle=135, corner_radius=30),
+        TrackSegment(600, True),
+        TrackSegment(150, False, corner_angle=60, corner_radius=65),
+        TrackSegment(1800, True),
+        TrackSegment(280, False, corner_angle=90, corner_radius=45),
+    )
 
 
 @dataclass
@@ -46,11 +192,36 @@ class RaceTrack:
     weather_conditions: str = "clear"
     
     def __post_init__(self):
-        # Calculate actual total length from segments
-        actual_length = sum(segment.length for segment in self.segments) / 1000
+        # Column view of the segments (struct-of-arrays) for per-tick code
+        # that needs one field across the whole lap
+        self.segment_lengths = tuple(segment.length for segment in self.segments)
+        self.segment_is_straight = tuple(segment.is_straight for segment in self.segments)
+        self.segment_corner_angles = tuple(segment.corner_angle for segment in self.segments)
+        self.segment_corner_radii = tuple(segment.corner_radius for segment in self.segments)
+        self.segment_elevation_changes = tuple(segment.elevation_change for segment in self.segments)
+        self.segment_speed_scales = tuple(segment.speed_scale for segment in self.segments)
+        # Lap distance (m) at which each segment ends, for bisecting a car onto its segment
+        self.segment_ends = tuple(accumulate(self.segment_lengths))
+        
+        # Calculate actual total length from segments (the last segment's end)
+        actual_length = (self.segment_ends[-1] if self.segment_ends else 0) / 1000
         if abs(actual_length - self.total_length) > 0.1:
             self.total_length = actual_length
     
+    @classmethod
+    def from_arrays(cls, name: str, track_type: TrackType, lengths: List[float],
+                    is_straight: List[bool], corner_angles: List[float],
+                    corner_radii: List[float], elevation_changes: Optional[List[float]] = None,
+                    **kwargs) -> "RaceTrack":
+        """Create a track from parallel per-segment columns"""
+        if elevation_changes is None:
+            elevation_changes = [0.0] * len(lengths)
+        segments = [TrackSegment(length, straight, corner_angle=angle, corner_radius=radius,
+                                 elevation_change=elevation)
+                    for length, straight, angle, radius, elevation
+                    in zip(lengths, is_straight, corner_angles, corner_radii, elevation_changes)]
+        return cls(name, track_type, sum(lengths) / 1000, segments, **kwargs)
+    
     def get_track_characteristics(self):
         """Get track characteristics based on type"""
         characteristics = {
@@ -88,110 +259,52 @@ class RaceTrack:
     @classmethod
     def create_speed_track(cls, name: str = "Monza Speed Circuit"):
         """Create a speed-focused track with long straights"""
-        segments = [
-            TrackSegment(1200, True),  # Main straight
-            TrackSegment(150, False, corner_angle=45, corner_radius=80),
-            TrackSegment(800, True),
-            TrackSegment(200, False, corner_angle=90, corner_radius=60),
-            TrackSegment(600, True),
-            TrackSegment(100, False, corner_angle=30, corner_radius=100),
-            TrackSegment(1000, True),
-            TrackSegment(250, False, corner_angle=120, corner_radius=40),
-            TrackSegment(400, True),
-            TrackSegment(150, False, corner_angle=60, corner_radius=70),
-        ]
-        return cls(name, TrackType.SPEED_TRACK, 5.65, segments)
+        return cls(name, TrackType.SPEED_TRACK, 5.65, list(_speed_track_segments()))
     
     @classmethod
     def create_technical_track(cls, name: str = "Monaco Technical Circuit"):
         """Create a technical track with many tight corners"""
-        segments = [
-            TrackSegment(300, True),  # Short main straight
-            TrackSegment(80, False, corner_angle=90, corner_radius=25),
-            TrackSegment(150, True),
-            TrackSegment(120, False, corner_angle=180, corner_radius=20),  # Hairpin
-            TrackSegment(200, True),
-            TrackSegment(100, False, corner_angle=75, corner_radius=35),
-            TrackSegment(180, True),
-            TrackSegment(150, False, corner_angle=135, corner_radius=30),
-            TrackSegment(250, True),
-            TrackSegment(90, False, corner_angle=60, corner_radius=40),
-            TrackSegment(160, True),
-            TrackSegment(110, False, corner_angle=90, corner_radius=30),
-            TrackSegment(140, True),
-            TrackSegment(130, False, corner_angle=120, corner_radius=25),
-        ]
-        return cls(name, TrackType.TECHNICAL_TRACK, 2.08, segments)
+        return cls(name, TrackType.TECHNICAL_TRACK, 2.08, list(_technical_track_segments()))
     
     @classmethod
     def create_mixed_track(cls, name: str = "Silverstone Mixed Circuit"):
         """Create a balanced track with varied challenges"""
-        segments = [
-            TrackSegment(800, True),  # Good straight
-            TrackSegment(180, False, corner_angle=90, corner_radius=50),
-            TrackSegment(400, True),
-            TrackSegment(200, False, corner_angle=135, corner_radius=35),
-            TrackSegment(600, True),
-            TrackSegment(150, False, corner_angle=60, corner_radius=60),
-            TrackSegment(350, True),
-            TrackSegment(250, False, corner_angle=180, corner_radius=25),  # Hairpin
-            TrackSegment(500, True),
-            TrackSegment(170, False, corner_angle=75, corner_radius=55),
-            TrackSegment(700, True),
-            TrackSegment(140, False, corner_angle=45, corner_radius=70),
-        ]
-        return cls(name, TrackType.MIXED_TRACK, 4.49, segments)
+        return cls(name, TrackType.MIXED_TRACK, 4.49, list(_mixed_track_segments()))
     
     @classmethod
     def create_endurance_track(cls, name: str = "Le Mans Endurance Circuit"):
         """Create a long endurance track"""
-        segments = [
-            TrackSegment(2000, True),  # Very long straight
-            TrackSegment(200, False, corner_angle=70, corner_radius=60),
-            TrackSegment(1500, True),
-            TrackSegment(300, False, corner_angle=90, corner_radius=40),
-            TrackSegment(800, True),
-            TrackSegment(180, False, corner_angle=120, corner_radius=35),
-            TrackSegment(1200, True),
-            TrackSegment(250, False, corner_angle=45, corner_radius=80),
-            TrackSegment(900, True),
-            TrackSegment(220, False, corner_angle=135, corner_radius=30),
-            TrackSegment(600, True),
-            TrackSegment(150, False, corner_angle=60, corner_radius=65),
-            TrackSegment(1800, True),
-            TrackSegment(280, False, corner_angle=90, corner_radius=45),
-        ]
-        return cls(name, TrackType.ENDURANCE_TRACK, 10.48, segments)
+        return cls(name, TrackType.ENDURANCE_TRACK, 10.48, list(_endurance_track_segments()))
+    
+    def clone(self) -> "RaceTrack":
+        """Copy this track with its own segment list"""
+        return replace(self, segments=list(self.segments))
     
     def calculate_segment_time(self, segment: TrackSegment, current_speed: float, 
                              target_speed: float, car_acceleration: float) -> Tuple[float, float]:
         """Calculate time to complete a segment and exit speed"""
-        # Simple physics model for segment traversal
-        avg_speed = (current_speed + target_speed) / 2
-        
-        # Time to reach target speed (or as close as possible within segment)
-        accel_time = abs(target_speed - current_speed) / (100 / car_acceleration)
-        accel_distance = avg_speed * accel_time / 3.6  # Convert to m/s
-        
-        if accel_distance >= segment.length:
-            # Can't reach target speed in this segment
-            final_speed = current_speed + (segment.length / accel_distance) * (target_speed - current_speed)
-            time = segment.length / (avg_speed / 3.6)
-        else:
-            # Reach target speed then maintain
-            final_speed = target_speed
-            remaining_distance = segment.length - accel_distance
-            maintain_time = remaining_distance / (target_speed / 3.6)
-            time = accel_time + maintain_time
+        return _segment_time(segment.length, current_speed, target_speed, 100 / car_acceleration)
+    
+    def get_optimal_speeds(self, car_handling: float) -> Tuple[float, ...]:
+        """Optimal speed through every segment of the lap for one handling value"""
+        handling_root = math.sqrt(car_handling)
+        return tuple(400.0 if straight else min(handling_root * scale, 300)
+                     for straight, scale in zip(self.segment_is_straight, self.segment_speed_scales))
+    
+    def calculate_lap_time(self, initial_speed: float, target_speeds: List[float],
+                           car_acceleration: float) -> Tuple[float, float]:
+        """Calculate time to complete a whole lap and the speed it ends at.
         
-        return time, final_speed
+        target_speeds holds one target per segment, e.g. from get_optimal_speeds().
+        """
+        accel_rate = 100 / car_acceleration
+        lap_time = 0.0
+        speed = initial_speed
+        for length, target_speed in zip(self.segment_lengths, target_speeds):
+            time, speed = _segment_time(length, speed, target_speed, accel_rate)
+            lap_time += time
+        return lap_time, speed
     
     def get_weather_modifiers(self):
         """Get performance modifiers based on weather"""
-        modifiers = {
-            "clear": {"speed": 1.0, "handling": 1.0},
-            "rain": {"speed": 0.85, "handling": 0.7},
-            "fog": {"speed": 0.9, "handling": 0.85},
-            "hot": {"speed": 0.95, "handling": 0.95},
-        }
-        return modifiers.get(self.weather_conditions, modifiers["clear"])
\ No newline at end of file
+        return WEATHER_MODIFIERS.get(self.weather_conditions, WEATHER_MODIFIERS["clear"])
\ No newline at end of file
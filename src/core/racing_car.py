@@ -1,6 +1,8 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 import math
 
 
@@ -12,6 +14,114 @@ class DriverStyle(Enum):
     CHAOTIC = "chaotic"
 
 
+class StyleModifiers(NamedTuple):
+    """Performance modifiers for one driver style"""
+    speed_bonus: float
+    acceleration_bonus: float
+    handling_penalty: float
+    fuel_penalty: float
+    risk_factor: float
+
+
+# Performance modifiers per driver style, shared read-only by every car
+STYLE_FACTORS = {
+    DriverStyle.AGGRESSIVE: StyleModifiers(
+        speed_bonus=1.05,
+        acceleration_bonus=1.08,
+        handling_penalty=0.92,
+        fuel_penalty=0.85,
+        risk_factor=1.3
+    ),
+    DriverStyle.CONSERVATIVE: StyleModifiers(
+        speed_bonus=0.95,
+        acceleration_bonus=0.92,
+        handling_penalty=1.05,
+        fuel_penalty=1.1,
+        risk_factor=0.7
+    ),
+    DriverStyle.BALANCED: StyleModifiers(
+        speed_bonus=1.0,
+        acceleration_bonus=1.0,
+        handling_penalty=1.0,
+        fuel_penalty=1.0,
+        risk_factor=1.0
+    ),
+    DriverStyle.TECHNICAL: StyleModifiers(
+        speed_bonus=0.98,
+        acceleration_bonus=0.95,
+        handling_penalty=1.12,
+        fuel_penalty=1.05,
+        risk_factor=0.8
+    ),
+    DriverStyle.CHAOTIC: StyleModifiers(
+        speed_bonus=1.02,
+        acceleration_bonus=1.05,
+        handling_penalty=0.88,
+        fuel_penalty=0.9,
+        risk_factor=1.5
+    )
+}
+
+# Read-only name -> value views of the same rows, for callers that look
+# modifiers up by key
+STYLE_MODIFIERS = {
+    style: MappingProxyType(factors._asdict()) for style, factors in STYLE_FACTORS.items()
+}
+
+
+# Overtaking opportunity and risk per track section
+SECTION_FACTORS = {
+    "straight": MappingProxyType({"opportunity": 1.0, "risk": 0.3}),
+    "corner": MappingProxyType({"opportunity": 0.6, "risk": 0.8}),
+    "chicane": MappingProxyType({"opportunity": 0.4, "risk": 1.2}),
+    "long_corner": MappingProxyType({"opportunity": 0.7, "risk": 0.6})
+}
+
+# Weather effects on car performance for strategic assessment
+WEATHER_EFFECTS = {
+    "clear": MappingProxyType({"speed": 1.0, "handling": 1.0, "tire_wear": 1.0, "risk": 1.0}),
+    "rain": MappingProxyType({"speed": 0.85, "handling": 0.7, "tire_wear": 0.8, "risk": 1.5}),
+    "heavy_rain": MappingProxyType({"speed": 0.7, "handling": 0.5, "tire_wear": 0.6, "risk": 2.0}),
+    "fog": MappingProxyType({"speed": 0.9, "handling": 0.9, "tire_wear": 1.0, "risk": 1.3}),
+    "wind": MappingProxyType({"speed": 0.95, "handling": 0.85, "tire_wear": 1.1, "risk": 1.1})
+}
+
+
+def physics_step(speed: float, fuel: float, wear: float, target_speed: float,
+                 time_delta: float, acceleration: float, acceleration_bonus: float,
+                 fuel_efficiency: float, risk_factor: float,
+                 aggressive_factor: float = 1.0, cornering_stress: float = 1.0):
+    """Advance one car by one time step.
+
+    Same arithmetic as accelerate, consume_fuel and wear_tires run in turn,
+    on plain floats. Returns (speed, fuel, wear, distance) with the distance
+    in metres.
+    """
+    # Accelerate (lighter car accelerates faster)
+    fuel_bonus = 1 + ((100 - fuel) / 500)
+    max_change = 100 / (acceleration / (acceleration_bonus * fuel_bonus)) * time_delta
+    # One clamp of the speed change to [-1.5 * max_change, max_change]
+    # (braking is stronger), using comparisons rather than min()/max() calls
+    brake_limit = -1.5 * max_change
+    speed_change = target_speed - speed
+    if speed_change > max_change:
+        speed_change = max_change
+    elif speed_change < brake_limit:
+        speed_change = brake_limit
+    new_speed = speed + speed_change
+    if new_speed <= 0:
+        new_speed = 0
+    
+    # Distance from the average of start and end speeds (km/h to m/s)
+    distance = ((speed + new_speed) / 2 / 3.6) * time_delta
+    km = distance / 1000
+    
+    # Fuel as a percentage of a 60L tank, tire wear at 0.1% per km
+    fuel = max(0, fuel - (km / fuel_efficiency * aggressive_factor / 60) * 100)
+    wear = min(100, wear + km / 1000 * cornering_stress * risk_factor)
+    return new_speed, fuel, wear, distance
+
+
 @dataclass
 class RacingCar:
     name: str
@@ -31,6 +141,8 @@ class RacingCar:
     tire_wear: float = 0.0  # 0-100 scale
     distance_traveled: float = 0.0
     
+    _style_factors = None  # Set by _fold_style once __post_init__ runs
+    
     def __post_init__(self):
         # Validate inputs
         if not 150 <= self.top_speed <= 400:
@@ -41,89 +153,70 @@ class RacingCar:
             raise ValueError("Handling must be between 0 and 1")
         if not 5 <= self.fuel_efficiency <= 20:
             raise ValueError("Fuel efficiency must be between 5 and 20 km/l")
+        
+        self._fold_style()
+    
+    def _fold_style(self):
+        """Fold the constant part of each effective stat from base stats and style.
+        
+        Only fuel and tire factors vary per call. The style's modifier row is
+        resolved here too, so no later call pays for hashing the DriverStyle
+        enum member. Reassigning top_speed, handling, fuel_efficiency or
+        driver_style reruns this (see _style_source_property).
+        """
+        self._style_factors = style_mod = STYLE_FACTORS[self.driver_style]
+        self._style_top_speed = self.top_speed * style_mod.speed_bonus
+        self._style_handling = self.handling * style_mod.handling_penalty
+        self._style_fuel_efficiency = self.fuel_efficiency * style_mod.fuel_penalty
+        self._acceleration_bonus = style_mod.acceleration_bonus
+        self._risk_factor = style_mod.risk_factor
     
     def get_style_modifiers(self):
         """Get performance modifiers based on driver style"""
-        modifiers = {
-            DriverStyle.AGGRESSIVE: {
-                "speed_bonus": 1.05,
-                "acceleration_bonus": 1.08,
-                "handling_penalty": 0.92,
-                "fuel_penalty": 0.85,
-                "risk_factor": 1.3
-            },
-            DriverStyle.CONSERVATIVE: {
-                "speed_bonus": 0.95,
-                "acceleration_bonus": 0.92,
-                "handling_penalty": 1.05,
-                "fuel_penalty": 1.1,
-                "risk_factor": 0.7
-            },
-            DriverStyle.BALANCED: {
-                "speed_bonus": 1.0,
-                "acceleration_bonus": 1.0,
-                "handling_penalty": 1.0,
-                "fuel_penalty": 1.0,
-                "risk_factor": 1.0
-            },
-            DriverStyle.TECHNICAL: {
-                "speed_bonus": 0.98,
-                "acceleration_bonus": 0.95,
-                "handling_penalty": 1.12,
-                "fuel_penalty": 1.05,
-                "risk_factor": 0.8
-            },
-            DriverStyle.CHAOTIC: {
-                "speed_bonus": 1.02,
-                "acceleration_bonus": 1.05,
-                "handling_penalty": 0.88,
-                "fuel_penalty": 0.9,
-                "risk_factor": 1.5
-            }
-        }
-        return modifiers[self.driver_style]
+        return STYLE_MODIFIERS[self.driver_style]
+    
+    def get_style_factors(self) -> StyleModifiers:
+        """Get performance modifiers based on driver style as a named tuple"""
+        return self._style_factors
     
     def get_effective_top_speed(self):
         """Calculate effective top speed considering style and tire wear"""
-        style_mod = self.get_style_modifiers()
         tire_penalty = 1 - (self.tire_wear / 200)  # Max 50% penalty at full wear
-        return self.top_speed * style_mod["speed_bonus"] * tire_penalty
+        return self._style_top_speed * tire_penalty
     
     def get_effective_acceleration(self):
         """Calculate effective acceleration considering style and fuel level"""
-        style_mod = self.get_style_modifiers()
         # Lighter car (less fuel) accelerates faster
         fuel_bonus = 1 + ((100 - self.fuel_level) / 500)  # Max 20% bonus when empty
-        return self.acceleration / (style_mod["acceleration_bonus"] * fuel_bonus)
+        return self.acceleration / (self._acceleration_bonus * fuel_bonus)
     
     def get_effective_handling(self):
         """Calculate effective handling considering style and tire wear"""
-        style_mod = self.get_style_modifiers()
         tire_penalty = 1 - (self.tire_wear / 150)  # Max 66% penalty at full wear
-        return self.handling * style_mod["handling_penalty"] * tire_penalty
+        return self._style_handling * tire_penalty
     
     def accelerate(self, target_speed: float, time_delta: float) -> float:
         """Accelerate towards target speed based on acceleration stat"""
         effective_accel = self.get_effective_acceleration()
         max_accel_per_second = 100 / effective_accel  # km/h per second
         
-        speed_diff = target_speed - self.current_speed
         max_change = max_accel_per_second * time_delta
         
-        if speed_diff > 0:
-            # Accelerating
-            speed_change = min(speed_diff, max_change)
-        else:
-            # Braking (assumed to be more effective than acceleration)
-            speed_change = max(speed_diff, -max_change * 1.5)
+        # Accelerating is capped at max_change; braking is assumed to be more
+        # effective than acceleration, so it is capped at 1.5x that
+        speed_change = target_speed - self.current_speed
+        if speed_change > max_change:
+            speed_change = max_change
+        elif speed_change < -1.5 * max_change:
+            speed_change = -1.5 * max_change
         
-        self.current_speed = max(0, self.current_speed + speed_change)
+        speed = self.current_speed + speed_change
+        self.current_speed = speed if speed > 0 else 0
         return self.current_speed
     
     def consume_fuel(self, distance: float, aggressive_factor: float = 1.0):
         """Consume fuel based on distance and driving style"""
-        style_mod = self.get_style_modifiers()
-        consumption = distance / (self.fuel_efficiency * style_mod["fuel_penalty"])
+        consumption = distance / self._style_fuel_efficiency
         consumption *= aggressive_factor
         
         # Convert to percentage (assuming 60L tank)
@@ -132,26 +225,44 @@ class RacingCar:
     
     def wear_tires(self, distance: float, cornering_stress: float = 1.0):
         """Increase tire wear based on distance and cornering stress"""
-        style_mod = self.get_style_modifiers()
         base_wear = distance / 1000  # 0.1% per km
-        wear = base_wear * cornering_stress * style_mod["risk_factor"]
+        wear = base_wear * cornering_stress * self._risk_factor
         self.tire_wear = min(100, self.tire_wear + wear)
     
+    def step(self, target_speed: float, time_delta: float,
+             aggressive_factor: float = 1.0, cornering_stress: float = 1.0) -> float:
+        """Accelerate, move and charge fuel and tires for one time step.
+        
+        Returns the distance travelled in metres.
+        """
+        self.current_speed, self.fuel_level, self.tire_wear, distance = physics_step(
+            self.current_speed, self.fuel_level, self.tire_wear, target_speed,
+            time_delta, self.acceleration, self._acceleration_bonus,
+            self._style_fuel_efficiency, self._risk_factor,
+            aggressive_factor, cornering_stress
+        )
+        self.distance_traveled += distance
+        return distance
+    
     def calculate_corner_speed(self, corner_difficulty: float = 50) -> float:
         """Calculate safe cornering speed based on car handling and corner difficulty"""
+        tire_penalty = 1 - (self.tire_wear / 200)  # Same penalty as get_effective_top_speed
+        return self._corner_speed(self._style_top_speed * tire_penalty, self.get_effective_handling(),
+                                  tire_penalty, corner_difficulty)
+    
+    def _corner_speed(self, top_speed: float, handling: float, tire_penalty: float,
+                      corner_difficulty: float) -> float:
+        """Corner speed from already-computed effective top speed, handling and tire penalty"""
         # Base cornering speed as percentage of top speed
-        base_corner_ratio = 0.6 + (self.get_effective_handling() * 0.3)
+        base_corner_ratio = 0.6 + (handling * 0.3)
         
         # Adjust for corner difficulty (0-100 scale)
         difficulty_factor = 1.0 - (corner_difficulty / 200)  # Max 50% reduction
         
-        # Apply tire wear penalty
-        tire_penalty = 1.0 - (self.tire_wear / 200)  # Max 50% reduction when worn
-        
-        # Calculate final corner speed
-        corner_speed = self.get_effective_top_speed() * base_corner_ratio * difficulty_factor * tire_penalty
+        # Calculate final corner speed (tire_penalty: max 50% reduction when worn)
+        corner_speed = top_speed * base_corner_ratio * difficulty_factor * tire_penalty
         
-        return max(corner_speed, self.get_effective_top_speed() * 0.3)  # Minimum 30% of top speed
+        return max(corner_speed, top_speed * 0.3)  # Minimum 30% of top speed
     
     def calculate_pit_stop_value(self, laps_remaining: int, current_position: int) -> dict:
         """Calculate strategic value of pitting now vs later"""
@@ -188,14 +299,7 @@ class RacingCar:
         speed_advantage = max(0, relative_speed)  # Only positive relative speed helps
         
         # Track section multipliers
-        section_factors = {
-            "straight": {"opportunity": 1.0, "risk": 0.3},
-            "corner": {"opportunity": 0.6, "risk": 0.8},
-            "chicane": {"opportunity": 0.4, "risk": 1.2},
-            "long_corner": {"opportunity": 0.7, "risk": 0.6}
-        }
-        
-        section = section_factors.get(track_section, section_factors["straight"])
+        section = SECTION_FACTORS.get(track_section, SECTION_FACTORS["straight"])
         
         # Calculate success probability
         if gap_to_ahead > 100:  # Large gap
@@ -208,7 +312,7 @@ class RacingCar:
             success_prob = 0.8 + (speed_advantage / 10) * section["opportunity"]
         
         # Calculate risk level
-        risk_level = section["risk"] * (1 + self.get_style_modifiers()["risk_factor"])
+        risk_level = section["risk"] * (1 + self._risk_factor)
         
         return {
             "success_probability": min(0.95, success_prob),
@@ -222,7 +326,7 @@ class RacingCar:
     def predict_tire_degradation(self, laps_remaining: int, aggressive_factor: float = 1.0) -> dict:
         """Predict tire wear over remaining laps"""
         current_wear = self.tire_wear
-        wear_per_lap = 5.0 * aggressive_factor * self.get_style_modifiers()["risk_factor"]
+        wear_per_lap = 5.0 * aggressive_factor * self._risk_factor
         
         predicted_wear = current_wear + (wear_per_lap * laps_remaining)
         
@@ -248,9 +352,8 @@ class RacingCar:
     def calculate_fuel_strategy(self, laps_remaining: int, current_position: int) -> dict:
         """Calculate optimal fuel management strategy"""
         # Fuel consumption rates by driving style
-        style_mod = self.get_style_modifiers()
         base_consumption = 100 / 15  # Base: 15 laps per tank
-        actual_consumption = base_consumption / style_mod["fuel_penalty"]
+        actual_consumption = base_consumption / self._style_factors.fuel_penalty
         
         # Calculate fuel scenarios
         fuel_needed = actual_consumption * laps_remaining
@@ -279,15 +382,7 @@ class RacingCar:
     
     def assess_weather_impact(self, weather: str, track_section: str = "mixed") -> dict:
         """Assess how weather affects car performance"""
-        weather_effects = {
-            "clear": {"speed": 1.0, "handling": 1.0, "tire_wear": 1.0, "risk": 1.0},
-            "rain": {"speed": 0.85, "handling": 0.7, "tire_wear": 0.8, "risk": 1.5},
-            "heavy_rain": {"speed": 0.7, "handling": 0.5, "tire_wear": 0.6, "risk": 2.0},
-            "fog": {"speed": 0.9, "handling": 0.9, "tire_wear": 1.0, "risk": 1.3},
-            "wind": {"speed": 0.95, "handling": 0.85, "tire_wear": 1.1, "risk": 1.1}
-        }
-        
-        effects = weather_effects.get(weather, weather_effects["clear"])
+        effects = WEATHER_EFFECTS.get(weather, WEATHER_EFFECTS["clear"])
         
         # Car-specific adaptation
         handling_advantage = self.get_effective_handling()
@@ -304,12 +399,15 @@ class RacingCar:
     
     def get_performance_envelope(self) -> dict:
         """Get comprehensive performance metrics for strategic analysis"""
+        tire_penalty = 1 - (self.tire_wear / 200)
+        top_speed = self._style_top_speed * tire_penalty
+        handling = self.get_effective_handling()
         return {
             "speed_metrics": {
-                "top_speed": self.get_effective_top_speed(),
+                "top_speed": top_speed,
                 "acceleration": self.get_effective_acceleration(),
-                "corner_speed_50": self.calculate_corner_speed(50),
-                "corner_speed_90": self.calculate_corner_speed(90)
+                "corner_speed_50": self._corner_speed(top_speed, handling, tire_penalty, 50),
+                "corner_speed_90": self._corner_speed(top_speed, handling, tire_penalty, 90)
             },
             "efficiency_metrics": {
                 "fuel_efficiency": self.fuel_efficiency,
@@ -317,9 +415,9 @@ class RacingCar:
                 "tire_condition": 100 - self.tire_wear
             },
             "strategic_metrics": {
-                "handling": self.get_effective_handling(),
+                "handling": handling,
                 "driver_style": self.driver_style.value,
-                "risk_tolerance": self.get_style_modifiers()["risk_factor"],
+                "risk_tolerance": self._risk_factor,
                 "current_position": self.current_position
             }
         }
@@ -333,4 +431,121 @@ class RacingCar:
         self.total_race_time = 0.0
         self.fuel_level = 100.0
         self.tire_wear = 0.0
-        self.distance_traveled = 0.0
\ No newline at end of file
+        self.distance_traveled = 0.0
+
+
+def _style_source_property(name: str) -> property:
+    """Property for a RacingCar field its folded style stats are derived from.
+    
+    Setting it refolds the stats, so they never go stale. Only these four
+    fields pay for the check; per-tick state like current_speed stays a plain
+    attribute.
+    """
+    attr = "_" + name
+    
+    def set_and_refold(self, value):
+        setattr(self, attr, value)
+        # The dataclass __init__ sets every field before __post_init__ folds
+        if self._style_factors is not None:
+            self._fold_style()
+    
+    return property(attrgetter(attr), set_and_refold)
+
+
+for _name in ("top_speed", "handling", "fuel_efficiency", "driver_style"):
+    setattr(RacingCar, _name, _style_source_property(_name))
+del _name
+
+
+class CarFleet:
+    """Column-wise view of a field of cars for stepping them all at once.
+    
+    Dynamic state (speed, fuel, tire wear, distance) lives in one list per
+    attribute and each car's fixed style factors are gathered into tuples,
+    so a batch step is a single pass over parallel columns feeding
+    physics_step, with no RacingCar method calls or attribute lookups.
+    Call write_back() to copy the state onto the RacingCar objects.
+    """
+    
+    def __init__(self, cars: Sequence[RacingCar]):
+        self.cars = list(cars)
+        
+        # Fixed per-car columns
+        self.acceleration = tuple(car.acceleration for car in self.cars)
+        self.acceleration_bonus = tuple(car._acceleration_bonus for car in self.cars)
+        self.style_handling = tuple(car._style_handling for car in self.cars)
+        self.fuel_efficiency = tuple(car._style_fuel_efficiency for car in self.cars)
+        self.risk_factor = tuple(car._risk_factor for car in self.cars)
+        
+        # Dynamic per-car columns
+        self.current_speed = [car.current_speed for car in self.cars]
+        self.fuel_level = [car.fuel_level for car in self.cars]
+        self.tire_wear = [car.tire_wear for car in self.cars]
+        self.distance_traveled = [car.distance_traveled for car in self.cars]
+    
+    def __len__(self) -> int:
+        return len(self.cars)
+    
+    def step(self, target_speeds: Sequence[float], time_delta: float,
+             aggressive_factors: Optional[Sequence[float]] = None,
+             cornering_stresses: Optional[Sequence[float]] = None) -> List[float]:
+        """Advance every car one time step towards its target speed.
+        
+        Runs physics_step for each car, as RacingCar.step does. Returns the
+        distance each car travelled in metres.
+        """
+        count = len(self.cars)
+        if aggressive_factors is None:
+            aggressive_factors = (1.0,) * count
+        if cornering_stresses is None:
+            cornering_stresses = (1.0,) * count
+        
+        speeds, fuels, wears, distances, totals = [], [], [], [], []
+        for speed, fuel, wear, total, target, accel, accel_bonus, efficiency, risk, aggressive, stress in zip(
+                self.current_speed, self.fuel_level, self.tire_wear, self.distance_traveled,
+                target_speeds, self.acceleration, self.acceleration_bonus,
+                self.fuel_efficiency, self.risk_factor, aggressive_factors, cornering_stresses):
+            speed, fuel, wear, distance = physics_step(
+                speed, fuel, wear, target, time_delta, accel, accel_bonus,
+                efficiency, risk, aggressive, stress
+            )
+            speeds.append(speed)
+            fuels.append(fuel)
+            wears.append(wear)
+            distances.append(distance)
+            totals.append(total + distance)
+        
+        self.current_speed = speeds
+        self.fuel_level = fuels
+        self.tire_wear = wears
+        self.distance_traveled = totals
+        return distances
+    
+    def estimate_lap_times(self, track: "RaceTrack",
+                           initial_speed: float = 0.0) -> List[Tuple[float, float]]:
+        """Estimate a flying lap of the track for every car from its current state.
+        
+        Each car targets the track's optimal speeds for its effective handling
+        and accelerates at its effective rate, exactly as RaceTrack.calculate_lap_time
+        would for that car. Returns (lap_time, exit_speed) per car.
+        """
+        return [
+            track.calculate_lap_time(
+                initial_speed,
+                track.get_optimal_speeds(handling * (1 - (wear / 150))),
+                accel / (accel_bonus * (1 + ((100 - fuel) / 500)))
+            )
+            for handling, wear, accel, accel_bonus, fuel
+            in zip(self.style_handling, self.tire_wear, self.acceleration,
+                   self.acceleration_bonus, self.fuel_level)
+        ]
+    
+    def write_back(self):
+        """Copy the fleet's dynamic state onto its RacingCar objects"""
+        for car, speed, fuel, wear, distance in zip(self.cars, self.current_speed,
+                                                    self.fuel_level, self.tire_wear,
+                                                    self.distance_traveled):
+            car.current_speed = speed
+            car.fuel_level = fuel
+            car.tire_wear = wear
+            car.distance_traveled = distance
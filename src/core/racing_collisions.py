@@ -23,6 +23,8 @@ class CollisionEvent:
 class CollisionDetector:
     """Manages collision detection and penalties"""
     
+    COLLISION_THRESHOLD = 0.002  # Track progress; about 2 car lengths
+    
     def __init__(self):
         self.collision_history = []
         self.recent_collisions = {}  # Track recent collisions to prevent spam
@@ -33,20 +35,36 @@ class CollisionDetector:
         """Check for potential collisions between cars"""
         collisions = []
         car_names = list(car_positions.keys())
-        
-        for i in range(len(car_names)):
-            for j in range(i + 1, len(car_names)):
-                car1, car2 = car_names[i], car_names[j]
-                
-                collision = self._detect_collision(
-                    car1, car2, 
-                    car_positions[car1], car_positions[car2],
-                    car_speeds[car1], car_speeds[car2],
-                    track_section
-                )
-                
-                if collision:
-                    collisions.append(collision)
+        positions = [car_positions[name] for name in car_names]
+        threshold = self.COLLISION_THRESHOLD
+        
+        # Sort-and-sweep: walk the field in track order and stop each scan at
+        # the first car beyond the collision threshold, instead of testing all pairs
+        order = sorted(range(len(car_names)), key=positions.__getitem__)
+        candidates = []
+        for rank, i in enumerate(order):
+            position = positions[i]
+            for next_rank in range(rank + 1, len(order)):
+                j = order[next_rank]
+                if positions[j] - position > threshold:
+                    break
+                candidates.append((i, j) if i < j else (j, i))
+        
+        # Resolve close pairs in the same order as an all-pairs scan, so the
+        # random rolls and cooldown updates happen exactly as before
+        candidates.sort()
+        for i, j in candidates:
+            car1, car2 = car_names[i], car_names[j]
+            
+            collision = self._detect_collision(
+                car1, car2, 
+                positions[i], positions[j],
+                car_speeds[car1], car_speeds[car2],
+                track_section
+            )
+            
+            if collision:
+                collisions.append(collision)
                     
         return collisions
     
@@ -60,17 +78,15 @@ class CollisionDetector:
         pos_diff = abs(pos1 - pos2)
         
         # Cars need to be very close for collision
-        collision_threshold = 0.002  # About 2 car lengths
-        
-        if pos_diff > collision_threshold:
+        if pos_diff > self.COLLISION_THRESHOLD:
             return None
             
         # Check if this collision was already processed recently
-        collision_key = tuple(sorted([car1, car2]))
-        if collision_key in self.recent_collisions:
-            if self.recent_collisions[collision_key] > 0:
-                self.recent_collisions[collision_key] -= 1
-                return None
+        collision_key = (car1, car2) if car1 <= car2 else (car2, car1)
+        cooldown = self.recent_collisions.get(collision_key, 0)
+        if cooldown > 0:
+            self.recent_collisions[collision_key] = cooldown - 1
+            return None
         
         # Calculate collision probability based on various factors
         speed_diff = abs(speed1 - speed2)
@@ -157,33 +173,24 @@ class CollisionDetector:
         my_pos = car_positions[car_name]
         my_speed = car_speeds[car_name]
         
-        # Find nearby cars
-        nearby_cars = []
+        # Sum the risk from every nearby car in one pass over the field
+        nearby_cars = 0
+        total_risk = 0.0
         for other_car, other_pos in car_positions.items():
             if other_car == car_name:
                 continue
                 
             distance = abs(my_pos - other_pos)
             if distance < 0.01:  # Within collision range
-                nearby_cars.append({
-                    "name": other_car,
-                    "distance": distance,
-                    "speed": car_speeds[other_car],
-                    "speed_diff": abs(my_speed - car_speeds[other_car])
-                })
+                nearby_cars += 1
+                # Risk increases with speed difference and proximity
+                distance_risk = (0.01 - distance) / 0.01  # 0-1 scale
+                speed_risk = min(abs(my_speed - car_speeds[other_car]) / 50, 1.0)  # 0-1 scale
+                total_risk += (distance_risk + speed_risk) / 2
         
         if not nearby_cars:
             return {"risk_level": "none", "risk_factor": 0.0}
             
-        # Calculate overall risk
-        total_risk = 0.0
-        for car in nearby_cars:
-            # Risk increases with speed difference and proximity
-            distance_risk = (0.01 - car["distance"]) / 0.01  # 0-1 scale
-            speed_risk = min(car["speed_diff"] / 50, 1.0)  # 0-1 scale
-            car_risk = (distance_risk + speed_risk) / 2
-            total_risk += car_risk
-            
         risk_factor = min(total_risk, 1.0)
         
         if risk_factor > 0.7:
@@ -198,7 +205,7 @@ class CollisionDetector:
         return {
             "risk_level": risk_level,
             "risk_factor": risk_factor,
-            "nearby_cars": len(nearby_cars),
+            "nearby_cars": nearby_cars,
             "track_section": track_section
         }
     
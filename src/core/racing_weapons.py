@@ -130,6 +130,34 @@ class WeaponsManager:
         
         return None
     
+    def get_all_cars_ahead(self, car_positions: Dict[str, float],
+                           car_laps: Dict[str, int]) -> Dict[str, Optional[Tuple[str, float]]]:
+        """Find the car directly ahead of every car at once.
+        
+        Same result as calling get_car_ahead for each car, but sorts the field
+        by total progress once instead of scanning every other car per car.
+        """
+        ordered = sorted(car_positions, key=lambda name: car_laps.get(name, 0) + car_positions[name])
+        totals = [car_laps.get(name, 0) + car_positions[name] for name in ordered]
+        
+        cars_ahead = {}
+        for index, car_name in enumerate(ordered):
+            # Nearest car strictly ahead (skip cars level with this one)
+            ahead = index + 1
+            while ahead < len(ordered) and totals[ahead] <= totals[index]:
+                ahead += 1
+            
+            cars_ahead[car_name] = None
+            if ahead < len(ordered):
+                other_name = ordered[ahead]
+                distance = ((car_laps.get(other_name, 0) - car_laps.get(car_name, 0)) +
+                            (car_positions[other_name] - car_positions[car_name]))
+                # Only report cars reasonably close (within 10% of track)
+                if distance < 0.1:
+                    cars_ahead[car_name] = (other_name, distance)
+        
+        return cars_ahead
+    
     def apply_hit_effect(self, target_speeds: Dict[str, float], hit_info: Dict) -> Dict[str, float]:
         """Apply speed reduction from machine gun hit"""
         target = hit_info["target"]
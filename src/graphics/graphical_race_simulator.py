@@ -2,6 +2,8 @@
 Graphical Race Simulator - Extends intelligent simulator with visual rendering
 """
 
+import queue
+import threading
 import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -10,7 +12,9 @@ from ..core.intelligent_race_simulator import IntelligentRaceSimulator
 from ..core.racing_car import RacingCar
 from ..core.race_track import RaceTrack
 from ..intelligence.race_intelligence import RacingIntelligence
-from .race_renderer import RaceRenderer, GraphicsSettings, PYGAME_AVAILABLE
+from .race_renderer import (
+    RaceRenderer, GraphicsSettings, DEFAULT_GRAPHICS_SETTINGS, PYGAME_AVAILABLE, FrameSnapshot
+)
 
 
 class GraphicalRaceSimulator(IntelligentRaceSimulator):
@@ -25,7 +29,7 @@ class GraphicalRaceSimulator(IntelligentRaceSimulator):
         super().__init__(track, cars, laps, enable_telemetry, enable_intelligence)
         
         self.enable_graphics = enable_graphics and PYGAME_AVAILABLE
-        self.graphics_settings = graphics_settings or GraphicsSettings()
+        self.graphics_settings = graphics_settings or DEFAULT_GRAPHICS_SETTINGS
         self.renderer = None
         self.weather = self.track.weather_conditions
         
@@ -57,12 +61,48 @@ class GraphicalRaceSimulator(IntelligentRaceSimulator):
         print(f"Weather: {self.weather}")
         print("\nPress ESC to exit visualization\n")
         
-        # Simulation loop
-        current_lap = 1
+        # Physics runs on a worker thread and publishes snapshots; rendering
+        # stays on the main thread because SDL owns the window and event queue
         time_step = 0.1  # 100ms time steps
+        frames = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        physics = threading.Thread(
+            target=self._run_physics,
+            args=(lap_times, time_step, frames, stop),
+            daemon=True
+        )
+        physics.start()
+        
+        while self.renderer.is_running():
+            try:
+                frame = frames.get(timeout=time_step)
+            except queue.Empty:
+                if not physics.is_alive():
+                    break
+                continue
+            self.renderer.draw_frame(self.track, frame, self.laps)
+            
+        # ESC closes the window; let the physics thread finish its step
+        stop.set()
+        physics.join()
+        
+        # Clean up graphics
+        if self.renderer:
+            self.renderer.cleanup()
+            
+        # Generate results
+        results = self._generate_results(lap_times)
+        results["visualization_completed"] = True
+        
+        return results
+        
+    def _run_physics(self, lap_times: Dict[str, List[float]], time_step: float,
+                     frames: queue.Queue, stop: threading.Event):
+        """Step the race until it ends or stop is set, publishing each frame"""
+        current_lap = 1
         positions = {car.name: 0.0 for car in self.cars}  # Track progress (0-1)
         
-        while current_lap <= self.laps and self.renderer.is_running():
+        while current_lap <= self.laps and not stop.is_set():
             # Update each car
             for i, car in enumerate(self.cars):
                 if car.fuel_level > 0:
@@ -104,8 +144,12 @@ class GraphicalRaceSimulator(IntelligentRaceSimulator):
             for pos, car in enumerate(sorted_cars):
                 car.current_position = pos
                 
-            # Render frame
-            self.renderer.render_frame(self, positions, current_lap, self.laps)
+            # Hand the renderer the latest frame, dropping one it has not drawn yet
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            frames.put_nowait(FrameSnapshot.capture(self, positions, current_lap))
             
             # Check if all cars on next lap
             min_laps = min(len(lap_times[car.name]) for car in self.cars)
@@ -115,16 +159,6 @@ class GraphicalRaceSimulator(IntelligentRaceSimulator):
             # Small delay for smooth animation
             time.sleep(time_step)
             
-        # Clean up graphics
-        if self.renderer:
-            self.renderer.cleanup()
-            
-        # Generate results
-        results = self._generate_results(lap_times)
-        results["visualization_completed"] = True
-        
-        return results
-        
     def _generate_results(self, lap_times: Dict[str, List[float]]) -> Dict:
         """Generate race results from lap times"""
         finishing_order = []
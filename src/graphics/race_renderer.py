@@ -20,7 +20,7 @@ from ..core.race_simulator import RaceSimulator
 from .sprite_manager import SpriteManager
 
 
-@dataclass
+@dataclass(frozen=True)
 class GraphicsSettings:
     """Configuration for graphics rendering"""
     width: int = 1200
@@ -32,6 +32,60 @@ class GraphicsSettings:
     quality: str = "medium"  # low, medium, high
 
 
+# Shared 1200x800 @ 60fps settings used by the demos; frozen, so safe to share
+DEFAULT_GRAPHICS_SETTINGS = GraphicsSettings()
+
+
+@dataclass
+class CarFrame:
+    """The per-car state the renderer draws, copied from a RacingCar"""
+    name: str
+    driver_style: DriverStyle
+    current_position: int
+    current_speed: float
+    fuel_level: float
+    tire_wear: float
+    
+    @classmethod
+    def from_car(cls, car: RacingCar) -> "CarFrame":
+        return cls(car.name, car.driver_style, car.current_position,
+                   car.current_speed, car.fuel_level, car.tire_wear)
+
+
+@dataclass
+class FrameSnapshot:
+    """Plain-data copy of everything one rendered frame shows.
+    
+    The power-up and weapon fields are None when the race has no such system.
+    """
+    positions: Dict[str, float]
+    lap: int
+    cars: List[CarFrame]
+    pickups: Optional[List[dict]] = None  # Track pickups: progress, available, ...
+    inventories: Optional[Dict[str, List[str]]] = None  # Power-up names per car
+    active_effects: Optional[Dict[str, List[str]]] = None  # Effect types per car
+    active_hits: Optional[List[dict]] = None  # Machine gun hits to draw trails for
+    ammo: Optional[Dict[str, int]] = None
+    
+    @classmethod
+    def capture(cls, simulator: RaceSimulator, positions: Dict[str, float],
+                lap: int) -> "FrameSnapshot":
+        """Copy a simulator's drawable state for one frame"""
+        frame = cls(dict(positions), lap, [CarFrame.from_car(car) for car in simulator.cars])
+        powerups = getattr(simulator, "powerup_manager", None)
+        if powerups is not None:
+            frame.pickups = [dict(pickup) for pickup in powerups.track_pickups]
+            frame.inventories = {car.name: powerups.get_inventory_status(car.name)
+                                 for car in simulator.cars}
+            frame.active_effects = {name: [effect["type"] for effect in effects]
+                                    for name, effects in list(powerups.active_effects.items())}
+        weapons = getattr(simulator, "weapons_manager", None)
+        if weapons is not None:
+            frame.active_hits = [dict(hit) for hit in weapons.get_active_hits()]
+            frame.ammo = weapons.get_all_ammo_status()
+        return frame
+
+
 class RaceRenderer:
     """Main graphics renderer for AI Racing"""
     
@@ -63,7 +117,7 @@ class RaceRenderer:
         if not PYGAME_AVAILABLE:
             raise ImportError("Pygame is required for graphics. Install with: pip install pygame")
             
-        self.settings = settings or GraphicsSettings()
+        self.settings = settings or DEFAULT_GRAPHICS_SETTINGS
         self.screen = None
         self.clock = None
         self.font = None
@@ -468,7 +522,8 @@ class RaceRenderer:
             )
             surface.blit(pos_text, (20, y_offset + i * 25))
     
-    def draw_power_up_inventory(self, surface, simulator):
+    def draw_power_up_inventory(self, surface, cars: List[CarFrame],
+                                inventories: Dict[str, List[str]]):
         """Draw power-up inventory panel"""
         # Background for power-up panel
         panel_rect = pygame.Rect(self.settings.width - 320, 10, 300, 250)
@@ -481,14 +536,14 @@ class RaceRenderer:
         
         # Draw each car's power-ups
         y_offset = 50
-        for i, car in enumerate(sorted(simulator.cars, key=lambda c: c.current_position)):
+        for i, car in enumerate(sorted(cars, key=lambda c: c.current_position)):
             # Car name - use car name colors first
             color = self.CAR_NAME_COLORS.get(car.name, self.AI_COLORS.get(car.driver_style, (255, 255, 255)))
             name_text = self.small_font.render(f"{car.name[:12]}:", True, color)
             surface.blit(name_text, (self.settings.width - 310, y_offset))
             
             # Power-ups
-            inventory = simulator.powerup_manager.get_inventory_status(car.name)
+            inventory = inventories.get(car.name)
             if inventory:
                 items_text = ", ".join(inventory[:2])  # Show up to 2 items
                 item_text = self.small_font.render(items_text, True, (200, 200, 200))
@@ -499,7 +554,7 @@ class RaceRenderer:
             
             y_offset += 35
     
-    def draw_ammo_display(self, surface, simulator):
+    def draw_ammo_display(self, surface, cars: List[CarFrame], ammo_status: Dict[str, int]):
         """Draw ammo counter for each car"""
         # Background for ammo panel
         panel_rect = pygame.Rect(self.settings.width - 320, 280, 300, 200)
@@ -512,41 +567,52 @@ class RaceRenderer:
         
         # Draw each car's ammo
         y_offset = 320
-        if hasattr(simulator, 'weapons_manager'):
-            ammo_status = simulator.weapons_manager.get_all_ammo_status()
-            for car in sorted(simulator.cars, key=lambda c: c.current_position):
-                # Car name and color
-                color = self.CAR_NAME_COLORS.get(car.name, self.AI_COLORS.get(car.driver_style, (255, 255, 255)))
-                name_text = self.small_font.render(f"{car.name[:12]}:", True, color)
-                surface.blit(name_text, (self.settings.width - 310, y_offset))
-                
-                # Ammo bar
-                ammo_count = ammo_status.get(car.name, 0)
-                bar_width = int((ammo_count / 50) * 120)  # 120 pixels for full ammo
-                bar_color = (0, 255, 0) if ammo_count > 25 else (255, 255, 0) if ammo_count > 10 else (255, 0, 0)
-                
-                # Draw ammo bar background
-                pygame.draw.rect(surface, (50, 50, 50), 
-                               (self.settings.width - 180, y_offset, 120, 15))
-                # Draw ammo bar fill
-                if bar_width > 0:
-                    pygame.draw.rect(surface, bar_color, 
-                                   (self.settings.width - 180, y_offset, bar_width, 15))
-                # Draw ammo bar border
-                pygame.draw.rect(surface, (200, 200, 200), 
-                               (self.settings.width - 180, y_offset, 120, 15), 1)
-                
-                # Ammo count text
-                ammo_text = self.small_font.render(f"{ammo_count}/50", True, (200, 200, 200))
-                surface.blit(ammo_text, (self.settings.width - 50, y_offset))
-                
-                y_offset += 30
+        for car in sorted(cars, key=lambda c: c.current_position):
+            # Car name and color
+            color = self.CAR_NAME_COLORS.get(car.name, self.AI_COLORS.get(car.driver_style, (255, 255, 255)))
+            name_text = self.small_font.render(f"{car.name[:12]}:", True, color)
+            surface.blit(name_text, (self.settings.width - 310, y_offset))
+            
+            # Ammo bar
+            ammo_count = ammo_status.get(car.name, 0)
+            bar_width = int((ammo_count / 50) * 120)  # 120 pixels for full ammo
+            bar_color = (0, 255, 0) if ammo_count > 25 else (255, 255, 0) if ammo_count > 10 else (255, 0, 0)
             
+            # Draw ammo bar background
+            pygame.draw.rect(surface, (50, 50, 50), 
+                           (self.settings.width - 180, y_offset, 120, 15))
+            # Draw ammo bar fill
+            if bar_width > 0:
+                pygame.draw.rect(surface, bar_color, 
+                               (self.settings.width - 180, y_offset, bar_width, 15))
+            # Draw ammo bar border
+            pygame.draw.rect(surface, (200, 200, 200), 
+                           (self.settings.width - 180, y_offset, 120, 15), 1)
+            
+            # Ammo count text
+            ammo_text = self.small_font.render(f"{ammo_count}/50", True, (200, 200, 200))
+            surface.blit(ammo_text, (self.settings.width - 50, y_offset))
+            
+            y_offset += 30
+        
     def render_frame(self, simulator: RaceSimulator, current_positions: Dict[str, float],
                     lap: int = 1, total_laps: int = 10):
-        """Render a single frame of the race"""
+        """Render a single frame of the race from the simulator's live state"""
+        if not self.running:
+            return
+        self.draw_frame(simulator.track, FrameSnapshot.capture(simulator, current_positions, lap),
+                        total_laps)
+    
+    def draw_frame(self, track: RaceTrack, frame: FrameSnapshot, total_laps: int = 10):
+        """Render a single frame of the race from a snapshot of it
+        
+        Everything drawn comes from the snapshot, so a physics thread can keep
+        updating the race while the frame is drawn.
+        """
         if not self.running:
             return
+        cars = frame.cars
+        current_positions = frame.positions
             
         # Handle events
         for event in pygame.event.get():
@@ -561,12 +627,12 @@ class RaceRenderer:
         
         # Draw track
         if not self.track_points:
-            self.track_points = self.generate_track_points(simulator.track)
+            self.track_points = self.generate_track_points(track)
         self.draw_track(self.screen, self.track_points)
         
         # Draw power-up pickups on track
-        if hasattr(simulator, 'powerup_manager') and simulator.powerup_manager.track_pickups:
-            for pickup in simulator.powerup_manager.track_pickups:
+        if frame.pickups:
+            for pickup in frame.pickups:
                 # Calculate pickup position on track
                 pickup_progress = pickup.get("progress", 0)
                 # Calculate position directly without needing a car
@@ -585,7 +651,7 @@ class RaceRenderer:
                 self.draw_power_up_pickup(self.screen, pickup_x, pickup_y, pickup.get("available", True))
         
         # Draw cars with power-ups
-        for car in simulator.cars:
+        for car in cars:
             if car.name in current_positions:
                 progress = current_positions[car.name]
                 x, y, angle = self.calculate_car_position(car, progress, self.track_points)
@@ -593,10 +659,10 @@ class RaceRenderer:
                 color = self.CAR_NAME_COLORS.get(car.name, self.AI_COLORS.get(car.driver_style, (255, 255, 255)))
                 self.draw_car(self.screen, x, y, angle, color, car.name)
                 
-                # Draw power-up indicators if simulator has powerup_manager
-                if hasattr(simulator, 'powerup_manager'):
+                # Draw power-up indicators if the race has power-ups
+                if frame.inventories is not None:
                     # Show power-up inventory above car
-                    inventory = simulator.powerup_manager.get_inventory_status(car.name)
+                    inventory = frame.inventories.get(car.name)
                     if inventory:
                         # Draw the first power-up in inventory
                         power_up_name = inventory[0]
@@ -605,9 +671,8 @@ class RaceRenderer:
                         self.draw_power_up_indicator(self.screen, x, y, power_up_type, size=10)  # Smaller for smaller cars
                     
                     # Draw active power-up effects
-                    if car.name in simulator.powerup_manager.active_effects:
-                        for effect in simulator.powerup_manager.active_effects[car.name]:
-                            effect_type = effect["type"]
+                    if car.name in frame.active_effects:
+                        for effect_type in frame.active_effects[car.name]:
                             if effect_type in ["turbo_boost", "nitro"]:
                                 self.draw_power_up_effect(self.screen, x, y, "turbo", angle)
                             elif effect_type == "shield":
@@ -616,20 +681,20 @@ class RaceRenderer:
                                 self.draw_power_up_effect(self.screen, x, y, "ghost", angle)
                 
         # Draw HUD
-        self.draw_hud(self.screen, simulator.cars, lap, total_laps)
+        self.draw_hud(self.screen, cars, frame.lap, total_laps)
         
         # Draw bullet trails for active hits
-        if hasattr(simulator, 'weapons_manager'):
+        if frame.active_hits is not None:
             # Store car positions for bullet drawing
             car_positions_screen = {}
-            for car in simulator.cars:
+            for car in cars:
                 if car.name in current_positions:
                     progress = current_positions[car.name]
                     x, y, angle = self.calculate_car_position(car, progress, self.track_points)
                     car_positions_screen[car.name] = (x, y)
             
             # Draw active bullet trails
-            for hit in simulator.weapons_manager.get_active_hits():
+            for hit in frame.active_hits:
                 shooter_name = hit["shooter"]
                 target_name = hit["target"]
                 
@@ -642,12 +707,12 @@ class RaceRenderer:
                                          target_x, target_y, hit=True)
         
         # Draw power-up inventory panel if available
-        if hasattr(simulator, 'powerup_manager'):
-            self.draw_power_up_inventory(self.screen, simulator)
+        if frame.inventories is not None:
+            self.draw_power_up_inventory(self.screen, cars, frame.inventories)
         
         # Draw ammo display if available
-        if hasattr(simulator, 'weapons_manager'):
-            self.draw_ammo_display(self.screen, simulator)
+        if frame.ammo is not None:
+            self.draw_ammo_display(self.screen, cars, frame.ammo)
         
         # Update display
         pygame.display.flip()
@@ -228,18 +228,20 @@ class EnhancedAIRacer:
         return celebrations.get(self.profile.name, "Yes! What a race!")
 
 
+# Car specs for the five personalities: name, top speed, acceleration,
+# handling, fuel efficiency, driver style
+ENHANCED_RACER_SPECS = (
+    ("Speed Demon", 380, 3.2, 0.65, 10, DriverStyle.AGGRESSIVE),
+    ("Tech Precision", 340, 4.5, 0.92, 14, DriverStyle.TECHNICAL),
+    ("Fuel Master", 320, 5.2, 0.78, 18, DriverStyle.CONSERVATIVE),
+    ("Adaptive Racer", 350, 4.0, 0.82, 13, DriverStyle.BALANCED),
+    ("Chaos Cruiser", 360, 3.8, 0.75, 11, DriverStyle.CHAOTIC)
+)
+
+
 def create_enhanced_ai_racers(personality_system: AIPersonalitySystem) -> List[EnhancedAIRacer]:
     """Create the enhanced AI racers with full personalities"""
-    cars = [
-        RacingCar("Speed Demon", 380, 3.2, 0.65, 10, DriverStyle.AGGRESSIVE),
-        RacingCar("Tech Precision", 340, 4.5, 0.92, 14, DriverStyle.TECHNICAL),
-        RacingCar("Fuel Master", 320, 5.2, 0.78, 18, DriverStyle.CONSERVATIVE),
-        RacingCar("Adaptive Racer", 350, 4.0, 0.82, 13, DriverStyle.BALANCED),
-        RacingCar("Chaos Cruiser", 360, 3.8, 0.75, 11, DriverStyle.CHAOTIC)
-    ]
-    
-    enhanced_racers = []
-    for car in cars:
-        enhanced_racers.append(EnhancedAIRacer(car, personality_system))
-        
-    return enhanced_racers
\ No newline at end of file
+    # Cars carry per-race state, so every call builds fresh ones from the
+    # shared specs; profiles are shared through the personality system
+    return [EnhancedAIRacer(RacingCar(*spec), personality_system)
+            for spec in ENHANCED_RACER_SPECS]
\ No newline at end of file
@@ -28,6 +28,11 @@ class RacePhase(Enum):
 @dataclass
 class RaceSituation:
     """Current race situation analysis"""
+    # Built for every car on every step and kept in race_history, so no per-instance __dict__
+    __slots__ = ("phase", "position", "gap_ahead", "gap_behind", "laps_remaining",
+                 "fuel_status", "tire_condition", "track_position", "is_cornering",
+                 "competitors_near")
+    
     phase: RacePhase
     position: int
     gap_ahead: float  # seconds to car ahead
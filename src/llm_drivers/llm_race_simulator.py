@@ -3,7 +3,10 @@ LLM Race Simulator - Handles races with AI language model drivers
 """
 
 import asyncio
+import concurrent.futures
+import threading
 import time
+import traceback
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
@@ -13,17 +16,34 @@ from ..core.racing_car import RacingCar
 from ..core.racing_powerups import PowerUpManager, PowerUpType
 from ..core.racing_collisions import CollisionDetector
 from ..core.racing_weapons import WeaponsManager
-from .llm_racing_driver import LLMDriver, LLMAction, create_llm_drivers
+from .llm_racing_driver import LLMDriver, LLMAction, create_llm_drivers, warm_up_drivers, close_http_client
 from ..graphics.race_renderer import GraphicsSettings
+from ai_config import set_max_concurrency
+
+
+def track_progress(speed_kmh: float, seconds: float, track_m: float) -> float:
+    """Fraction of a lap covered at a constant speed (km/h) over some seconds"""
+    return speed_kmh / 3.6 * seconds / track_m
 
 
 class LLMRaceSimulator(GraphicalRaceSimulator):
     """Race simulator for LLM-powered drivers"""
     
+    DECISION_INTERVAL = 30  # Frames between LLM decision ticks
+    # Speculative decisions: a shadow batch for the next tick is requested from
+    # predicted positions and used only if the real positions end up this close
+    SPECULATION_TOLERANCE = 0.002  # Track fraction (~10m on a 5km track)
+    SPECULATION_MIN_HIT_RATE = 0.5
+    SPECULATION_WARMUP_TICKS = 10  # Ticks before the hit rate is judged
+    
     def __init__(self, track: RaceTrack, llm_drivers: List[LLMDriver],
                  laps: int = 10, enable_graphics: bool = True,
-                 graphics_settings: GraphicsSettings = None):
+                 graphics_settings: GraphicsSettings = None,
+                 max_concurrency: Optional[int] = None):
         """Initialize with LLM drivers"""
+        if max_concurrency is not None:
+            set_max_concurrency(max_concurrency)
+        
         # Extract cars from LLM drivers
         cars = [driver.car for driver in llm_drivers]
         
@@ -56,6 +76,10 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
         car_names = [car.name for car in cars]
         self.powerup_manager.initialize_cars(car_names)
         self.weapons_manager.initialize_cars(car_names)
+        
+        self.speculate = True
+        self.speculation_hits = 0
+        self.speculation_misses = 0
     
     def _safe_analyze_powerup_strategy(self, car, gap_ahead, gap_behind):
         """Safely analyze power-up strategy with error handling"""
@@ -72,6 +96,158 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
             print(f"⚠️ Power-up strategy error for {getattr(car, 'name', 'unknown')}: {e}")
             return {"recommendation": "none", "reasoning": "Strategy error"}
         
+    def _decision_inputs(self, car_name: str, now: float) -> tuple:
+        """Power-up inventory, ammo and fire readiness a decision is based on"""
+        weapon = self.weapons_manager.car_weapons.get(car_name)
+        return (
+            self.powerup_manager.get_inventory_status(car_name),
+            self.weapons_manager.get_ammo_status(car_name),
+            weapon.can_fire(now) if weapon is not None else False,
+        )
+    
+    def _build_decision_requests(self, positions: Dict[str, float], laps_completed: Dict[str, int],
+                                 current_lap: int, predicted: bool = False) -> List[tuple]:
+        """Build the (car_name, driver, race_state) requests for one decision tick
+        (predicted=True for speculative requests from predicted positions)"""
+        decision_requests = []
+        now = time.time()
+        cars_ahead = self.weapons_manager.get_all_cars_ahead(positions, laps_completed)
+        
+        # Collision risk for every car reads the same snapshot of the field
+        car_positions_for_collision = {c.name: positions[c.name] for c in self.cars}
+        car_speeds_for_collision = {c.name: c.current_speed for c in self.cars}
+        
+        for i, car in enumerate(self.cars):
+            if not getattr(car, 'has_mechanical_failure', False) and car.fuel_level > 0:
+                driver = self.llm_drivers[car.name]
+                
+                # Calculate gaps (considering laps)
+                gap_ahead = 100  # Default
+                gap_behind = 100
+                
+                # Sort cars by actual race position for correct gap calculation
+                cars_by_position = sorted(self.cars, 
+                    key=lambda c: -(laps_completed.get(c.name, 0) + positions.get(c.name, 0)))
+                car_index = cars_by_position.index(car)
+                
+                if car_index > 0:
+                    ahead_car = cars_by_position[car_index - 1]
+                    # Calculate distance considering laps
+                    ahead_total = laps_completed.get(ahead_car.name, 0) + positions.get(ahead_car.name, 0)
+                    car_total = laps_completed.get(car.name, 0) + positions.get(car.name, 0)
+                    gap_ahead = (ahead_total - car_total) * self.track.total_length * 1000
+                
+                if car_index < len(cars_by_position) - 1:
+                    behind_car = cars_by_position[car_index + 1]
+                    car_total = laps_completed.get(car.name, 0) + positions.get(car.name, 0)
+                    behind_total = laps_completed.get(behind_car.name, 0) + positions.get(behind_car.name, 0)
+                    gap_behind = (car_total - behind_total) * self.track.total_length * 1000
+                
+                # Prepare enhanced race state with power-ups and collision info
+                try:
+                    collision_risk = self.collision_detector.get_collision_risk(
+                        car.name, car_positions_for_collision, car_speeds_for_collision, 
+                        "straight" if i % 2 == 0 else "corner"
+                    )
+                    if collision_risk is None:
+                        collision_risk = {"risk_level": "none", "risk_factor": 0.0}
+                except Exception as e:
+                    print(f"⚠️ Collision risk error for {car.name}: {e}")
+                    collision_risk = {"risk_level": "none", "risk_factor": 0.0}
+                
+                # Get weapon information
+                power_ups, ammo_remaining, can_fire = self._decision_inputs(car.name, now)
+                target_ahead = cars_ahead.get(car.name)
+                
+                race_state = {
+                    "total_cars": len(self.cars),
+                    "current_lap": current_lap,
+                    "total_laps": self.laps,
+                    "gap_ahead": gap_ahead,
+                    "gap_behind": gap_behind,
+                    "track_segment": "straight" if i % 2 == 0 else "corner",
+                    "weather": self.weather,
+                    "power_ups": power_ups,
+                    "collision_risk": collision_risk,
+                    "power_up_strategy": self._safe_analyze_powerup_strategy(
+                        car, gap_ahead, gap_behind
+                    ),
+                    "ammo_remaining": ammo_remaining,
+                    "can_fire": can_fire,
+                    "target_ahead": target_ahead[0] if target_ahead else None,
+                    "target_distance": target_ahead[1] * self.track.total_length * 1000 if target_ahead else 999
+                }
+                
+                # Debug weapon info (only for the cars' actual positions)
+                if not predicted and target_ahead and can_fire and ammo_remaining > 0:
+                    target_distance_m = target_ahead[1] * self.track.total_length * 1000
+                    if target_distance_m <= 200:
+                        print(f"🎯 {car.name} SHOULD FIRE at {target_ahead[0]} ({target_distance_m:.0f}m away) - Ammo: {ammo_remaining}")
+                
+                decision_requests.append((car.name, driver, race_state))
+        return decision_requests
+        
+    def _predict_positions(self, positions: Dict[str, float], laps_completed: Dict[str, int],
+                           seconds: float) -> tuple:
+        """Advance every car at its current speed to guess positions a while ahead"""
+        track_m = self.track.total_length * 1000
+        predicted_positions = {}
+        predicted_laps = dict(laps_completed)
+        for car in self.cars:
+            progress = positions[car.name] + track_progress(car.current_speed, seconds, track_m)
+            predicted_laps[car.name] += int(progress)
+            predicted_positions[car.name] = progress % 1.0
+        return predicted_positions, predicted_laps
+    
+    def _speculation_hit(self, predicted: tuple, requests: List[tuple], positions: Dict[str, float],
+                         laps_completed: Dict[str, int]) -> bool:
+        """Whether a shadow batch still fits: cars near their predicted positions and
+        every car's inventory, ammo and fire readiness unchanged since it was built"""
+        if self._prediction_error(predicted, positions, laps_completed) > self.SPECULATION_TOLERANCE:
+            return False
+        now = time.time()
+        return all(
+            (race_state["power_ups"], race_state["ammo_remaining"], race_state["can_fire"]) ==
+            self._decision_inputs(car_name, now)
+            for car_name, _, race_state in requests
+        )
+    
+    @staticmethod
+    def _prediction_error(predicted: tuple, positions: Dict[str, float],
+                          laps_completed: Dict[str, int]) -> float:
+        """Largest gap (in track fractions) between predicted and actual car progress"""
+        predicted_positions, predicted_laps = predicted
+        return max(
+            (abs((predicted_laps[name] + predicted_positions[name]) -
+                 (laps_completed[name] + positions[name])) for name in positions),
+            default=0.0
+        )
+    
+    def _record_speculation(self, hit: bool):
+        """Track shadow-batch accuracy and stop speculating if it rarely pays off"""
+        if hit:
+            self.speculation_hits += 1
+        else:
+            self.speculation_misses += 1
+        attempts = self.speculation_hits + self.speculation_misses
+        if (attempts >= self.SPECULATION_WARMUP_TICKS and
+                self.speculation_hits < attempts * self.SPECULATION_MIN_HIT_RATE):
+            self.speculate = False
+            print(f"⚠️ Speculative decisions disabled ({self.speculation_hits}/{attempts} hits)")
+    
+    async def _gather_decisions(self, requests: List[tuple]) -> Dict[str, tuple]:
+        """Run one tick's worth of driver decisions concurrently.
+        
+        Each car maps to a proposed (decision, outcome) pair (or the exception
+        raised); nothing is recorded in the drivers' stats until the batch is
+        consumed, so a discarded speculative batch leaves no trace.
+        """
+        results = await asyncio.gather(
+            *[driver.propose_decision(race_state) for _, driver, race_state in requests],
+            return_exceptions=True
+        )
+        return {car_name: result for (car_name, _, _), result in zip(requests, results)}
+        
     def simulate_race(self) -> Dict:
         """Run race simulation with LLM decision making"""
         if not self.enable_graphics or not self.renderer:
@@ -81,7 +257,6 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
                     # If loop is running, create a task
-                    import concurrent.futures
                     with concurrent.futures.ThreadPoolExecutor() as executor:
                         future = executor.submit(self._run_async_race)
                         return future.result()
@@ -103,6 +278,8 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
         # Initialize race
         for car in self.cars:
             car.reset_for_race()
+        for driver in self.llm_drivers.values():
+            driver.reset_stats()
             
         race_log = []
         lap_times = {}
@@ -121,137 +298,96 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
         laps_completed = {car.name: 0 for car in self.cars}  # Track laps per car
         decision_counter = 0  # Only make LLM decisions every few frames
         
-        # Create futures for async LLM calls
-        import concurrent.futures
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
-        pending_futures = {}  # Track pending LLM decisions
+        # One long-lived event loop for LLM calls, so pooled HTTP connections
+        # survive from tick to tick
+        llm_loop = asyncio.new_event_loop()
+        llm_thread = threading.Thread(target=llm_loop.run_forever, daemon=True)
+        llm_thread.start()
+        # Warm the models in the background while the first frames render
+        asyncio.run_coroutine_threadsafe(warm_up_drivers(list(self.llm_drivers.values())), llm_loop)
+        pending_batch = None  # All cars' LLM decisions for the current tick
+        
+        # Constant for the whole race
+        track_m = self.track.total_length * 1000
+        weather_factor = 0.9 if self.weather == "rain" else 1.0
+        shadow_batch = None  # (predicted positions, decisions) for the next tick
         
         while current_lap <= self.laps and self.renderer.is_running():
             # Get LLM decisions only every 30 frames (0.5 second intervals at 60 FPS)
             decision_counter += 1
-            if decision_counter >= 30:  # Make decisions every 0.5 seconds
+            if decision_counter >= self.DECISION_INTERVAL and pending_batch is None:  # Make decisions every 0.5 seconds
                 decision_counter = 0
                 
-                for i, car in enumerate(self.cars):
-                    if not getattr(car, 'has_mechanical_failure', False) and car.fuel_level > 0:
-                        driver = self.llm_drivers[car.name]
-                        
-                        # Calculate gaps (considering laps)
-                        gap_ahead = 100  # Default
-                        gap_behind = 100
-                        
-                        # Sort cars by actual race position for correct gap calculation
-                        cars_by_position = sorted(self.cars, 
-                            key=lambda c: -(laps_completed.get(c.name, 0) + positions.get(c.name, 0)))
-                        car_index = cars_by_position.index(car)
-                        
-                        if car_index > 0:
-                            ahead_car = cars_by_position[car_index - 1]
-                            # Calculate distance considering laps
-                            ahead_total = laps_completed.get(ahead_car.name, 0) + positions.get(ahead_car.name, 0)
-                            car_total = laps_completed.get(car.name, 0) + positions.get(car.name, 0)
-                            gap_ahead = (ahead_total - car_total) * self.track.total_length * 1000
-                        
-                        if car_index < len(cars_by_position) - 1:
-                            behind_car = cars_by_position[car_index + 1]
-                            car_total = laps_completed.get(car.name, 0) + positions.get(car.name, 0)
-                            behind_total = laps_completed.get(behind_car.name, 0) + positions.get(behind_car.name, 0)
-                            gap_behind = (car_total - behind_total) * self.track.total_length * 1000
-                        
-                        # Prepare enhanced race state with power-ups and collision info
-                        car_positions_for_collision = {c.name: positions[c.name] for c in self.cars}
-                        car_speeds_for_collision = {c.name: c.current_speed for c in self.cars}
-                        
-                        try:
-                            collision_risk = self.collision_detector.get_collision_risk(
-                                car.name, car_positions_for_collision, car_speeds_for_collision, 
-                                "straight" if i % 2 == 0 else "corner"
-                            )
-                            if collision_risk is None:
-                                collision_risk = {"risk_level": "none", "risk_factor": 0.0}
-                        except Exception as e:
-                            print(f"⚠️ Collision risk error for {car.name}: {e}")
-                            collision_risk = {"risk_level": "none", "risk_factor": 0.0}
-                        
-                        # Get weapon information
-                        ammo_remaining = self.weapons_manager.get_ammo_status(car.name)
-                        target_ahead = self.weapons_manager.get_car_ahead(
-                            car.name, positions, laps_completed
-                        )
-                        can_fire = self.weapons_manager.car_weapons[car.name].can_fire(
-                            time.time()
-                        ) if car.name in self.weapons_manager.car_weapons else False
-                        
-                        race_state = {
-                            "total_cars": len(self.cars),
-                            "current_lap": current_lap,
-                            "total_laps": self.laps,
-                            "gap_ahead": gap_ahead,
-                            "gap_behind": gap_behind,
-                            "track_segment": "straight" if i % 2 == 0 else "corner",
-                            "weather": self.weather,
-                            "power_ups": self.powerup_manager.get_inventory_status(car.name),
-                            "collision_risk": collision_risk,
-                            "power_up_strategy": self._safe_analyze_powerup_strategy(
-                                car, gap_ahead, gap_behind
-                            ),
-                            "ammo_remaining": ammo_remaining,
-                            "can_fire": can_fire,
-                            "target_ahead": target_ahead[0] if target_ahead else None,
-                            "target_distance": target_ahead[1] * self.track.total_length * 1000 if target_ahead else 999
-                        }
-                        
-                        # Debug weapon info
-                        if target_ahead and can_fire and ammo_remaining > 0:
-                            target_distance_m = target_ahead[1] * self.track.total_length * 1000
-                            if target_distance_m <= 200:
-                                print(f"🎯 {car.name} SHOULD FIRE at {target_ahead[0]} ({target_distance_m:.0f}m away) - Ammo: {ammo_remaining}")
-                        
-                        # Submit LLM decision request (non-blocking)
-                        if car.name not in pending_futures:
-                            future = executor.submit(
-                                asyncio.run, 
-                                driver.make_decision(race_state)
-                            )
-                            pending_futures[car.name] = future
+                # Use the speculative batch if the cars ended up where we predicted
+                if shadow_batch is not None:
+                    predicted, shadow_requests, shadow_future = shadow_batch
+                    shadow_batch = None
+                    hit = self._speculation_hit(predicted, shadow_requests, positions, laps_completed)
+                    self._record_speculation(hit)
+                    if hit:
+                        pending_batch = shadow_future
+                    else:
+                        shadow_future.cancel()
+                
+                decision_requests = []
+                if pending_batch is None:
+                    decision_requests = self._build_decision_requests(positions, laps_completed, current_lap)
+                
+                # Submit every car's LLM decision as one concurrent batch (non-blocking)
+                if decision_requests:
+                    pending_batch = asyncio.run_coroutine_threadsafe(
+                        self._gather_decisions(decision_requests), llm_loop
+                    )
             
             # Check for completed LLM decisions (non-blocking)
-            completed_futures = []
-            for car_name, future in pending_futures.items():
-                if future.done():
-                    try:
-                        decision = future.result()
-                        # Ensure decision is valid
-                        if decision is None:
-                            decision = {"action": "WAIT", "confidence": 0.5, "reasoning": "None response"}
-                        elif not isinstance(decision, dict):
-                            decision = {"action": "WAIT", "confidence": 0.5, "reasoning": "Invalid response type"}
-                        elif "action" not in decision:
-                            decision["action"] = "WAIT"
-                        elif decision["action"] is None:
-                            decision["action"] = "WAIT"
-                        
-                        if 'decisions' not in locals():
-                            decisions = {}
-                        decisions[car_name] = decision
-                        completed_futures.append(car_name)
-                    except Exception as e:
-                        print(f"🚨 Error with {car_name}: {e}")
-                        if 'decisions' not in locals():
-                            decisions = {}
-                        decisions[car_name] = {"action": "WAIT", "confidence": 0.3, "reasoning": f"Error: {str(e)[:20]}"}
-                        completed_futures.append(car_name)
-            
-            # Remove completed futures
-            for car_name in completed_futures:
-                del pending_futures[car_name]
+            if pending_batch is not None and pending_batch.done():
+                try:
+                    batch_results = pending_batch.result()
+                except Exception as e:
+                    print(f"🚨 Decision batch error: {e}")
+                    batch_results = {}
+                pending_batch = None
+                
+                if 'decisions' not in locals():
+                    decisions = {}
+                for car_name, decision in batch_results.items():
+                    # The batch is being used: record each proposed decision
+                    if isinstance(decision, tuple):
+                        decision, outcome = decision
+                        self.llm_drivers[car_name].commit_decision(decision, outcome)
+                    # Ensure decision is valid
+                    if isinstance(decision, Exception):
+                        print(f"🚨 Error with {car_name}: {decision}")
+                        decision = {"action": "WAIT", "confidence": 0.3, "reasoning": f"Error: {str(decision)[:20]}"}
+                    elif decision is None:
+                        decision = {"action": "WAIT", "confidence": 0.5, "reasoning": "None response"}
+                    elif not isinstance(decision, dict):
+                        decision = {"action": "WAIT", "confidence": 0.5, "reasoning": "Invalid response type"}
+                    elif "action" not in decision:
+                        decision["action"] = "WAIT"
+                    elif decision["action"] is None:
+                        decision["action"] = "WAIT"
+                    decisions[car_name] = decision
+                
+                # Start the next tick's decisions now, from predicted positions,
+                # so the LLM round-trip overlaps the frames rendered until then
+                frames_ahead = self.DECISION_INTERVAL - decision_counter
+                if self.speculate and frames_ahead > 0:
+                    predicted = self._predict_positions(positions, laps_completed, frames_ahead * time_step)
+                    shadow_requests = self._build_decision_requests(*predicted, current_lap, predicted=True)
+                    if shadow_requests:
+                        shadow_batch = (predicted, shadow_requests, asyncio.run_coroutine_threadsafe(
+                            self._gather_decisions(shadow_requests), llm_loop
+                        ))
             
             # Initialize decisions if not set
             if 'decisions' not in locals():
                 decisions = {car.name: {"action": "WAIT", "confidence": 0.5, "reasoning": "Starting"} for car in self.cars}
             
-            # Check for collisions before moving cars
+            # Frame-start snapshot: collisions and weapon targeting read it, so
+            # each car's update below is independent of the order cars are stepped
             car_positions_for_collision = {c.name: positions[c.name] for c in self.cars}
+            laps_at_frame_start = dict(laps_completed)
             car_speeds_for_collision = {c.name: c.current_speed for c in self.cars}
             track_section = "corner" if decision_counter % 3 == 0 else "straight"
             
@@ -324,14 +460,14 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                         if self.weapons_manager.attempt_fire(car.name, time.time()):
                             # Find target ahead
                             target_info = self.weapons_manager.get_car_ahead(
-                                car.name, positions, laps_completed
+                                car.name, car_positions_for_collision, laps_at_frame_start
                             )
                             if target_info:
                                 target_name, distance = target_info
                                 # Check if hit
                                 hit = self.weapons_manager.check_hit(
-                                    car.name, positions[car.name],
-                                    target_name, positions[target_name],
+                                    car.name, car_positions_for_collision[car.name],
+                                    target_name, car_positions_for_collision[target_name],
                                     True  # is_target_ahead
                                 )
                                 if hit:
@@ -346,7 +482,6 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                     # Apply action - let LLMs be creative!
                     # Use average of top speed and corner speed for a balanced base speed
                     base_speed = (car.top_speed + car.calculate_corner_speed(30)) / 2
-                    weather_factor = 0.9 if self.weather == "rain" else 1.0
                     
                     # Apply power-up speed modifiers
                     power_up_modifier = self.powerup_manager.get_speed_modifier(car.name)
@@ -368,11 +503,7 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                     car.current_speed = actual_speed
                     
                     # Update position
-                    # Convert km/h to m/s, then calculate distance in meters
-                    speed_ms = actual_speed / 3.6  # km/h to m/s
-                    distance = speed_ms * time_step  # meters traveled
-                    progress = distance / (self.track.total_length * 1000)  # track length is in km
-                    positions[car.name] += progress
+                    positions[car.name] += track_progress(actual_speed, time_step, track_m)
                     
                     # Check for power-up pickup collection
                     if hasattr(self, 'powerup_manager'):
@@ -397,7 +528,9 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                                 "details": f"Passed position {i+1} to {i}"
                             }
                             try:
-                                reaction_future = executor.submit(asyncio.run, driver.react_to_event(event))
+                                reaction_future = asyncio.run_coroutine_threadsafe(
+                                    driver.react_to_event(event), llm_loop
+                                )
                                 reaction = reaction_future.result(timeout=0.5)
                                 print(f"💬 {driver.name}: \"{reaction}\"")
                             except Exception:
@@ -458,7 +591,7 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
             time.sleep(0.016)  # 60 FPS target
             
         # Clean up
-        executor.shutdown(wait=True)
+        self._stop_llm_loop(llm_loop, llm_thread, pending_batch, shadow_batch)
         if self.renderer:
             self.renderer.cleanup()
             
@@ -469,7 +602,6 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
             return results
         except Exception as e:
             print(f"🚨 Error generating results: {e}")
-            import traceback
             traceback.print_exc()
             # Return minimal results
             return {
@@ -478,6 +610,22 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                 "error": str(e)
             }
     
+    @staticmethod
+    def _stop_llm_loop(llm_loop, llm_thread: threading.Thread,
+                       pending_batch, shadow_batch: Optional[tuple]):
+        """Cancel in-flight decision batches, close the pooled client and stop the LLM loop"""
+        if pending_batch is not None:
+            pending_batch.cancel()
+        if shadow_batch is not None:
+            _, _, shadow_future = shadow_batch
+            shadow_future.cancel()
+        try:
+            asyncio.run_coroutine_threadsafe(close_http_client(), llm_loop).result(timeout=5)
+        except Exception:
+            pass  # The loop is going away either way
+        llm_loop.call_soon_threadsafe(llm_loop.stop)
+        llm_thread.join(timeout=5)
+    
     def _run_async_race(self) -> Dict:
         """Helper to run async race in a new event loop"""
         return asyncio.run(self.simulate_race_async())
@@ -489,6 +637,8 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
         # Initialize
         for car in self.cars:
             car.reset_for_race()
+        for driver in self.llm_drivers.values():
+            driver.reset_stats()
             
         lap_times = {}
         positions = {}
@@ -497,6 +647,8 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                 lap_times[car.name] = []
                 positions[car.name] = 0.0
         
+        await warm_up_drivers(list(self.llm_drivers.values()))
+        
         for lap in range(1, self.laps + 1):
             print(f"\n📍 LAP {lap}/{self.laps}")
             
@@ -534,6 +686,7 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
                         
                     lap_times[car.name].append(base_time)
             
+        await close_http_client()
         return self._generate_results(lap_times)
     
     def _generate_results(self, lap_times: Dict[str, List[float]]) -> Dict:
@@ -574,6 +727,7 @@ class LLMRaceSimulator(GraphicalRaceSimulator):
             stats[name] = {
                 "model": driver.model_config["model"],
                 "decisions": driver.decisions_made,
+                "rule_shortcuts": driver.ai.shortcut_decisions,
                 "avg_confidence": driver.average_confidence,
                 "actions": {
                     "attacks": sum(1 for _ in range(driver.decisions_made) if driver.last_action == LLMAction.ATTACK),
@@ -9,7 +9,7 @@ from enum import Enum
 
 from ..core.racing_car import RacingCar, DriverStyle
 from ..core.race_track import TrackSegment
-from ai_config import RacingAI, LLAMA_MODELS
+from ai_config import RacingAI, LLAMA_MODELS, warm_up_models, close_http_client
 
 
 class LLMAction(Enum):
@@ -52,8 +52,28 @@ class LLMDriver:
         """Initialize the AI connection"""
         self.personality = self.model_config["personality"]
         
+    def reset_stats(self):
+        """Clear per-race decision stats so a driver can be reused for another race"""
+        self.decisions_made = 0
+        self.successful_overtakes = 0
+        self.failed_overtakes = 0
+        self.average_confidence = 0.0
+        self.last_action = None
+        self.last_reasoning = ""
+        self.ai.reset_stats()
+    
     async def make_decision(self, race_state: dict) -> dict:
         """Make a racing decision using the LLM with comprehensive telemetry"""
+        decision, outcome = await self.propose_decision(race_state)
+        self.commit_decision(decision, outcome)
+        return decision
+    
+    async def propose_decision(self, race_state: dict):
+        """Decide like make_decision without touching this driver's stats.
+        
+        Returns (decision, outcome); call commit_decision() with both once the
+        decision is actually used.
+        """
         
         # Calculate laps remaining
         current_lap = race_state.get("current_lap", 1)
@@ -106,7 +126,7 @@ class LLMDriver:
         }
         
         # Get AI decision with comprehensive data
-        decision = await self.ai.make_racing_decision(comprehensive_state, self.personality)
+        decision, outcome = await self.ai.propose_racing_decision(comprehensive_state, self.personality)
         
         # Handle power-up usage if requested
         if decision.get("use_powerup", False) and race_state.get("power_ups"):
@@ -114,6 +134,19 @@ class LLMDriver:
         else:
             decision["powerup_used"] = False
         
+        # Let LLMs use natural language, but fall back to WAIT on anything
+        # that isn't a valid action
+        try:
+            LLMAction(decision.get("action", "WAIT").upper())
+        except ValueError:
+            decision["action"] = "WAIT"
+        
+        return decision, outcome
+    
+    def commit_decision(self, decision: dict, outcome=None):
+        """Record a proposed decision in the AI caches and this driver's stats"""
+        self.ai.commit_decision(outcome)
+        
         # Track performance
         self.decisions_made += 1
         self.average_confidence = (
@@ -121,18 +154,9 @@ class LLMDriver:
             / self.decisions_made
         )
         
-        # Store last action - let LLMs use natural language!
-        try:
-            action_str = decision.get("action", "WAIT").upper()
-            self.last_action = LLMAction(action_str)
-        except ValueError:
-            # If it's not a valid action, default to WAIT
-            self.last_action = LLMAction.WAIT
-            decision["action"] = "WAIT"
-            
+        # Store last action (already validated by propose_decision)
+        self.last_action = LLMAction(decision.get("action", "WAIT").upper())
         self.last_reasoning = decision.get("reasoning", "")
-        
-        return decision
     
     async def react_to_event(self, event: dict) -> str:
         """Generate a reaction to a race event"""
@@ -220,7 +244,7 @@ def create_llm_drivers() -> List[LLMDriver]:
         fuel_efficiency=9,
         driver_style=DriverStyle.AGGRESSIVE
     )
-    speed_ai = RacingAI(LLAMA_MODELS["speed"]["model"])
+    speed_ai = RacingAI(LLAMA_MODELS["speed"]["model"], LLAMA_MODELS["speed"]["personality"])
     drivers.append(LLMDriver(
         car=speed_car,
         ai=speed_ai,
@@ -237,7 +261,7 @@ def create_llm_drivers() -> List[LLMDriver]:
         fuel_efficiency=16,
         driver_style=DriverStyle.BALANCED
     )
-    strategic_ai = RacingAI(LLAMA_MODELS["strategic"]["model"])
+    strategic_ai = RacingAI(LLAMA_MODELS["strategic"]["model"], LLAMA_MODELS["strategic"]["personality"])
     drivers.append(LLMDriver(
         car=strategic_car,
         ai=strategic_ai,
@@ -254,7 +278,7 @@ def create_llm_drivers() -> List[LLMDriver]:
         fuel_efficiency=13,
         driver_style=DriverStyle.BALANCED
     )
-    balanced_ai = RacingAI(LLAMA_MODELS["balanced"]["model"])
+    balanced_ai = RacingAI(LLAMA_MODELS["balanced"]["model"], LLAMA_MODELS["balanced"]["personality"])
     drivers.append(LLMDriver(
         car=balanced_car,
         ai=balanced_ai,
@@ -271,7 +295,7 @@ def create_llm_drivers() -> List[LLMDriver]:
         fuel_efficiency=11,
         driver_style=DriverStyle.CHAOTIC
     )
-    chaotic_ai = RacingAI(LLAMA_MODELS["chaotic"]["model"])
+    chaotic_ai = RacingAI(LLAMA_MODELS["chaotic"]["model"], LLAMA_MODELS["chaotic"]["personality"])
     drivers.append(LLMDriver(
         car=chaotic_car,
         ai=chaotic_ai,
@@ -288,7 +312,7 @@ def create_llm_drivers() -> List[LLMDriver]:
         fuel_efficiency=14,
         driver_style=DriverStyle.TECHNICAL
     )
-    technical_ai = RacingAI(LLAMA_MODELS["technical"]["model"])
+    technical_ai = RacingAI(LLAMA_MODELS["technical"]["model"], LLAMA_MODELS["technical"]["personality"])
     drivers.append(LLMDriver(
         car=technical_car,
         ai=technical_ai,
@@ -296,4 +320,22 @@ def create_llm_drivers() -> List[LLMDriver]:
         name="Qwen Technical"
     ))
     
-    return drivers
\ No newline at end of file
+    return drivers
+
+
+async def warm_up_drivers(drivers: List[LLMDriver]):
+    """Warm every model used by the drivers at once (shared models only once)"""
+    await warm_up_models([model for driver in drivers for model in driver.ai.model_names()])
+
+
+def share_model_backends(drivers: List[LLMDriver]) -> Dict[str, RacingAI]:
+    """Point drivers that use the same model at a single RacingAI backend.
+    
+    Their per-tick requests then go out together through one connector and
+    connection pool, where the server's continuous batching can serve them
+    in the same forward pass, and they share the decision caches.
+    """
+    backends = {}
+    for driver in drivers:
+        driver.ai = backends.setdefault(driver.model_config["model"], driver.ai)
+    return backends
@@ -139,6 +139,18 @@ def test_tactical_decisions():
     if "intelligence_metrics" in results:
         for car_name, metrics in results["intelligence_metrics"].items():
             print(f"  {car_name}: {metrics['strategy']} strategy")
+    
+    # A successful overtake moves the overtaker in the step's distance column
+    # too, so the rest of the step's gap checks see it ahead of its target
+    leader, attacker, defender = intel_sim.cars
+    leader.distance_traveled, attacker.distance_traveled, defender.distance_traveled = 500.0, 100.0, 90.0
+    for car in intel_sim.cars:
+        car.current_speed = 200.0
+    intel_sim._refresh_car_state()
+    intel_sim._execute_overtake(attacker, "Leader")
+    assert attacker.distance_traveled == 505.0
+    assert intel_sim.car_distances == [500.0, 505.0, 90.0]
+    assert intel_sim._find_nearby_competitors(attacker, 1.0) == ["Leader"]
 
 
 def test_psychological_warfare():
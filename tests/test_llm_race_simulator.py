@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test file for the LLM race simulator's decision-batch plumbing
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+# The simulator pulls in the graphics and LLM stacks
+pytest.importorskip("pygame")
+pytest.importorskip("dotenv")
+pytest.importorskip("nexus")
+
+from src.llm_drivers.llm_race_simulator import LLMRaceSimulator
+
+
+def test_race_ends_with_pending_shadow_batch():
+    """Ending a race while a speculative batch is in flight shuts everything down"""
+    llm_loop = asyncio.new_event_loop()
+    llm_thread = threading.Thread(target=llm_loop.run_forever, daemon=True)
+    llm_thread.start()
+
+    # A batch that never finishes on its own, like an LLM round-trip in flight
+    pending_batch = asyncio.run_coroutine_threadsafe(asyncio.sleep(3600), llm_loop)
+    shadow_future = asyncio.run_coroutine_threadsafe(asyncio.sleep(3600), llm_loop)
+    shadow_batch = (({}, {}), [], shadow_future)
+
+    LLMRaceSimulator._stop_llm_loop(llm_loop, llm_thread, pending_batch, shadow_batch)
+
+    assert pending_batch.cancelled()
+    assert shadow_future.cancelled()
+    assert not llm_thread.is_alive()
+    llm_loop.close()
@@ -4,7 +4,9 @@ Test file for the AI Racing Simulator
 Demonstrates all core functionality from Phase 1
 """
 
-from src.core.racing_car import RacingCar, DriverStyle
+import random
+
+from src.core.racing_car import RacingCar, DriverStyle, CarFleet
 from src.core.race_track import RaceTrack, TrackType
 from src.core.race_simulator import RaceSimulator
 
@@ -78,6 +80,43 @@ def test_car_creation():
         print(f"    Speed Bonus: {(mods['speed_bonus']-1)*100:+.0f}%")
         print(f"    Handling: {(mods['handling_penalty']-1)*100:+.0f}%")
         print(f"    Risk Factor: {mods['risk_factor']}")
+    
+    # Stepping the field as a fleet matches stepping each car
+    fleet = CarFleet(create_ai_racers())
+    for _ in range(50):
+        fleet.step([250.0] * len(fleet), 0.1, [1.3] * len(fleet), [2.0] * len(fleet))
+    fleet.write_back()
+    for _ in range(50):
+        for car in racers:
+            car.step(250.0, 0.1, 1.3, 2.0)
+    for fleet_car, car in zip(fleet.cars, racers):
+        assert fleet_car.current_speed == car.current_speed
+        assert fleet_car.fuel_level == car.fuel_level
+        assert fleet_car.tire_wear == car.tire_wear
+        assert fleet_car.distance_traveled == car.distance_traveled
+    
+    # Fleet lap estimates match the track's whole-lap helper per car
+    track = RaceTrack.create_mixed_track()
+    assert fleet.estimate_lap_times(track, 50.0) == [
+        track.calculate_lap_time(50.0, track.get_optimal_speeds(car.get_effective_handling()),
+                                 car.get_effective_acceleration())
+        for car in racers
+    ]
+
+    # Reassigning a base stat or the style refolds the cached style stats
+    car = create_ai_racers()[0]
+    car.top_speed = 300
+    car.handling = 0.9
+    car.fuel_efficiency = 12.0
+    car.driver_style = DriverStyle.CONSERVATIVE
+    fresh = RacingCar("Fresh", 300, car.acceleration, 0.9, 12.0, DriverStyle.CONSERVATIVE)
+    assert car.get_style_factors() == fresh.get_style_factors()
+    assert car.get_effective_top_speed() == fresh.get_effective_top_speed()
+    assert car.get_effective_handling() == fresh.get_effective_handling()
+    assert car.get_effective_acceleration() == fresh.get_effective_acceleration()
+    car.step(250.0, 0.1, 1.3, 2.0)
+    fresh.step(250.0, 0.1, 1.3, 2.0)
+    assert (car.fuel_level, car.tire_wear) == (fresh.fuel_level, fresh.tire_wear)
 
 
 def test_track_creation():
@@ -111,6 +150,29 @@ def test_track_creation():
         print(f"    Speed: {chars['speed_importance']*100:.0f}%")
         print(f"    Handling: {chars['handling_importance']*100:.0f}%")
         print(f"    Fuel: {chars['fuel_importance']*100:.0f}%")
+    
+    # Presets share one cached layout but every call returns its own track
+    wet_track = RaceTrack.create_mixed_track()
+    wet_track.weather_conditions = "rain"
+    assert RaceTrack.create_mixed_track().weather_conditions == "clear"
+    assert wet_track.clone().segments is not wet_track.segments
+    
+    # Segment columns round-trip through the array constructor
+    rebuilt = RaceTrack.from_arrays(
+        wet_track.name, wet_track.track_type, wet_track.segment_lengths,
+        wet_track.segment_is_straight, wet_track.segment_corner_angles,
+        wet_track.segment_corner_radii, wet_track.segment_elevation_changes
+    )
+    assert rebuilt.segments == wet_track.segments
+    
+    # Whole-lap helpers agree with the per-segment ones
+    optimal_speeds = wet_track.get_optimal_speeds(0.8)
+    assert optimal_speeds == tuple(segment.get_optimal_speed(0.8) for segment in wet_track.segments)
+    lap_time, speed = 0.0, 50.0
+    for segment, target_speed in zip(wet_track.segments, optimal_speeds):
+        segment_time, speed = wet_track.calculate_segment_time(segment, speed, target_speed, 3.0)
+        lap_time += segment_time
+    assert wet_track.calculate_lap_time(50.0, optimal_speeds, 3.0) == (lap_time, speed)
 
 
 def test_quick_race():
@@ -129,6 +191,28 @@ def test_quick_race():
     
     # Print summary
     simulator.print_race_summary(results)
+    
+    # A seeded generator makes the race repeatable
+    replays = [
+        RaceSimulator(track, create_ai_racers(), laps=3, enable_telemetry=False,
+                      rng=random.Random(7)).simulate_race()
+        for _ in range(2)
+    ]
+    assert replays[0]["positions"] == replays[1]["positions"]
+    assert replays[0]["total_time"] == replays[1]["total_time"]
+    
+    # Reassigning a car's style mid-race switches its speed policy
+    simulator = RaceSimulator(track, create_ai_racers(), laps=1, enable_telemetry=False)
+    car = simulator.cars[0]
+    corner = next(segment for segment in track.segments if not segment.is_straight)
+    assert simulator._apply_driver_style_decision(car, 200.0, corner) != 200.0 * 0.92
+    car.driver_style = DriverStyle.CONSERVATIVE
+    assert simulator._apply_driver_style_decision(car, 200.0, corner) == 200.0 * 0.92
+    
+    # A zero-lap race still ends once every car completes its first lap
+    zero_lap = RaceSimulator(track, create_ai_racers(), laps=0, enable_telemetry=False,
+                             rng=random.Random(7)).simulate_race()
+    assert all(len(times) == 1 for times in zero_lap["lap_times"].values())
 
 
 def test_different_tracks():